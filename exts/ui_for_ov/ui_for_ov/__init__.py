@@ -1 +1,8 @@
-from .extension import *
+# The sizing engine (engine, data, ...) is plain Python and usable outside of Kit; the extension
+# itself needs omni, so only pull it in when running inside Kit.
+try:
+    import omni.ext  # noqa: F401
+except ImportError:
+    pass
+else:
+    from .extension import *
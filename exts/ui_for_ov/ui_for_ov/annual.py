@@ -0,0 +1,166 @@
+"""Annual (8760 hour) energy and PUE simulation of a design at one or many sites.
+
+:func:`simulate` takes hourly dry bulb / wet bulb series and evaluates every hour at once with NumPy:
+
+* Chillers: the air loop's heat (Q AC) is always rejected by the chiller at TWOUT = FWS air temperature;
+  the liquid loop's heat only in hours its economizer is unavailable, at TWOUT = FWS liquid temperature.
+  Chiller power is the load's share of the interpolated capacity times the interpolated Power Input at
+  the hour's dry bulb (:class:`ui_for_ov.chillers.ChillerSurface`).
+* Economizer availability follows the liquid cooling option rules: a dry cooler while
+  FWS liquid - 5 >= dry bulb, a closed loop cooling tower while FWS liquid - 3 >= wet bulb.
+* CRAH fans (affinity law of :func:`ui_for_ov.engine.calculate_crah_rpm_and_power`) and CDU pumps
+  (:func:`ui_for_ov.engine.calculate_cdu_pump_power`) run at the design flow, so their power is the same
+  every hour.
+
+Series may carry leading axes, e.g. ``(stations, 8760)``, to simulate many sites in one call; see
+:func:`rank_sites`. :func:`simulate_store` and :func:`rank_store` stream the stations of a
+:class:`ui_for_ov.weather.WeatherStore`.
+"""
+import numpy as np
+
+from . import engine
+
+HOURS_PER_YEAR = 8760
+ECONOMIZERS = ("dry_cooler", "cooling_tower")
+
+# Annual totals returned by simulate, per site
+ANNUAL_FIELDS = (
+    "it_kwh",
+    "chiller_kwh",
+    "crah_kwh",
+    "cdu_pump_kwh",
+    "pods_without_pump_power",
+    "cooling_kwh",
+    "total_kwh",
+    "pue",
+    "economizer_hours",
+)
+
+
+def simulate(scenario, dry_bulb, wet_bulb, chillers, economizer="dry_cooler", model=engine.CHILLER_MODEL,
+             hourly=False):
+    """Simulate a design over hourly weather series.
+
+    Args:
+        scenario: :class:`ui_for_ov.engine.Scenario`; its ``city`` is ignored.
+        dry_bulb, wet_bulb: Hourly temperatures (°C), broadcast against each other. The last axis is the
+            hour; leading axes are sites.
+        chillers: :class:`ui_for_ov.chillers.ChillerTable`.
+        economizer: Liquid loop heat rejection that runs without the chiller, one of :data:`ECONOMIZERS`.
+        model: Chiller model.
+        hourly: Also return the hourly power series.
+
+    Returns:
+        dict of :data:`ANNUAL_FIELDS` -> array over the leading axes (a 0-d array for a single series).
+        Energies are kWh over the series, which need not be a whole year. With ``hourly``, also
+        ``economizer_available``, ``chiller_kw`` and ``cooling_kw`` per hour. When the CDU pumps have no
+        operating point their energy is left out of ``cdu_pump_kwh`` and the totals, and the pods are
+        counted in ``pods_without_pump_power``.
+    """
+    if economizer not in ECONOMIZERS:
+        raise ValueError(f"Unknown economizer '{economizer}', expected one of {ECONOMIZERS}")
+    surface = chillers.surface(model)
+    if surface is None:
+        raise ValueError(f"Unknown chiller model '{model}'")
+    dry_bulb, wet_bulb = np.broadcast_arrays(
+        np.asarray(dry_bulb, dtype=np.float64), np.asarray(wet_bulb, dtype=np.float64)
+    )
+
+    design = engine.evaluate(scenario._replace(city=None))
+    it_kw = design["total_power"]
+    air_load_kw = design["q_ac_per_pod"] * scenario.num_pods
+    # With Liquid to Air CDUs the liquid heat already reaches the air loop (Q AC is the whole pod)
+    liquid_load_kw = design["liquid_cooling_capacity_per_pod"] * scenario.num_pods
+    if scenario.cdu_type == "Liquid to Air":
+        liquid_load_kw = 0
+    crah_kw = design["crah_hp2"] * design["no_of_crahs"] * scenario.num_pods
+    pods_without_pump_power = scenario.num_pods if design["cdu_hp_per_pod"] is None else 0
+    cdu_pump_kw = (design["cdu_hp_per_pod"] or 0) * scenario.num_pods
+
+    if economizer == "dry_cooler":
+        economizer_available = scenario.fws_liquid_temp - 5 - dry_bulb >= 0
+    else:
+        economizer_available = scenario.fws_liquid_temp - 3 - wet_bulb >= 0
+
+    chiller_kw = _chiller_power(surface, air_load_kw, scenario.fws_air_temp, dry_bulb)
+    if liquid_load_kw:
+        liquid_chiller_kw = _chiller_power(surface, liquid_load_kw, scenario.fws_liquid_temp, dry_bulb)
+        chiller_kw = chiller_kw + np.where(economizer_available, 0, liquid_chiller_kw)
+    cooling_kw = chiller_kw + crah_kw + cdu_pump_kw
+
+    hours = dry_bulb.shape[-1]
+    chiller_kwh = chiller_kw.sum(axis=-1)
+    cooling_kwh = cooling_kw.sum(axis=-1)
+    it_kwh = np.full(chiller_kwh.shape, it_kw * hours)
+    results = {
+        "it_kwh": it_kwh,
+        "chiller_kwh": chiller_kwh,
+        "crah_kwh": np.full(chiller_kwh.shape, crah_kw * hours),
+        "cdu_pump_kwh": np.full(chiller_kwh.shape, cdu_pump_kw * hours),
+        "pods_without_pump_power": np.full(chiller_kwh.shape, pods_without_pump_power),
+        "cooling_kwh": cooling_kwh,
+        "total_kwh": it_kwh + cooling_kwh,
+        "pue": (it_kwh + cooling_kwh) / it_kwh,
+        "economizer_hours": economizer_available.sum(axis=-1),
+    }
+    if hourly:
+        results["economizer_available"] = economizer_available
+        results["chiller_kw"] = chiller_kw
+        results["cooling_kw"] = cooling_kw
+    return results
+
+
+def _chiller_power(surface, load_kw, twout, dry_bulb):
+    # Power Input scaled by the part load, load / capacity, of the chiller plant at each hour's ambient
+    performance = surface.evaluate(twout, dry_bulb, fields=("capacity", "power_input"))
+    return load_kw / performance["capacity"] * performance["power_input"]
+
+
+def rank_sites(scenario, names, dry_bulb, wet_bulb, chillers, **kwargs):
+    """Rank sites by the annual energy of a design.
+
+    Args:
+        scenario: :class:`ui_for_ov.engine.Scenario`.
+        names: Site names, one per row of the series.
+        dry_bulb, wet_bulb: ``(sites, hours)`` series.
+        chillers: :class:`ui_for_ov.chillers.ChillerTable`.
+        **kwargs: Passed to :func:`simulate`.
+
+    Returns:
+        list of ``(name, total_kwh, pue)``, lowest annual energy first.
+    """
+    return _rank(names, simulate(scenario, dry_bulb, wet_bulb, chillers, **kwargs))
+
+
+def simulate_store(scenario, store, chillers, stations_per_chunk=256, **kwargs):
+    """Simulate a design at every station of a :class:`ui_for_ov.weather.WeatherStore`.
+
+    The store is scanned in chunks of stations, so memory stays bounded by one chunk's series.
+
+    Returns:
+        ``(stations, results)``: the station names and dict of :data:`ANNUAL_FIELDS` -> array, one
+        value per station in store order.
+    """
+    chunks = [
+        simulate(scenario, series["dry_bulb"], series["wet_bulb"], chillers, **kwargs)
+        for _, series in store.iter_chunks(stations_per_chunk, ("dry_bulb", "wet_bulb"))
+    ]
+    results = {
+        name: np.concatenate([chunk[name] for chunk in chunks]) if chunks else np.empty(0)
+        for name in ANNUAL_FIELDS
+    }
+    return list(store.stations), results
+
+
+def rank_store(scenario, store, chillers, **kwargs):
+    """:func:`rank_sites` over every station of a weather store, see :func:`simulate_store`."""
+    return _rank(*simulate_store(scenario, store, chillers, **kwargs))
+
+
+def _rank(names, results):
+    total_kwh = np.atleast_1d(results["total_kwh"])
+    pue = np.atleast_1d(results["pue"])
+    if len(names) != len(total_kwh):
+        raise ValueError(f"Got {len(names)} names for {len(total_kwh)} sites")
+    order = np.argsort(total_kwh, kind="stable")
+    return [(names[i], float(total_kwh[i]), float(pue[i])) for i in order.tolist()]
@@ -0,0 +1,300 @@
+"""NumPy-vectorized batch evaluation of the sizing model.
+
+:func:`evaluate_batch` is the array counterpart of :func:`ui_for_ov.engine.evaluate`: it takes arrays of
+inputs (broadcast against each other) and returns arrays of every output in one pass, so design-space
+sweeps do not have to loop over scenarios in Python. Quantities that are undefined for a point (no
+system curve, no chiller row, unknown city) are NaN.
+
+Sweeps too large for memory stream instead: :func:`design_grid_blocks` yields the grid in fixed-size
+blocks and :func:`evaluate_blocks` evaluates them one at a time; see :mod:`ui_for_ov.columnar` to append
+the blocks to disk.
+"""
+import numpy as np
+
+from . import engine, pumps
+from .pods import default_pods
+
+# Points per block of the streaming API (design_grid_blocks, evaluate_blocks)
+BLOCK_SIZE = 65536
+
+# The numeric outputs the panel's labels show
+PANEL_FIELDS = (
+    "total_power",
+    "required_airflow_rate_per_pod",
+    "required_liquid_flow_rate_per_pod",
+    "total_cdus",
+    "secondary_flow_rate_per_cdu",
+    "primary_flow_rate_per_cdu",
+    "primary_flow_rate_per_pod",
+    "cdu_hp2",
+    "cdu_hp_per_pod",
+    "air_temperature_rise",
+    "air_return_temperature",
+    "no_of_crahs",
+    "q_per_crah",
+    "q_ac_per_pod",
+    "crah_hp2",
+    "dry_cooler",
+    "cooling_tower",
+    "chilled_water_flow_rate_per_crah",
+    "chilled_water_flow_rate_per_pod",
+)
+
+
+def _polyval(coefficients, x):
+    # Horner's rule, highest power first (same ordering as numpy.polyval)
+    result = np.zeros_like(x, dtype=np.float64)
+    for coefficient in coefficients:
+        result = result * x + coefficient
+    return result
+
+
+def calculate_air_flow_rate_per_kw(air_supply_temp):
+    """Vectorized :func:`ui_for_ov.engine.calculate_air_flow_rate_per_kw`."""
+    return _polyval((0.0054667, -0.34, 10.263333, -13), np.asarray(air_supply_temp, dtype=np.float64))
+
+
+def calculate_liquid_flow_rate_per_rack(tcs_liquid_temp):
+    """Vectorized :func:`ui_for_ov.engine.calculate_liquid_flow_rate_per_rack`."""
+    return _polyval(
+        (-0.0007656, 0.11484, -6.18222, 145.2726, -1205.82), np.asarray(tcs_liquid_temp, dtype=np.float64)
+    )
+
+
+def calculate_cdus(liquid_cooling_capacity, required_liquid_flow_rate_per_pod):
+    """Vectorized :func:`ui_for_ov.engine.calculate_cdus`."""
+    cdus_by_cooling_capacity = np.ceil(
+        np.asarray(liquid_cooling_capacity) / engine.equipment_catalog()[engine.CDU_MODEL].capacity
+    )
+    cdus_by_flow_rate = np.ceil(np.asarray(required_liquid_flow_rate_per_pod) / engine.MAX_SECONDARY_FLOW_RATE_CDU)
+    return (np.maximum(cdus_by_cooling_capacity, cdus_by_flow_rate) + 1).astype(np.int64)
+
+
+def calculate_no_of_crahs(air_cooling_capacity_per_pod, model=engine.CRAH_MODEL):
+    """Vectorized :func:`ui_for_ov.engine.calculate_no_of_crahs`."""
+    crah_model_capacity = engine.equipment_catalog()[model].capacity
+    return np.ceil(np.asarray(air_cooling_capacity_per_pod) / crah_model_capacity).astype(np.int64)
+
+
+def calculate_crah_rpm_and_power(required_airflow_rate_per_pod, no_of_crahs, model=engine.CRAH_MODEL):
+    """Vectorized :func:`ui_for_ov.engine.calculate_crah_rpm_and_power`."""
+    crah = engine.equipment_catalog()[model]
+    cfm2 = np.asarray(required_airflow_rate_per_pod) / no_of_crahs
+    rpm2_percent = (cfm2 / crah.airflow) * engine.RPM1_PERCENT
+    hp2_per_crah = ((rpm2_percent / engine.RPM1_PERCENT) ** 3) * crah.power
+    return cfm2, rpm2_percent, hp2_per_crah
+
+
+def calculate_cdu_pump_power(pod_codes, pod_types, total_cdus, pod_flowrate_per_cdu):
+    """Vectorized :func:`ui_for_ov.engine.calculate_cdu_pump_power`.
+
+    ``pod_codes`` index into ``pod_types``. Points without a system curve for (pod type, CDUs) are NaN.
+    """
+    return pumps.cdu_pump_power(pod_types, total_cdus, pod_flowrate_per_cdu, pod_codes=pod_codes)
+
+
+def _encode(values):
+    # Categorical codes for an array of labels, in order of first appearance. A dict pass is linear,
+    # where np.unique would sort the (object) labels.
+    flat = values.ravel().tolist()
+    labels = list(dict.fromkeys(flat))
+    index = {label: code for code, label in enumerate(labels)}
+    codes = np.fromiter(map(index.__getitem__, flat), dtype=np.int64, count=len(flat))
+    return labels, codes.reshape(values.shape)
+
+
+def evaluate_batch(
+    air_supply_temps,
+    tcs_liquid_temps,
+    pod_types,
+    pod_counts=1,
+    cities=None,
+    fws_air_temps=5,
+    fws_liquid_temps=5,
+    cdu_types="Liquid to Liquid",
+    chillers=None,
+    climate=None,
+    pods=None,
+    station_rows=None,
+):
+    """Evaluate many scenarios at once.
+
+    All input arguments are array-likes broadcast against each other. ``chillers`` and ``climate`` are
+    the tables accepted by :func:`ui_for_ov.engine.evaluate`; site dependent outputs are NaN when they,
+    or ``cities``, are omitted. ``station_rows`` (rows of ``climate``, -1 for none) select the stations
+    directly instead of by city name, e.g. to tell apart stations that share a name. ``pods`` is a
+    :class:`ui_for_ov.pods.PodMatrix` defining the pod types, by default the engine's ``POD_RACK_COUNTS``.
+
+    Returns:
+        dict of output name to array, with the same keys as :func:`ui_for_ov.engine.evaluate` for the
+        numeric results.
+    """
+    by_row = station_rows is not None
+    (air_supply_temps, tcs_liquid_temps, pod_types, pod_counts, cities, fws_air_temps, fws_liquid_temps,
+     cdu_types, station_rows) = np.broadcast_arrays(
+        np.asarray(air_supply_temps, dtype=np.float64),
+        np.asarray(tcs_liquid_temps, dtype=np.float64),
+        np.asarray(pod_types, dtype=object),
+        np.asarray(pod_counts),
+        np.asarray(cities, dtype=object),
+        np.asarray(fws_air_temps, dtype=np.float64),
+        np.asarray(fws_liquid_temps, dtype=np.float64),
+        np.asarray(cdu_types, dtype=object),
+        np.asarray(station_rows if by_row else -1, dtype=np.int64),
+    )
+
+    # Per pod type totals: one sparse product per quantity over the pod matrix, gathered through codes
+    pods = pods if pods is not None else default_pods()
+    pod_labels, pod_codes = _encode(pod_types)
+    pod_rows = pods.rows_of(pod_labels)
+
+    def per_pod(totals):
+        # Unknown pod types have no racks
+        return np.where(pod_rows >= 0, totals[pod_rows.clip(0)], 0.0)[pod_codes]
+
+    power_per_pod = per_pod(pods.power())
+    air_cooling_capacity_per_pod = per_pod(pods.air_cooling_capacity())
+    liquid_cooling_capacity_per_pod = per_pod(pods.liquid_cooling_capacity())
+    cfm_per_kw_capacity, fixed_airflow = (per_pod(totals) for totals in pods.air_flow_coefficients())
+    reference_racks = per_pod(pods.liquid_rack_equivalents())
+
+    # Liquid side
+    required_liquid_flow_rate_per_pod = calculate_liquid_flow_rate_per_rack(tcs_liquid_temps) * reference_racks
+    total_cdus = calculate_cdus(liquid_cooling_capacity_per_pod, required_liquid_flow_rate_per_pod)
+    secondary_flow_rate_per_cdu = required_liquid_flow_rate_per_pod / total_cdus
+    primary_flow_rate_per_cdu = ((liquid_cooling_capacity_per_pod / total_cdus / engine.PRIMARY_DELTA_TEMP) / 4170) * 60000
+    cdu_hp2 = calculate_cdu_pump_power(pod_codes, pod_labels, total_cdus, secondary_flow_rate_per_cdu)
+
+    # Air side
+    required_airflow_rate_per_pod = (
+        calculate_air_flow_rate_per_kw(air_supply_temps) * cfm_per_kw_capacity + fixed_airflow
+    ) * 1.05
+    air_temperature_rise = air_cooling_capacity_per_pod / 1.08 / (required_airflow_rate_per_pod * 0.00047194745)
+    no_of_crahs = calculate_no_of_crahs(air_cooling_capacity_per_pod)
+    liquid_to_liquid = cdu_types == "Liquid to Liquid"
+    liquid_to_air = cdu_types == "Liquid to Air"
+    q_ac_per_pod = np.where(
+        liquid_to_liquid, air_cooling_capacity_per_pod, np.where(liquid_to_air, power_per_pod, 0.0)
+    )
+    q_per_crah = q_ac_per_pod / no_of_crahs
+    crah_cfm2, crah_rpm2_percent, crah_hp2 = calculate_crah_rpm_and_power(required_airflow_rate_per_pod, no_of_crahs)
+
+    # Site dependent results
+    dry_bulb = np.full(air_supply_temps.shape, np.nan)
+    wet_bulb = np.full(air_supply_temps.shape, np.nan)
+    if climate is not None:
+        if not by_row:
+            city_labels, city_codes = _encode(cities)
+            station_rows = climate.rows_of(city_labels)[city_codes]
+        dry_bulb = climate.take("dry_bulb", station_rows)
+        wet_bulb = climate.take("wet_bulb", station_rows)
+    has_site = ~np.isnan(dry_bulb)
+    dry_cooler = np.where(has_site, fws_liquid_temps - 5 - dry_bulb >= 0, False)
+    cooling_tower = np.where(has_site, fws_liquid_temps - 3 - wet_bulb >= 0, False)
+
+    chilled_water_temperature_rise = np.full(air_supply_temps.shape, np.nan)
+    if chillers is not None and has_site.any():
+        chilled_water_temperature_rise[has_site] = chillers.interpolate(
+            engine.CHILLER_MODEL, fws_air_temps[has_site], dry_bulb[has_site]
+        )["evaporator"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        chilled_water_flow_rate_per_crah = np.where(
+            chilled_water_temperature_rise == 0,
+            np.nan,
+            (q_per_crah / (chilled_water_temperature_rise * engine.WATER_RHO_CP)) * 60000,
+        )
+
+    return {
+        "power_per_pod": power_per_pod,
+        "total_power": power_per_pod * pod_counts,
+        "air_cooling_capacity_per_pod": air_cooling_capacity_per_pod,
+        "liquid_cooling_capacity_per_pod": liquid_cooling_capacity_per_pod,
+        "required_airflow_rate_per_pod": required_airflow_rate_per_pod,
+        "required_liquid_flow_rate_per_pod": required_liquid_flow_rate_per_pod,
+        "total_cdus": total_cdus,
+        "secondary_flow_rate_per_cdu": secondary_flow_rate_per_cdu,
+        "primary_flow_rate_per_cdu": primary_flow_rate_per_cdu,
+        "primary_flow_rate_per_pod": primary_flow_rate_per_cdu * total_cdus,
+        "pod_flowrate_per_cdu": secondary_flow_rate_per_cdu,
+        "cdu_hp2": cdu_hp2,
+        "cdu_hp_per_pod": cdu_hp2 * total_cdus,
+        "air_temperature_rise": air_temperature_rise,
+        "air_return_temperature": air_supply_temps + air_temperature_rise,
+        "no_of_crahs": no_of_crahs,
+        "q_per_crah": q_per_crah,
+        "q_ac_per_pod": q_ac_per_pod,
+        "crah_cfm2": crah_cfm2,
+        "crah_rpm2_percent": crah_rpm2_percent,
+        "crah_hp2": crah_hp2,
+        "dry_bulb": dry_bulb,
+        "wet_bulb": wet_bulb,
+        "dry_cooler": dry_cooler,
+        "cooling_tower": cooling_tower,
+        "chilled_water_temperature_rise": chilled_water_temperature_rise,
+        "chilled_water_flow_rate_per_crah": chilled_water_flow_rate_per_crah,
+        "chilled_water_flow_rate_per_pod": chilled_water_flow_rate_per_crah * no_of_crahs,
+    }
+
+
+def design_grid(air_supply_temps, tcs_liquid_temps, pod_types, cities=(None,), pod_counts=(1,)):
+    """Cartesian product of the given axes as flat input arrays for :func:`evaluate_batch`.
+
+    Example::
+
+        grid = design_grid(range(15, 33), range(17, 46), engine.POD_RACK_COUNTS, climate.cities)
+        results = evaluate_batch(**grid, chillers=chillers, climate=climate)
+    """
+    axes = _grid_axes(air_supply_temps, tcs_liquid_temps, pod_types, cities, pod_counts)
+    return _grid_block(axes, 0, int(np.prod([len(axis) for axis in axes])))
+
+
+def design_grid_blocks(
+    air_supply_temps, tcs_liquid_temps, pod_types, cities=(None,), pod_counts=(1,), block_size=BLOCK_SIZE
+):
+    """:func:`design_grid` in blocks of at most ``block_size`` points, without materializing the grid."""
+    axes = _grid_axes(air_supply_temps, tcs_liquid_temps, pod_types, cities, pod_counts)
+    size = int(np.prod([len(axis) for axis in axes]))
+    for start in range(0, size, block_size):
+        yield _grid_block(axes, start, min(start + block_size, size))
+
+
+def evaluate_blocks(blocks, fields=PANEL_FIELDS, **kwargs):
+    """Evaluate input blocks (e.g. from :func:`design_grid_blocks`) one at a time.
+
+    Args:
+        blocks: Iterable of :func:`evaluate_batch` keyword argument dicts.
+        fields: Outputs to keep; None keeps all of them.
+        kwargs: Passed to :func:`evaluate_batch` for every block (``chillers``, ``climate``, ...).
+
+    Yields:
+        dict of the block's input columns followed by the ``fields`` columns, so peak memory is bounded
+        by the block size, not the sweep size.
+    """
+    for block in blocks:
+        results = evaluate_batch(**block, **kwargs)
+        columns = dict(block)
+        columns.update((name, results[name]) for name in (fields if fields is not None else results))
+        yield columns
+
+
+def _grid_axes(air_supply_temps, tcs_liquid_temps, pod_types, cities, pod_counts):
+    return [
+        np.asarray(list(air_supply_temps), dtype=np.float64),
+        np.asarray(list(tcs_liquid_temps), dtype=np.float64),
+        np.asarray(list(pod_types), dtype=object),
+        np.asarray(list(cities), dtype=object),
+        np.asarray(list(pod_counts)),
+    ]
+
+
+def _grid_block(axes, start, stop):
+    # Points start..stop of the grid, in row-major order over the axes
+    index = np.unravel_index(np.arange(start, stop), [len(axis) for axis in axes])
+    air, tcs, pod, city, count = (axis[i] for axis, i in zip(axes, index))
+    return {
+        "air_supply_temps": air,
+        "tcs_liquid_temps": tcs,
+        "pod_types": pod,
+        "cities": city,
+        "pod_counts": count,
+    }
@@ -0,0 +1,464 @@
+"""Benchmarks of the sizing calculations, data loading, startup, table lookups, batch sweeps, annual runs,
+equipment selection and campus roll-ups.
+
+Run from ``exts/ui_for_ov``::
+
+    python -m ui_for_ov.benchmarks -o baseline.json
+    python -m ui_for_ov.benchmarks -o current.json --compare baseline.json
+
+Every benchmark is timed with :mod:`timeit` (best and median time per call over several repeats) and then
+run once under :mod:`tracemalloc` for its peak allocation. Results are written as JSON together with the
+git commit and the Python and NumPy versions, and ``--compare`` reports the change against an earlier
+run. ``on_startup`` and the panel's update cycle need Omniverse Kit; outside of it they are reported as
+skipped and the headless parts (table loading, sizing graph) are measured instead.
+"""
+import argparse
+import functools
+import itertools
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+import tracemalloc
+import types
+from collections import namedtuple
+
+import numpy as np
+
+from . import annual, batch, campus, crah_optimizer, data, engine, memo, snapshot
+from .graph import build_sizing_graph
+
+SIZES = (1000, 100000, 1000000)
+POD = "576 GPU DGX GB200 Super Pod"
+
+Benchmark = namedtuple("Benchmark", ["group", "name", "function", "number", "repeat"], defaults=(None, 5))
+
+
+class Skipped(Exception):
+    """Raised while setting up a benchmark that cannot run here; the message says why."""
+
+
+def calculate_arguments(chillers):
+    """Arguments of one representative call of every ``engine.calculate_*`` function."""
+    capacity = engine.calculate_total_liquid_cooling_capacity(POD)
+    air_capacity = engine.calculate_total_air_cooling_capacity(POD)
+    power = engine.calculate_power_per_pod(POD)
+    flow = engine.calculate_liquid_flow_rate_per_pod(POD, 30)
+    cdus = engine.calculate_cdus(capacity, flow)
+    airflow = engine.calculate_airflow_rate_per_pod(POD, 25)
+    crahs = engine.calculate_no_of_crahs(air_capacity)
+    rack_power = engine.calculate_rack_power_liquid_cooled(30)
+    return_temp = engine.calculate_secondary_return_temp(rack_power, engine.calculate_liquid_flow_rate_per_rack(30), 30)
+    curve = engine.calculate_system_curve(POD, cdus)
+    return {
+        "calculate_liquid_cooling_capacity": ("GB200_NVL72",),
+        "calculate_total_air_cooling_capacity": (POD,),
+        "calculate_total_liquid_cooling_capacity": (POD,),
+        "calculate_power_per_pod": (POD,),
+        "calculate_air_flow_rate_per_kw": (25,),
+        "calculate_air_flow_rate_per_rack": (25,),
+        "calculate_liquid_flow_rate_per_rack": (30,),
+        "calculate_rack_air_flow_rate": ("GB200_NVL72", 25),
+        "calculate_liquid_rack_equivalents": ("GB200_NVL36",),
+        "calculate_reference_racks": (POD,),
+        "calculate_airflow_rate_per_pod": (POD, 25),
+        "calculate_liquid_flow_rate_per_pod": (POD, 30),
+        "calculate_cdus": (capacity, flow),
+        "calculate_primary_flow_rate_per_cdu": (capacity / cdus,),
+        "calculate_rack_power_liquid_cooled": (30,),
+        "calculate_secondary_return_temp": (rack_power, engine.calculate_liquid_flow_rate_per_rack(30), 30),
+        "calculate_q_max_cdu": (flow, cdus, return_temp, 20, capacity),
+        "calculate_air_temperature_rise_in_rack": (air_capacity, airflow),
+        "calculate_no_of_crahs": (air_capacity,),
+        "calculate_q_per_crah": ("Liquid to Liquid", air_capacity, power, crahs),
+        "calculate_q_ac_per_pod": ("Liquid to Air", air_capacity, power),
+        "calculate_chilled_water_flow_rate_per_crah": (air_capacity / crahs, 10),
+        "calculate_roots": (curve["a"], curve["b"], curve["c"]),
+        "calculate_dp": (curve, flow / cdus),
+        "calculate_system_curve": (POD, cdus + 1),
+        "calculate_cdu_pump_power": (POD, cdus, flow / cdus),
+        "calculate_crah_rpm_and_power": (airflow, crahs),
+        "calculate_liquid_cooling_options": (35, 30, 24),
+        "calculate_chilled_water_temperature_rise": (chillers, 15, 30),
+    }
+
+
+def calculate_benchmarks(chillers):
+    """One benchmark per ``engine.calculate_*`` function; memoized ones also through their cache."""
+    arguments = calculate_arguments(chillers)
+    for name in sorted(name for name in dir(engine) if name.startswith("calculate_")):
+        function = getattr(engine, name)
+        if name not in arguments:
+            yield Benchmark("calculate", name, _skip(f"no benchmark arguments for engine.{name}"))
+            continue
+        args = arguments[name]
+        uncached = getattr(function, "__wrapped__", function)
+        yield Benchmark("calculate", name, functools.partial(uncached, *args))
+        if uncached is not function:
+            yield Benchmark("calculate", f"{name}[memo hit]", functools.partial(function, *args))
+
+
+def update_cycle_benchmarks(chillers, climate):
+    """The panel's recompute after one input change, headless and against stub labels in Kit."""
+    scenario = engine.Scenario(pod_type=POD, num_pods=4, fws_air_temp=15, city="TOKYO")
+    temperatures = itertools.cycle(range(17, 46))
+
+    def evaluate():
+        engine.evaluate(scenario._replace(tcs_liquid_temp=next(temperatures)), chillers, climate)
+
+    graph = build_sizing_graph(chillers, climate, scenario)
+
+    def graph_cycle():
+        graph.set("tcs_liquid_temp", next(temperatures))
+        graph.recompute()
+
+    cities = itertools.cycle(["TOKYO", "DUBLIN AP"])
+
+    def graph_city_cycle():
+        graph.set("city", next(cities))
+        graph.recompute()
+
+    yield Benchmark("update", "evaluate (full recompute)", evaluate)
+    yield Benchmark("update", "sizing graph (incremental)", graph_cycle)
+    yield Benchmark("update", "sizing graph city change (incremental)", graph_city_cycle)
+    yield Benchmark("update", "update_calculations (stub labels)", _panel_update_cycle(chillers, climate, scenario))
+
+
+def _panel_update_cycle(chillers, climate, scenario):
+    try:
+        from .extension import MyExtension
+    except ImportError as e:
+        return _skip(f"needs Omniverse Kit ({e})")
+
+    # Just the state update_calculations touches: the graph and a text-only stand-in for every label
+    panel = types.SimpleNamespace(LABEL_BINDINGS=MyExtension.LABEL_BINDINGS)
+    panel._sizing_graph = build_sizing_graph(chillers, climate, scenario)
+    panel._input_triggers = {}
+    panel._update_label = functools.partial(MyExtension._update_label, panel)
+    for attribute, *_ in MyExtension.LABEL_BINDINGS.values():
+        setattr(panel, attribute, types.SimpleNamespace(text=""))
+    temperatures = itertools.cycle(range(17, 46))
+
+    def cycle():
+        panel._sizing_graph.set("tcs_liquid_temp", next(temperatures))
+        MyExtension.update_calculations(panel)
+
+    return cycle
+
+
+def load_benchmarks(cache_dir):
+    """CSV parsing, snapshot compile and mapped loads, and the extension's startup."""
+    yield Benchmark("load", "read_chillers (CSV)", data.read_chillers)
+    yield Benchmark("load", "read_climate (CSV)", data.read_climate)
+
+    def compile_snapshots():
+        for source, reader in ((data.CHILLERS_CSV, data._chiller_columns), (data.CLIMATE_CSV, data._climate_columns)):
+            snapshot.load(source, reader, cache_dir)
+            os.remove(snapshot.snapshot_path(source, cache_dir))
+
+    def load_tables():
+        data.load_chiller_table(cache_dir=cache_dir)
+        data.load_climate_store(cache_dir=cache_dir)
+
+    yield Benchmark("load", "snapshot compile", compile_snapshots)
+    yield Benchmark("load", "load tables (mapped snapshots)", load_tables)
+    yield Benchmark("load", "on_startup + on_shutdown", _startup(), number=1, repeat=3)
+
+
+def _startup():
+    try:
+        from .extension import MyExtension
+    except ImportError as e:
+        return _skip(f"needs Omniverse Kit ({e})")
+
+    def startup():
+        extension = MyExtension()
+        extension.on_startup("ui_for_ov.benchmarks")
+        extension.on_shutdown()
+        extension._window.destroy()
+
+    return startup
+
+
+def lookup_benchmarks(chillers, climate, count=100000):
+    """Scalar and batched chiller and climate lookups."""
+    rng = np.random.default_rng(0)
+    twout = rng.integers(5, 21, count).astype(np.float64)
+    ta = rng.integers(20, 46, count).astype(np.float64)
+    cities = np.asarray(climate.cities, dtype=object)[rng.integers(0, len(climate.cities), count)]
+    label = _size_label(count)
+    model = engine.CHILLER_MODEL
+    yield Benchmark("lookup", "chiller evaporator_rise", functools.partial(chillers.evaporator_rise, model, 15, 30))
+    yield Benchmark("lookup", f"chiller lookup_many {label}", functools.partial(chillers.lookup_many, model, twout, ta))
+    yield Benchmark("lookup", f"chiller interpolate {label}", functools.partial(chillers.interpolate, model, twout, ta))
+    yield Benchmark("lookup", "climate get", functools.partial(climate.get, "TOKYO"))
+    yield Benchmark("lookup", f"climate rows_of {label}", functools.partial(climate.rows_of, cities))
+
+
+def sweep_benchmarks(chillers, climate, sizes=SIZES):
+    """``evaluate_batch`` over random design points, and the streaming API at the largest size."""
+    for size in sizes:
+        points = _design_points(climate, size)
+        yield Benchmark(
+            "sweep",
+            f"evaluate_batch {_size_label(size)}",
+            functools.partial(batch.evaluate_batch, **points, fws_air_temps=15, chillers=chillers, climate=climate),
+            number=1 if size >= 100000 else None,
+            repeat=3 if size >= 100000 else 5,
+        )
+    if sizes:
+        size = max(sizes)
+        points = _design_points(climate, size)
+
+        def stream():
+            blocks = ({name: values[start:start + batch.BLOCK_SIZE] for name, values in points.items()}
+                      for start in range(0, size, batch.BLOCK_SIZE))
+            for _ in batch.evaluate_blocks(blocks, fws_air_temps=15, chillers=chillers, climate=climate):
+                pass
+
+        yield Benchmark("sweep", f"evaluate_blocks {_size_label(size)}", stream, number=1, repeat=3)
+
+
+def annual_benchmarks(chillers, sites=(1, 100)):
+    """8760 hour simulations of one design over synthetic weather, for one site and for many at once."""
+    hours = np.arange(annual.HOURS_PER_YEAR)
+    year = 12 + 10 * np.sin(2 * np.pi * hours / 8760) + 5 * np.sin(2 * np.pi * hours / 24)
+    scenario = engine.Scenario(pod_type=POD, num_pods=4, fws_air_temp=12, fws_liquid_temp=30)
+    for count in sites:
+        dry_bulb = year + np.linspace(-10, 10, count)[:, np.newaxis]
+        yield Benchmark(
+            "annual",
+            f"simulate {count} site{'s' if count > 1 else ''} x 8760 h",
+            functools.partial(annual.simulate, scenario, dry_bulb, dry_bulb - 4, chillers),
+        )
+
+
+def optimizer_benchmarks(halls=(100, 5000)):
+    """CRAH model and count selection for halls of random pods, every catalog CRAH against every pod."""
+    for pods in halls:
+        rng = np.random.default_rng(pods)
+        capacity = rng.uniform(100, 3000, pods)
+        airflow = capacity * rng.uniform(120, 180, pods)
+        for objective in ("fan_power", "cost"):
+            yield Benchmark(
+                "optimize",
+                f"crah {objective} {_size_label(pods)} pods",
+                functools.partial(crah_optimizer.optimize, capacity, airflow, redundancy=1, objective=objective),
+            )
+
+
+def campus_benchmarks(chillers, climate, pods=5000, halls=20, rows_per_hall=10):
+    """A campus of random pods: evaluating every hall, and re-evaluating one hall after a design change."""
+    rng = np.random.default_rng(pods)
+    pod_types = np.asarray(list(engine.POD_RACK_COUNTS), dtype=object)
+    design = engine.Scenario(city=climate.cities[0])
+    per_row = pods // (halls * rows_per_hall)
+
+    def build():
+        site = campus.Campus(chillers, climate)
+        for hall in range(halls):
+            rows = [pod_types[rng.integers(0, len(pod_types), per_row)] for _ in range(rows_per_hall)]
+            site.set_hall(f"Hall {hall}", design, rows)
+        return site
+
+    def evaluate():
+        build().totals()
+
+    site = build()
+    site.totals()
+
+    def change_hall():
+        site.set_design("Hall 0", fws_air_temp=float(rng.integers(5, 15)))
+        site.totals()
+
+    label = _size_label(pods)
+    yield Benchmark("campus", f"build and evaluate {label} pods", evaluate)
+    yield Benchmark("campus", f"change 1 of {halls} halls, {label} pods", change_hall)
+
+
+def _design_points(climate, size):
+    rng = np.random.default_rng(size)
+    pods = np.asarray(list(engine.POD_RACK_COUNTS), dtype=object)
+    return {
+        "air_supply_temps": rng.integers(15, 33, size).astype(np.float64),
+        "tcs_liquid_temps": rng.integers(17, 46, size).astype(np.float64),
+        "pod_types": pods[rng.integers(0, len(pods), size)],
+        "cities": np.asarray(climate.cities, dtype=object)[rng.integers(0, len(climate.cities), size)],
+        "pod_counts": rng.integers(1, 9, size),
+    }
+
+
+def _size_label(size):
+    exponent = int(round(math.log10(size)))
+    return f"1e{exponent}" if 10 ** exponent == size else str(size)
+
+
+def _skip(reason):
+    def skipped():
+        raise Skipped(reason)
+
+    skipped.skip_reason = reason
+    return skipped
+
+
+def measure(benchmark, min_time=0.02):
+    """Time one benchmark; returns its result record.
+
+    Unless the benchmark fixes it, the number of calls per repeat grows (1, 2, 5, 10, ...) until a repeat
+    takes ``min_time`` seconds.
+    """
+    record = {"group": benchmark.group, "name": benchmark.name}
+    reason = getattr(benchmark.function, "skip_reason", None)
+    if reason is not None:
+        record["skipped"] = reason
+        return record
+    timer = timeit.Timer(benchmark.function)
+    number = benchmark.number or _calibrate(timer, min_time)
+    times = sorted(total / number for total in timer.repeat(benchmark.repeat, number))
+    tracemalloc.start()
+    try:
+        benchmark.function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    record.update(
+        number=number,
+        repeat=benchmark.repeat,
+        best_s=times[0],
+        median_s=times[len(times) // 2],
+        peak_bytes=peak,
+    )
+    return record
+
+
+def _calibrate(timer, min_time):
+    for exponent in itertools.count():
+        for multiplier in (1, 2, 5):
+            number = multiplier * 10 ** exponent
+            if timer.timeit(number) >= min_time:
+                return number
+
+
+def run(sizes=SIZES, pattern=None, cache_dir=None, report=None):
+    """Run the benchmarks whose ``group/name`` contains ``pattern``.
+
+    Args:
+        sizes: Point counts of the batch sweeps.
+        pattern: Substring filter; None runs everything.
+        cache_dir: Snapshot cache for the load benchmarks; a temporary directory by default.
+        report: Called with every result record as it is measured.
+
+    Returns:
+        dict with ``meta`` (commit, versions, platform, time) and ``results`` (one record per benchmark).
+    """
+    with tempfile.TemporaryDirectory() as temporary:
+        cache_dir = cache_dir or temporary
+        chillers = data.load_chiller_table(cache_dir=cache_dir)
+        climate = data.load_climate_store(cache_dir=cache_dir)
+        suites = itertools.chain(
+            calculate_benchmarks(chillers),
+            update_cycle_benchmarks(chillers, climate),
+            load_benchmarks(cache_dir),
+            lookup_benchmarks(chillers, climate),
+            sweep_benchmarks(chillers, climate, sizes),
+            annual_benchmarks(chillers),
+            optimizer_benchmarks(),
+            campus_benchmarks(chillers, climate),
+        )
+        results = []
+        for benchmark in suites:
+            if pattern and pattern not in f"{benchmark.group}/{benchmark.name}":
+                continue
+            results.append(measure(benchmark))
+            if report is not None:
+                report(results[-1])
+    return {"meta": _meta(), "results": results, "cache": memo.cache_stats()}
+
+
+def _meta():
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(__file__), timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        "commit": commit,
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(baseline, current, threshold=0.25):
+    """Pair up the results of two runs by benchmark.
+
+    Returns:
+        list of ``(group/name, baseline best_s, current best_s, ratio, regressed)``; ``regressed`` when the
+        current run is slower than the baseline by more than ``threshold`` (a fraction).
+    """
+    before = {f"{r['group']}/{r['name']}": r for r in baseline["results"] if "best_s" in r}
+    rows = []
+    for record in current["results"]:
+        key = f"{record['group']}/{record['name']}"
+        if "best_s" not in record or key not in before:
+            continue
+        ratio = record["best_s"] / before[key]["best_s"]
+        rows.append((key, before[key]["best_s"], record["best_s"], ratio, ratio > 1 + threshold))
+    return rows
+
+
+def _format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def _print_record(record):
+    name = f"{record['group']}/{record['name']}"
+    if "skipped" in record:
+        print(f"{name:<64} skipped: {record['skipped']}")
+    else:
+        print(
+            f"{name:<64} {_format_time(record['best_s']):>10} best {_format_time(record['median_s']):>10} median"
+            f" {record['peak_bytes'] / 1024:>12,.1f} KiB peak"
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m ui_for_ov.benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="slowdown reported as a regression (0.25 = 25%%)")
+    parser.add_argument("-k", "--filter", help="only run benchmarks whose group/name contains this")
+    parser.add_argument(
+        "--sizes", default=",".join(_size_label(size) for size in SIZES), help="sweep sizes (default: 1e3,1e5,1e6)"
+    )
+    args = parser.parse_args(argv)
+    sizes = tuple(int(float(size)) for size in args.sizes.split(",") if size)
+
+    results = run(sizes=sizes, pattern=args.filter, report=_print_record)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            rows = compare(json.load(f), results, args.threshold)
+        print()
+        for key, before, after, ratio, regressed in rows:
+            flag = "  REGRESSION" if regressed else ""
+            print(f"{key:<64} {_format_time(before):>10} -> {_format_time(after):>10} {ratio:6.2f}x{flag}")
+        return 1 if any(row[-1] for row in rows) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
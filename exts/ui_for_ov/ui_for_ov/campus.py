@@ -0,0 +1,254 @@
+"""Campus -> hall -> row -> pod site model with plant-level roll-ups.
+
+A :class:`Campus` is a set of named halls. Each hall has one design (a :class:`ui_for_ov.engine.Scenario`
+whose ``pod_type`` and ``num_pods`` are ignored) and rows of pods, stored as flat arrays of pod groups:
+pod type, row code and pod count. Pods are sized with :func:`ui_for_ov.batch.evaluate_batch` and their
+results rolled up with group-by reductions (:func:`numpy.bincount`) into rows and halls:
+
+* the :data:`ROLLUP_FIELDS` (IT power, CDU and CRAH counts, chilled water and primary flows, fan and pump
+  power, chiller loads) are summed per row and per hall. Pods whose CDU pump has no operating point are
+  left out of ``pump_power`` and counted in ``pods_without_pump_power`` instead;
+* each hall is its own chiller plant: the air loop chillers run at the hall's ``fws_air_temp``, and the
+  liquid loop chillers at its ``fws_liquid_temp`` for the heat the dry cooler cannot reject at the site's
+  design dry bulb. The hall's ``chillers`` are both loads over the interpolated chiller capacity, rounded up.
+
+Results are cached per hall. Changing a hall marks only that hall stale; the next query evaluates every
+stale hall together in one batch and the campus totals are re-summed from the cached hall totals.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import batch, engine
+
+# Per pod quantities summed over rows, halls and the campus
+ROLLUP_FIELDS = (
+    "pods",
+    "it_power",
+    "cdus",
+    "crahs",
+    "chilled_water_flow",
+    "primary_flow",
+    "fan_power",
+    "pump_power",
+    "pods_without_pump_power",
+    "air_chiller_load",
+    "liquid_chiller_load",
+)
+# Results of a hall, and of the campus
+PLANT_FIELDS = ROLLUP_FIELDS + ("chillers",)
+
+_DESIGN_FIELDS = ("air_supply_temp", "tcs_liquid_temp", "fws_air_temp", "fws_liquid_temp", "cdu_type")
+
+Hall = namedtuple("Hall", ["design", "row_names", "pod_types", "row_codes", "counts"])
+Hall.__doc__ = """A hall's design and its pod groups: one entry per run of identical pods in a row."""
+
+
+class Campus:
+    """Halls of pods, evaluated per hall and rolled up to plant level.
+
+    Args:
+        chillers: :class:`ui_for_ov.chillers.ChillerTable`; without it the chilled water flows and
+            chiller counts are NaN.
+        climate: :class:`ui_for_ov.climate.ClimateStore` the halls' ``city`` is looked up in; without it
+            the site dependent results are NaN and every liquid load goes to the chillers.
+        chiller_model: Chiller model of the plants.
+        pods: :class:`ui_for_ov.pods.PodMatrix` of the pod types, by default the engine's.
+    """
+
+    def __init__(self, chillers=None, climate=None, chiller_model=engine.CHILLER_MODEL, pods=None):
+        self.chillers = chillers
+        self.climate = climate
+        self.chiller_model = chiller_model
+        self.pods = pods
+        self._halls = {}
+        self._results = {}
+        self._totals = None
+
+    @property
+    def halls(self):
+        """Hall names, in the order they were added."""
+        return list(self._halls)
+
+    @property
+    def stale(self):
+        """Halls changed since they were last evaluated."""
+        return [name for name in self._halls if name not in self._results]
+
+    def set_hall(self, name, design, rows):
+        """Add or replace a hall.
+
+        Args:
+            name: Hall name.
+            design: :class:`ui_for_ov.engine.Scenario` of the hall's temperatures, CDU type and city.
+            rows: dict of row name -> pods, or a sequence of pods per row (named "Row 1", "Row 2", ...).
+                The pods of a row are a sequence of pod types, one per pod, or a dict of pod type -> count.
+        """
+        missing = [field for field in _DESIGN_FIELDS if getattr(design, field) is None]
+        if missing:
+            raise ValueError(f"Hall '{name}' design has no {', '.join(missing)}")
+        if not isinstance(rows, dict):
+            rows = {f"Row {i + 1}": pods for i, pods in enumerate(rows)}
+        pod_types, row_codes, counts = [], [], []
+        for row_code, pods in enumerate(rows.values()):
+            groups = pods.items() if isinstance(pods, dict) else ((pod_type, 1) for pod_type in pods)
+            for pod_type, count in groups:
+                pod_types.append(pod_type)
+                row_codes.append(row_code)
+                counts.append(count)
+        pod_types = np.asarray(pod_types, dtype=object)
+        unknown = set(pod_types[self._pod_matrix().rows_of(pod_types) < 0].tolist())
+        if unknown:
+            raise KeyError(f"Unknown pod types: {sorted(unknown)}")
+        self._halls[name] = Hall(
+            design, list(rows), pod_types, np.asarray(row_codes, dtype=np.int64), np.asarray(counts, dtype=np.float64)
+        )
+        self._invalidate(name)
+
+    def set_design(self, name, **changes):
+        """Change design fields of a hall, e.g. ``set_design("Hall A", fws_air_temp=7)``, keeping its rows."""
+        hall = self._halls[name]
+        self.set_hall(name, hall.design._replace(**changes), dict(zip(hall.row_names, self._rows_of(hall))))
+
+    def remove_hall(self, name):
+        del self._halls[name]
+        self._invalidate(name)
+
+    def evaluate(self):
+        """Evaluate every stale hall, in one batch; returns their names."""
+        names = self.stale
+        if not names:
+            return names
+        halls = [self._halls[name] for name in names]
+        hall_of_pod = np.repeat(np.arange(len(halls)), [len(hall.pod_types) for hall in halls])
+
+        def design(field, dtype=np.float64):
+            return np.asarray([getattr(hall.design, field) for hall in halls], dtype=dtype)
+
+        cdu_types = design("cdu_type", object)
+        results = batch.evaluate_batch(
+            design("air_supply_temp")[hall_of_pod],
+            design("tcs_liquid_temp")[hall_of_pod],
+            np.concatenate([hall.pod_types for hall in halls]),
+            cities=design("city", object)[hall_of_pod],
+            fws_air_temps=design("fws_air_temp")[hall_of_pod],
+            fws_liquid_temps=design("fws_liquid_temp")[hall_of_pod],
+            cdu_types=cdu_types[hall_of_pod],
+            chillers=self.chillers,
+            climate=self.climate,
+            pods=self.pods,
+        )
+        counts = np.concatenate([hall.counts for hall in halls])
+        values = _pod_values(results, counts, cdu_types[hall_of_pod])
+
+        # Row r of the i-th hall is group row_offsets[i] + r
+        row_offsets = np.concatenate([[0], np.cumsum([len(hall.row_names) for hall in halls])])
+        groups = row_offsets[hall_of_pod] + np.concatenate([hall.row_codes for hall in halls])
+        row_sums = {field: _group_sums(groups, column, row_offsets[-1]) for field, column in values.items()}
+        hall_sums = {field: _group_sums(hall_of_pod, column, len(halls)) for field, column in values.items()}
+        hall_sums["chillers"] = self._chiller_counts(
+            hall_sums, design("fws_air_temp"), design("fws_liquid_temp"), design("city", object)
+        )
+
+        pod_offsets = np.concatenate([[0], np.cumsum([len(hall.pod_types) for hall in halls])])
+        for i, name in enumerate(names):
+            pods = slice(pod_offsets[i], pod_offsets[i + 1])
+            rows = slice(row_offsets[i], row_offsets[i + 1])
+            pod_results = {field: column[pods] for field, column in results.items()}
+            pod_results.update(row=halls[i].row_codes, count=halls[i].counts)
+            self._results[name] = (
+                pod_results,
+                {field: column[rows] for field, column in row_sums.items()},
+                {field: float(column[i]) for field, column in hall_sums.items()},
+            )
+        return names
+
+    def hall(self, name):
+        """dict of :data:`PLANT_FIELDS` -> total of one hall."""
+        return dict(self._hall_results(name)[2])
+
+    def rows(self, name):
+        """dict of ``row`` (row names) and :data:`ROLLUP_FIELDS` -> array with one total per row of a hall."""
+        results = {"row": list(self._halls[name].row_names)}
+        results.update(self._hall_results(name)[1])
+        return results
+
+    def pod_results(self, name):
+        """:func:`ui_for_ov.batch.evaluate_batch` results of a hall's pod groups, with their ``row`` codes
+        and pod ``count``; quantities are per pod."""
+        return dict(self._hall_results(name)[0])
+
+    def totals(self):
+        """dict of :data:`PLANT_FIELDS` -> campus total, summed over the halls."""
+        if self._totals is None:
+            self.evaluate()
+            totals = np.array(
+                [[self._results[name][2][field] for field in PLANT_FIELDS] for name in self._halls], dtype=np.float64
+            ).reshape(-1, len(PLANT_FIELDS))
+            self._totals = dict(zip(PLANT_FIELDS, totals.sum(axis=0).tolist()))
+        return dict(self._totals)
+
+    def _hall_results(self, name):
+        if name not in self._halls:
+            raise KeyError(f"Unknown hall '{name}'")
+        self.evaluate()
+        return self._results[name]
+
+    def _invalidate(self, name):
+        self._results.pop(name, None)
+        self._totals = None
+
+    def _pod_matrix(self):
+        from .pods import default_pods
+
+        return self.pods if self.pods is not None else default_pods()
+
+    def _rows_of(self, hall):
+        rows = [{} for _ in hall.row_names]
+        for pod_type, row_code, count in zip(hall.pod_types.tolist(), hall.row_codes.tolist(), hall.counts.tolist()):
+            rows[row_code][pod_type] = rows[row_code].get(pod_type, 0) + count
+        return rows
+
+    def _chiller_counts(self, hall_sums, fws_air_temps, fws_liquid_temps, cities):
+        # Air and liquid loop chillers of each hall, at its own leaving water temperatures and design dry bulb
+        if self.chillers is None or self.climate is None:
+            return np.full(len(cities), np.nan)
+        surface = self.chillers.surface(self.chiller_model)
+        if surface is None:
+            raise ValueError(f"Unknown chiller model '{self.chiller_model}'")
+        dry_bulb = self.climate.take("dry_bulb", self.climate.rows_of(cities))
+        chillers = np.zeros(len(cities))
+        loops = ((hall_sums["air_chiller_load"], fws_air_temps), (hall_sums["liquid_chiller_load"], fws_liquid_temps))
+        for load, twout in loops:
+            capacity = surface.evaluate(twout, dry_bulb, fields=("capacity",))["capacity"]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                chillers += np.where(load > 0, np.ceil(load / capacity), 0)
+        return chillers
+
+
+def _pod_values(results, counts, cdu_types):
+    # Per pod group values of the ROLLUP_FIELDS: per pod results times the group's pod count. With Liquid to
+    # Air CDUs the liquid heat already reaches the air loop; otherwise it goes to the chillers unless the dry
+    # cooler can reject it
+    liquid_to_chiller = (cdu_types != "Liquid to Air") & ~results["dry_cooler"]
+    # Pods whose pump power is unknown (NaN) are counted, not summed
+    unknown_pump = np.isnan(results["cdu_hp_per_pod"])
+    per_pod = {
+        "pods": np.ones(len(counts)),
+        "it_power": results["power_per_pod"],
+        "cdus": results["total_cdus"],
+        "crahs": results["no_of_crahs"],
+        "chilled_water_flow": results["chilled_water_flow_rate_per_pod"],
+        "primary_flow": results["primary_flow_rate_per_pod"],
+        "fan_power": results["crah_hp2"] * results["no_of_crahs"],
+        "pump_power": np.where(unknown_pump, 0.0, results["cdu_hp_per_pod"]),
+        "pods_without_pump_power": unknown_pump.astype(np.float64),
+        "air_chiller_load": results["q_ac_per_pod"],
+        "liquid_chiller_load": np.where(liquid_to_chiller, results["liquid_cooling_capacity_per_pod"], 0.0),
+    }
+    return {field: per_pod[field] * counts for field in ROLLUP_FIELDS}
+
+
+def _group_sums(groups, values, size):
+    # Sum of values per group code 0..size-1 (float even when there are no values)
+    return np.bincount(groups, values, minlength=size).astype(np.float64, copy=False)
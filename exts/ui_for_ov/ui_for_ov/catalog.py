@@ -0,0 +1,132 @@
+"""Indexed catalog of CRAH/AHU and CDU models.
+
+:class:`EquipmentCatalog` holds the rows of ``Equipment.csv`` (see :func:`ui_for_ov.data.load_equipment_catalog`)
+and answers selection queries without scanning them:
+
+* models are looked up by name in a dict;
+* for each kind (and for all kinds together) every numeric field of :data:`RANGE_FIELDS` has a sorted index,
+  so a range such as ``capacity=(200, None)`` is two :mod:`bisect` calls. A query with several ranges only
+  checks the rows of its narrowest range against the others.
+
+A row without a value for a field (e.g. no known price) never matches a range on that field.
+"""
+import bisect
+from collections import namedtuple
+
+CRAH = "CRAH"
+CDU = "CDU"
+KINDS = (CRAH, CDU)
+
+Equipment = namedtuple(
+    "Equipment",
+    ["kind", "vendor", "model", "capacity", "inlet_temp", "outlet_temp", "flow_rate", "airflow", "power", "price",
+     "pump_curve"],
+)
+Equipment.__doc__ = """One model: capacity (kW), water temperatures (°C), primary flow rate (LPM), airflow (CFM),
+power (kW), price ($) and, for CDUs with a known pump, its PQ curve as a dict of ``a``, ``b``, ``c``."""
+
+# Fields with a range index
+RANGE_FIELDS = ("capacity", "flow_rate", "airflow", "power", "price")
+
+
+class EquipmentCatalog:
+    """Equipment models indexed by name and by the ranges of :data:`RANGE_FIELDS`."""
+
+    def __init__(self, items):
+        self._items = list(items)
+        self._by_model = {}
+        for item in self._items:
+            if item.model in self._by_model:
+                raise ValueError(f"Duplicate equipment model '{item.model}'")
+            self._by_model[item.model] = item
+        self._by_kind = {None: list(range(len(self._items)))}
+        for position, item in enumerate(self._items):
+            self._by_kind.setdefault(item.kind, []).append(position)
+        # (kind, field) -> (sorted values, catalog positions in the same order)
+        self._indexes = {}
+        for kind, positions in self._by_kind.items():
+            for field in RANGE_FIELDS:
+                pairs = sorted(
+                    (getattr(self._items[position], field), position)
+                    for position in positions
+                    if getattr(self._items[position], field) is not None
+                )
+                self._indexes[kind, field] = ([value for value, _ in pairs], [position for _, position in pairs])
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a catalog from row dicts of the :class:`Equipment` fields, with the pump curve given as
+        ``pump_a``, ``pump_b`` and ``pump_c`` (all None when unknown)."""
+        items = []
+        for row in rows:
+            coefficients = (row.get("pump_a"), row.get("pump_b"), row.get("pump_c"))
+            pump_curve = dict(zip("abc", coefficients)) if None not in coefficients else None
+            fields = {field: row.get(field) for field in Equipment._fields if field != "pump_curve"}
+            items.append(Equipment(pump_curve=pump_curve, **fields))
+        return cls(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, model):
+        return model in self._by_model
+
+    def __getitem__(self, model):
+        """The :class:`Equipment` of a model; KeyError if unknown."""
+        try:
+            return self._by_model[model]
+        except KeyError:
+            raise KeyError(f"Unknown equipment model '{model}'") from None
+
+    def get(self, model, default=None):
+        return self._by_model.get(model, default)
+
+    def models(self, kind=None):
+        """Model names of one kind (all kinds for None), in catalog order."""
+        return [self._items[position].model for position in self._by_kind.get(kind, ())]
+
+    def query(self, kind=None, **ranges):
+        """Models of ``kind`` (all kinds for None) with every given field within its range.
+
+        Ranges are given as ``field=(low, high)``, both inclusive; None leaves that end open. For example
+        ``query(CRAH, capacity=(200, None), price=(None, 80000))``.
+
+        Returns:
+            list of :class:`Equipment`, in catalog order.
+        """
+        for field in ranges:
+            if field not in RANGE_FIELDS:
+                raise ValueError(f"Cannot query equipment by '{field}', expected one of {RANGE_FIELDS}")
+        if kind is not None and kind not in self._by_kind:
+            return []
+        if not ranges:
+            return [self._items[position] for position in self._by_kind[kind]]
+
+        spans = []
+        for field, (low, high) in ranges.items():
+            values, positions = self._indexes[kind, field]
+            start = 0 if low is None else bisect.bisect_left(values, low)
+            stop = len(values) if high is None else bisect.bisect_right(values, high)
+            spans.append((stop - start, field, positions[start:stop]))
+        # Only the rows of the narrowest range are checked against the other ranges
+        spans.sort(key=lambda span: span[0])
+        candidates = spans[0][2]
+        others = [(other, ranges[other]) for _, other, _ in spans[1:]]
+        matches = [
+            position for position in candidates
+            if all(_within(getattr(self._items[position], other), bounds) for other, bounds in others)
+        ]
+        return [self._items[position] for position in sorted(matches)]
+
+    def cheapest(self, kind=None, **ranges):
+        """The lowest priced model of :meth:`query`, or None if no priced model matches."""
+        priced = [item for item in self.query(kind, **ranges) if item.price is not None]
+        return min(priced, key=lambda item: item.price) if priced else None
+
+
+def _within(value, bounds):
+    low, high = bounds
+    return value is not None and (low is None or value >= low) and (high is None or value <= high)
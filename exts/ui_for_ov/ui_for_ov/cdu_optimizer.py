@@ -0,0 +1,195 @@
+"""CDU model, count and redundancy selection.
+
+:func:`ui_for_ov.engine.calculate_cdus` always sizes XDU1350 units with one spare. The optimizer here
+searches every CDU of the equipment catalog and every count up to ``max_count`` for the cheapest
+configuration that covers a pod's liquid cooling capacity and secondary flow with at least ``redundancy``
+spare units (N + redundancy); ties go to the least installed capacity. It works on arrays of pods at once, so
+a whole hall is optimized in one call.
+
+Objectives:
+
+* ``"count"``: fewest CDUs.
+* ``"cost"``: lowest total price, from a ``costs`` dict of model -> unit price, or the catalog prices. The
+  shipped ``docs/Equipment.csv`` has no CDU prices, so with it ``costs`` is required.
+* ``"pump_power"``: lowest total pump power (count x HP2, :mod:`ui_for_ov.pumps`, each model at its own
+  pump curve and rated power). Only models with both in the catalog and pods with a system curve qualify.
+
+Infeasible branches are pruned before anything is evaluated: a model whose ``max_count`` units cannot carry
+a pod is dropped for it, and counts below N + redundancy are never scored.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import catalog, engine, pumps
+
+MAX_CDUS_PER_POD = 16
+
+OBJECTIVES = ("count", "cost", "pump_power")
+
+CduConfiguration = namedtuple("CduConfiguration", ["model", "count", "redundancy", "objective"])
+
+
+def required_cdus(liquid_cooling_capacity, liquid_flow_rate, nominal_capacity):
+    """N, the CDUs needed without redundancy, to carry the capacity (kW) and secondary flow (LPM)."""
+    by_capacity = np.ceil(np.asarray(liquid_cooling_capacity, dtype=np.float64) / nominal_capacity)
+    by_flow = np.ceil(np.asarray(liquid_flow_rate, dtype=np.float64) / engine.MAX_SECONDARY_FLOW_RATE_CDU)
+    return np.maximum(np.maximum(by_capacity, by_flow), 1).astype(np.int64)
+
+
+def optimize(
+    liquid_cooling_capacity,
+    liquid_flow_rate,
+    pod_types=None,
+    redundancy=1,
+    objective="count",
+    costs=None,
+    models=None,
+    max_count=MAX_CDUS_PER_POD,
+    weights=None,
+    same_model=False,
+):
+    """Cheapest CDU configuration per pod.
+
+    Args:
+        liquid_cooling_capacity, liquid_flow_rate: Per pod arrays (kW, LPM).
+        pod_types: Per pod types; needed for the ``"pump_power"`` objective (system curves).
+        redundancy: Spare CDUs required on top of N.
+        objective: One of :data:`OBJECTIVES`.
+        costs: dict of model -> unit price for ``"cost"``, over the catalog prices; required with the shipped
+            catalog, which prices no CDU.
+        models: CDU models to consider; defaults to every CDU of :func:`ui_for_ov.engine.equipment_catalog`.
+        max_count: Most CDUs per pod.
+        weights: Per pod multiplicity (e.g. number of pods of that kind) used for hall totals.
+        same_model: Use one model for every pod, the one with the lowest weighted total.
+
+    Returns:
+        dict with per pod arrays ``model`` (object, None when infeasible), ``count``, ``redundancy`` and
+        ``objective`` (NaN when infeasible), plus ``total``, the weighted sum of ``objective``, and
+        ``infeasible``, the weighted count of infeasible pods. ``total`` is inf when a pod with a nonzero weight
+        is infeasible, so a partly served hall never ranks as cheaper than a complete one.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}', expected one of {OBJECTIVES}")
+    capacity, flow = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(liquid_cooling_capacity, dtype=np.float64)),
+        np.atleast_1d(np.asarray(liquid_flow_rate, dtype=np.float64)),
+    )
+    weights = np.broadcast_to(np.asarray(1.0 if weights is None else weights, dtype=np.float64), capacity.shape)
+    equipment = engine.equipment_catalog()
+    models, costs = _candidate_models(equipment, models, objective, costs)
+    if objective == "cost" and not models:
+        raise ValueError("The 'cost' objective needs unit costs per model")
+
+    # Score every candidate model: best feasible count and its objective per pod (inf when infeasible)
+    scores = []
+    for model in models:
+        nominal = equipment[model].capacity
+        minimum = required_cdus(capacity, flow, nominal) + redundancy
+        feasible = minimum <= max_count
+        if not feasible.any() or (same_model and not feasible.all()):
+            continue  # pruned: this model cannot serve (all) the pods
+        count, value = _best_count(
+            equipment[model], minimum, feasible, capacity, flow, pod_types, objective, costs, max_count
+        )
+        scores.append((model, minimum - redundancy, count, value))
+
+    result = {
+        "model": np.full(capacity.shape, None, dtype=object),
+        "count": np.zeros(capacity.shape, dtype=np.int64),
+        "redundancy": np.zeros(capacity.shape, dtype=np.int64),
+        "objective": np.full(capacity.shape, np.nan),
+    }
+    if same_model:
+        totals = [np.sum(value * weights) for *_, value in scores]
+        scores = [scores[int(np.argmin(totals))]] if scores and np.isfinite(min(totals)) else []
+    best = np.full(capacity.shape, np.inf)
+    best_installed = np.full(capacity.shape, np.inf)
+    for model, needed, count, value in scores:
+        # Ties go to the least installed capacity
+        installed = count * equipment[model].capacity
+        better = (value < best) | ((value == best) & np.isfinite(value) & (installed < best_installed))
+        best = np.where(better, value, best)
+        best_installed = np.where(better, installed, best_installed)
+        result["model"][better] = model
+        result["count"][better] = count[better]
+        result["redundancy"][better] = (count - needed)[better]
+    found = np.isfinite(best)
+    result["objective"][found] = best[found]
+    return _add_total(result, weights)
+
+
+def optimize_pod(pod_type, tcs_liquid_temp, **kwargs):
+    """Cheapest :class:`CduConfiguration` for one pod, or None. Keyword arguments as for :func:`optimize`."""
+    result = optimize(
+        engine.calculate_total_liquid_cooling_capacity(pod_type),
+        engine.calculate_liquid_flow_rate_per_pod(pod_type, tcs_liquid_temp),
+        pod_types=[pod_type],
+        **kwargs,
+    )
+    if result["model"][0] is None:
+        return None
+    return CduConfiguration(
+        result["model"][0], int(result["count"][0]), int(result["redundancy"][0]), float(result["objective"][0])
+    )
+
+
+def optimize_hall(scenarios, **kwargs):
+    """Optimize the CDUs of every pod of a hall.
+
+    Args:
+        scenarios: :class:`ui_for_ov.engine.Scenario` s; ``num_pods`` weighs each in the hall total.
+        kwargs: As for :func:`optimize`, e.g. ``same_model=True`` to standardize on one model.
+    """
+    scenarios = list(scenarios)
+    pod_types = np.array([scenario.pod_type for scenario in scenarios], dtype=object)
+    return optimize(
+        [engine.calculate_total_liquid_cooling_capacity(scenario.pod_type) for scenario in scenarios],
+        [engine.calculate_liquid_flow_rate_per_pod(s.pod_type, s.tcs_liquid_temp) for s in scenarios],
+        pod_types=pod_types,
+        weights=[scenario.num_pods for scenario in scenarios],
+        **kwargs,
+    )
+
+
+def _candidate_models(equipment, models, objective, costs):
+    # CDUs that can be scored for the objective, and the unit prices of the "cost" objective
+    models = list(models if models is not None else equipment.models(catalog.CDU))
+    if objective == "pump_power":
+        models = [model for model in models if equipment[model].pump_curve is not None and equipment[model].power]
+    if objective != "cost":
+        return models, None
+    prices = {model: equipment[model].price for model in models if equipment[model].price is not None}
+    prices.update(costs or {})
+    return [model for model in models if model in prices], prices
+
+
+def _best_count(cdu, minimum, feasible, capacity, flow, pod_types, objective, costs, max_count):
+    if objective == "count":
+        return minimum, np.where(feasible, minimum, np.inf)
+    if objective == "cost":
+        # Price grows with the count, so the smallest feasible count is the cheapest
+        return minimum, np.where(feasible, minimum * costs[cdu.model], np.inf)
+
+    # Pump power is not monotonic in the count (flow per CDU drops), so score every feasible count
+    if pod_types is None:
+        raise ValueError("The 'pump_power' objective needs pod_types for the system curves")
+    counts = np.arange(1, max_count + 1)
+    pod_types = np.broadcast_to(np.asarray(pod_types, dtype=object), capacity.shape)
+    grid_pods = np.repeat(pod_types[:, None], len(counts), axis=1)
+    grid_counts = np.broadcast_to(counts, grid_pods.shape)
+    a, b, c = pumps.system_curves(grid_pods, grid_counts)
+    hp2 = pumps.solve(a, b, c, flow[:, None] / grid_counts, cdu)["hp2"]
+    total_power = np.where((grid_counts >= minimum[:, None]) & np.isfinite(hp2), hp2 * grid_counts, np.inf)
+    best = np.argmin(total_power, axis=1)
+    value = total_power[np.arange(len(best)), best]
+    return counts[best], value
+
+
+def _add_total(result, weights):
+    # Weighted total of the pods' objective; inf when a weighted pod has no feasible configuration
+    found = np.isfinite(result["objective"])
+    missing = ~found & (weights > 0)
+    result["infeasible"] = float(np.sum(weights[missing]))
+    result["total"] = np.inf if missing.any() else float(np.sum(result["objective"][found] * weights[found]))
+    return result
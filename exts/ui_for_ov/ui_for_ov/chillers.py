@@ -0,0 +1,220 @@
+"""Indexed chiller performance table.
+
+Chillers.csv rows are keyed by (model, TWOUT, TA). :class:`ChillerTable` builds a hash index over those keys
+once so a scalar lookup is a single dict access, and lazily lays each model out as a dense
+(TWOUT x TA) grid so arrays of keys are resolved with one search per axis and a single gather.
+
+Exact keys only exist at the rated points. :class:`ChillerSurface` interpolates a model's grid bilinearly
+so the performance is defined for any continuous (TWOUT, TA), e.g. hourly weather or smooth sweeps.
+"""
+from collections import namedtuple
+
+ChillerPerformance = namedtuple(
+    "ChillerPerformance", ["capacity", "power_input", "flow", "pressure_drop", "evaporator"]
+)
+
+PERFORMANCE_FIELDS = ChillerPerformance._fields
+
+
+class ChillerTable:
+    """Chiller performance rows indexed by (model, TWOUT, TA).
+
+    Args:
+        model, twout, ta: Key columns. TWOUT and TA are numeric.
+        capacity, power_input, flow, pressure_drop, evaporator: Performance columns. Missing values
+            are None.
+    """
+
+    def __init__(self, model, twout, ta, capacity, power_input, flow, pressure_drop, evaporator):
+        self._index = {}
+        columns = zip(capacity, power_input, flow, pressure_drop, evaporator)
+        for key_model, key_twout, key_ta, values in zip(model, twout, ta, columns):
+            key = (key_model, float(key_twout), float(key_ta))
+            # First row wins, like the boolean mask + iloc[0] this replaces
+            self._index.setdefault(key, ChillerPerformance(*(_missing_to_none(v) for v in values)))
+        self._grids = {}
+        self._surfaces = {}
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a table from row dicts as returned by :func:`ui_for_ov.data.read_chillers`."""
+        fields = ("model", "twout", "ta") + PERFORMANCE_FIELDS
+        return cls(*([row[field] for row in rows] for field in fields))
+
+    @property
+    def models(self):
+        return sorted({model for model, _, _ in self._index})
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, model, twout, ta):
+        """Return the :class:`ChillerPerformance` for an exact key, or None."""
+        return self._index.get((model, twout, ta))
+
+    def evaporator_rise(self, model, twout, ta):
+        """Return the evaporator temperature rise for an exact key, or None."""
+        performance = self._index.get((model, twout, ta))
+        return performance.evaporator if performance is not None else None
+
+    def lookup_many(self, model, twout, ta):
+        """Resolve arrays of (TWOUT, TA) keys for one model.
+
+        Returns:
+            dict of performance field -> float array shaped like the broadcast keys. Keys without a
+            row, and missing values, are NaN.
+        """
+        import numpy as np
+
+        twout, ta = np.broadcast_arrays(np.asarray(twout, dtype=np.float64), np.asarray(ta, dtype=np.float64))
+        grid = self._grid(model)
+        if grid is None:
+            return {field: np.full(twout.shape, np.nan) for field in PERFORMANCE_FIELDS}
+        twout_values, ta_values, values = grid
+
+        # Map each key to its grid cell; keys that fall between or outside grid points get the NaN row
+        twout_index = np.searchsorted(twout_values, twout).clip(0, len(twout_values) - 1)
+        ta_index = np.searchsorted(ta_values, ta).clip(0, len(ta_values) - 1)
+        found = (twout_values[twout_index] == twout) & (ta_values[ta_index] == ta)
+        cells = np.where(found, twout_index * len(ta_values) + ta_index, values.shape[0] - 1)
+        rows = values[cells]
+        return {field: rows[..., i] for i, field in enumerate(PERFORMANCE_FIELDS)}
+
+    def surface(self, model):
+        """Return the :class:`ChillerSurface` of a model, or None for an unknown model. Built once per model."""
+        if model not in self._surfaces:
+            grid = self._grid(model)
+            self._surfaces[model] = None if grid is None else ChillerSurface(*grid)
+        return self._surfaces[model]
+
+    def interpolate(self, model, twout, ta):
+        """Interpolated performance of one model at arrays of continuous (TWOUT, TA).
+
+        Returns:
+            dict of performance field -> float array shaped like the broadcast inputs; NaN for an unknown
+            model. See :meth:`ChillerSurface.evaluate`.
+        """
+        surface = self.surface(model)
+        if surface is None:
+            import numpy as np
+
+            shape = np.broadcast(np.asarray(twout), np.asarray(ta)).shape
+            return {field: np.full(shape, np.nan) for field in PERFORMANCE_FIELDS}
+        return surface.evaluate(twout, ta)
+
+    def _grid(self, model):
+        # Dense (TWOUT x TA) layout of one model, flattened with a trailing all-NaN row for misses
+        if model not in self._grids:
+            import numpy as np
+
+            keys = [(twout, ta) for key_model, twout, ta in self._index if key_model == model]
+            if not keys:
+                self._grids[model] = None
+                return None
+            twout_values = np.array(sorted({twout for twout, _ in keys}))
+            ta_values = np.array(sorted({ta for _, ta in keys}))
+            values = np.full((len(twout_values) * len(ta_values) + 1, len(PERFORMANCE_FIELDS)), np.nan)
+            twout_position = {value: i for i, value in enumerate(twout_values.tolist())}
+            ta_position = {value: i for i, value in enumerate(ta_values.tolist())}
+            for twout, ta in keys:
+                cell = twout_position[twout] * len(ta_values) + ta_position[ta]
+                values[cell] = [np.nan if v is None else v for v in self._index[(model, twout, ta)]]
+            self._grids[model] = (twout_values, ta_values, values)
+        return self._grids[model]
+
+
+class ChillerSurface:
+    """Bilinear interpolation of one chiller model's performance over (TWOUT, TA).
+
+    Args:
+        twout_values, ta_values: Sorted grid axes.
+        values: Grid values, ``(len(twout_values) * len(ta_values) + 1, fields)`` as laid out by
+            :class:`ChillerTable` (the trailing row is ignored). Missing values are NaN.
+    """
+
+    def __init__(self, twout_values, ta_values, values):
+        import numpy as np
+
+        self.twout_values = twout_values
+        self.ta_values = ta_values
+        # One flat (TWOUT-major) array per field, and whether the field has missing grid points
+        self._columns = {field: values[:-1, i].copy() for i, field in enumerate(PERFORMANCE_FIELDS)}
+        self._missing = {field: bool(np.isnan(column).any()) for field, column in self._columns.items()}
+
+    @property
+    def bounds(self):
+        """((TWOUT min, TWOUT max), (TA min, TA max)) of the rated grid."""
+        return (
+            (float(self.twout_values[0]), float(self.twout_values[-1])),
+            (float(self.ta_values[0]), float(self.ta_values[-1])),
+        )
+
+    def evaluate(self, twout, ta, clip=True, fields=PERFORMANCE_FIELDS):
+        """Interpolate performance fields at arrays of (TWOUT, TA).
+
+        Args:
+            twout, ta: Leaving water and ambient temperatures, broadcast against each other.
+            clip: Hold the edge values outside the rated grid; otherwise points outside it are NaN.
+            fields: Performance fields to interpolate.
+
+        Returns:
+            dict of performance field -> float array shaped like the broadcast inputs. A field is NaN
+            where a grid point it depends on is missing.
+        """
+        import numpy as np
+
+        # Bracket each axis before broadcasting: a scalar TWOUT against an hourly TA is searched once
+        twout = np.asarray(twout, dtype=np.float64)
+        ta = np.asarray(ta, dtype=np.float64)
+        twout_low, twout_high, twout_weight, twout_inside = _bracket(self.twout_values, twout)
+        ta_low, ta_high, ta_weight, ta_inside = _bracket(self.ta_values, ta)
+        # Flat indices of the four corners of each point's cell, with their weights
+        columns = len(self.ta_values)
+        corners = (
+            (twout_low * columns + ta_low, (1 - twout_weight) * (1 - ta_weight)),
+            (twout_low * columns + ta_high, (1 - twout_weight) * ta_weight),
+            (twout_high * columns + ta_low, twout_weight * (1 - ta_weight)),
+            (twout_high * columns + ta_high, twout_weight * ta_weight),
+        )
+        invalid = np.isnan(twout) | np.isnan(ta)
+        if not clip:
+            invalid = invalid | ~(twout_inside & ta_inside)
+        results = {}
+        for field in fields:
+            values = self._columns[field]
+            if self._missing[field]:
+                # A corner with no weight must not spread its NaN (a missing value) to the result
+                result = sum(np.where(weight > 0, weight * values[index], 0) for index, weight in corners)
+            else:
+                result = sum(weight * values[index] for index, weight in corners)
+            results[field] = np.where(invalid, np.nan, result)
+        return results
+
+    def performance(self, twout, ta):
+        """Interpolated :class:`ChillerPerformance` at one (TWOUT, TA); missing values are None."""
+        values = self.evaluate(twout, ta)
+        return ChillerPerformance(*(_missing_to_none(float(values[field])) for field in PERFORMANCE_FIELDS))
+
+    def evaporator_rise(self, twout, ta):
+        """Interpolated evaporator temperature rise at one (TWOUT, TA), or None when missing."""
+        return _missing_to_none(float(self.evaluate(twout, ta, fields=("evaporator",))["evaporator"]))
+
+
+def _bracket(axis, values):
+    # Grid points below and above each value, the weight of the upper one, and whether it lies on the grid
+    import numpy as np
+
+    inside = (values >= axis[0]) & (values <= axis[-1])
+    clipped = values.clip(axis[0], axis[-1])
+    if len(axis) == 1:
+        low = np.zeros(values.shape, dtype=np.intp)
+        return low, low, np.zeros(values.shape), inside
+    low = (np.searchsorted(axis, clipped, side="right") - 1).clip(0, len(axis) - 2)
+    high = low + 1
+    weight = (clipped - axis[low]) / (axis[high] - axis[low])
+    return low, high, weight, inside
+
+
+def _missing_to_none(value):
+    # Snapshot numeric columns (and interpolation) give NaN for missing values; the table uses None like the csv readers
+    return None if value is None or value != value else value
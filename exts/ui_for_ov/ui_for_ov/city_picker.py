@@ -0,0 +1,92 @@
+"""Type-ahead city picker widget.
+
+A text field over a fixed set of result rows: every keystroke runs a :class:`ui_for_ov.stations.StationIndex`
+query, and only the rows in view are drawn. The row buttons are created once and relabelled in place when
+the query changes or the list scrolls, so the widget costs the same with forty stations or a hundred
+thousand.
+"""
+import functools
+
+import omni.ui as ui
+
+
+class CityPicker:
+    """Search field and scrollable match list for picking a climate station.
+
+    Args:
+        index: :class:`ui_for_ov.stations.StationIndex` to query.
+        on_selected: Called with the :class:`ui_for_ov.climate.ClimateRecord` of a clicked match.
+        visible_rows: Number of matches shown at a time.
+        style: Style of the search field and the match rows.
+    """
+
+    def __init__(self, index, on_selected, visible_rows=8, style=None):
+        self._index = index
+        self._on_selected = on_selected
+        self._visible_rows = visible_rows
+        self._matches = index.search("")
+        self._first = 0
+        self.selected_row = None
+
+        with ui.VStack(height=0, spacing=2):
+            self.field = ui.StringField(height=24, style=style or {})
+            with ui.VStack(height=0, spacing=0) as rows_stack:
+                self._rows = [
+                    ui.Button("", height=22, clicked_fn=functools.partial(self._select, slot), style=style or {})
+                    for slot in range(visible_rows)
+                ]
+            with ui.HStack(height=22, spacing=4):
+                self.status_label = ui.Label("")
+                ui.Button("▲", width=30, clicked_fn=lambda: self.scroll(-self._visible_rows))
+                ui.Button("▼", width=30, clicked_fn=lambda: self.scroll(self._visible_rows))
+        rows_stack.set_mouse_wheel_fn(lambda x, y, modifier: self.scroll(-3 if y > 0 else 3))
+
+        self._subscription = self.field.model.add_value_changed_fn(
+            lambda model: self.set_query(model.get_value_as_string())
+        )
+        self._refresh()
+
+    @property
+    def matches(self):
+        """Climate store rows matching the current query, in display order."""
+        return self._matches
+
+    def set_query(self, query):
+        """Show the matches of ``query`` from the top."""
+        self._matches = self._index.search(query)
+        self._first = 0
+        self._refresh()
+
+    def scroll(self, rows):
+        """Move the visible window by ``rows`` matches, staying within the match list."""
+        last = max(len(self._matches) - self._visible_rows, 0)
+        first = min(max(self._first + rows, 0), last)
+        if first != self._first:
+            self._first = first
+            self._refresh()
+
+    def destroy(self):
+        """Stop following the search field."""
+        if self._subscription is not None:
+            self.field.model.remove_value_changed_fn(self._subscription)
+            self._subscription = None
+
+    def _select(self, slot):
+        position = self._first + slot
+        if position >= len(self._matches):
+            return
+        self.selected_row = self._matches[position]
+        self._on_selected(self._index.record(self.selected_row))
+
+    def _refresh(self):
+        window = self._matches[self._first:self._first + self._visible_rows]
+        for slot, button in enumerate(self._rows):
+            if slot < len(window):
+                button.text = self._index.label(window[slot])
+                button.visible = True
+            else:
+                button.visible = False
+        if window:
+            self.status_label.text = f"{self._first + 1}-{self._first + len(window)} of {len(self._matches)}"
+        else:
+            self.status_label.text = "No matches"
@@ -0,0 +1,173 @@
+"""Compact, indexed store of climate stations.
+
+:class:`ClimateStore` keeps the numeric climate columns in typed arrays (8 bytes per value) and the
+Country/State/City text as categorical codes into interned label tables, plus a city -> row index. Looking
+up a station is a dict access and per-station vector reads are gathers, independent of how many stations
+are loaded. A store built from a snapshot reads its columns straight from the mapped file.
+"""
+import sys
+from array import array
+from collections import namedtuple
+
+ClimateRecord = namedtuple(
+    "ClimateRecord",
+    ["region", "country", "state", "city", "dry_bulb", "wet_bulb", "dew_point", "humidity_ratio"],
+)
+
+NUMERIC_COLUMNS = ("region", "dry_bulb", "wet_bulb", "dew_point", "humidity_ratio")
+CATEGORICAL_COLUMNS = ("country", "state", "city")
+
+
+class _Categorical:
+    """Labels stored once (interned), rows stored as codes into the label table."""
+
+    def __init__(self):
+        self.labels = []
+        self.codes = array("I")
+        self._code_of = {}
+
+    def append(self, label):
+        code = self._code_of.get(label)
+        if code is None:
+            code = len(self.labels)
+            self._code_of[label] = code
+            self.labels.append(sys.intern(label) if isinstance(label, str) else label)
+        self.codes.append(code)
+
+    @classmethod
+    def from_codes(cls, labels, codes):
+        """Adopt existing labels and codes (any uint32 buffer) without copying the codes."""
+        categorical = cls()
+        categorical.labels = [sys.intern(label) if isinstance(label, str) else label for label in labels]
+        categorical.codes = codes
+        return categorical
+
+    def __getitem__(self, row):
+        return self.labels[self.codes[row]]
+
+
+class ClimateStore:
+    """Climate stations, one row per station, in load order.
+
+    Args:
+        region, country, state, city, dry_bulb, wet_bulb, dew_point, humidity_ratio: Columns of
+            equal length. Missing numeric values may be None or NaN; a missing state is None. Rows
+            without a city name are skipped.
+    """
+
+    def __init__(self, region, country, state, city, dry_bulb, wet_bulb, dew_point, humidity_ratio):
+        self._numeric = {name: array("d") for name in NUMERIC_COLUMNS}
+        self._categorical = {name: _Categorical() for name in CATEGORICAL_COLUMNS}
+        self._row_of_city = {}
+
+        rows = zip(region, country, state, city, dry_bulb, wet_bulb, dew_point, humidity_ratio)
+        for row_region, row_country, row_state, row_city, *climate in rows:
+            row_city = _clean_label(row_city)
+            if row_city is None:
+                continue
+            # The first station of a duplicated name wins, like the city filter + iloc[0] it replaces
+            self._row_of_city.setdefault(row_city, len(self))
+            for name, value in zip(NUMERIC_COLUMNS, [row_region] + climate):
+                self._numeric[name].append(_to_float(value))
+            self._categorical["country"].append(_clean_label(row_country))
+            self._categorical["state"].append(_clean_label(row_state))
+            self._categorical["city"].append(row_city)
+
+        self._cities = sorted(self._row_of_city)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Build a store from row dicts as returned by :func:`ui_for_ov.data.read_climate`."""
+        return cls(*([row.get(field) for row in rows] for field in ClimateRecord._fields))
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        """Build a store over the columns of a :class:`ui_for_ov.snapshot.Snapshot` without copying them.
+
+        The snapshot holds the rows that :func:`ui_for_ov.data.read_climate` returns, i.e. stations
+        with a city name.
+        """
+        store = cls.__new__(cls)
+        store._numeric = {name: snapshot.numeric(name) for name in NUMERIC_COLUMNS}
+        store._categorical = {
+            name: _Categorical.from_codes(*snapshot.categorical(name)) for name in CATEGORICAL_COLUMNS
+        }
+        city = store._categorical["city"]
+        store._row_of_city = {}
+        for row, code in enumerate(city.codes):
+            store._row_of_city.setdefault(city.labels[code], row)
+        store._cities = sorted(store._row_of_city)
+        return store
+
+    def __len__(self):
+        return len(self._numeric["dry_bulb"])
+
+    def __contains__(self, city):
+        return city in self._row_of_city
+
+    @property
+    def cities(self):
+        """Sorted unique city names."""
+        return self._cities
+
+    def row_of(self, city):
+        """Row index of a city, or None."""
+        return self._row_of_city.get(city)
+
+    def record(self, row):
+        """Return the :class:`ClimateRecord` of a row."""
+        return ClimateRecord(
+            region=self._numeric["region"][row],
+            country=self._categorical["country"][row],
+            state=self._categorical["state"][row],
+            city=self._categorical["city"][row],
+            dry_bulb=self._numeric["dry_bulb"][row],
+            wet_bulb=self._numeric["wet_bulb"][row],
+            dew_point=self._numeric["dew_point"][row],
+            humidity_ratio=self._numeric["humidity_ratio"][row],
+        )
+
+    def get(self, city, default=None):
+        """Return the :class:`ClimateRecord` of a city, or ``default``."""
+        row = self._row_of_city.get(city)
+        return self.record(row) if row is not None else default
+
+    def column(self, name):
+        """Zero-copy float64 NumPy view of a numeric column."""
+        import numpy as np
+
+        return np.frombuffer(self._numeric[name], dtype=np.float64)
+
+    def labels(self, name):
+        """Return ``(labels, codes)`` of a categorical column; codes are a zero-copy uint32 array."""
+        import numpy as np
+
+        categorical = self._categorical[name]
+        return categorical.labels, np.frombuffer(categorical.codes, dtype=np.uint32)
+
+    def rows_of(self, cities):
+        """Row index of each city in an iterable of names, as an int64 array with -1 for unknown cities."""
+        import numpy as np
+
+        cities = list(cities)
+        return np.fromiter((self._row_of_city.get(city, -1) for city in cities), dtype=np.int64, count=len(cities))
+
+    def take(self, name, rows):
+        """Gather a numeric column at row indices, with NaN where the row is -1."""
+        import numpy as np
+
+        rows = np.asarray(rows)
+        values = self.column(name)[rows.clip(0)] if len(self) else np.full(rows.shape, np.nan)
+        return np.where(rows >= 0, values, np.nan)
+
+
+def _clean_label(value):
+    # Blank cells arrive as "" from csv and as NaN from a snapshot's numeric columns (snapshot.write stores None as NaN)
+    if value is None or value != value:
+        return None
+    value = str(value).strip()
+    return value or None
+
+
+def _to_float(value):
+    return float("nan") if value is None else float(value)
@@ -0,0 +1,203 @@
+"""Columnar on-disk store for streamed sweep results.
+
+:class:`ColumnWriter` appends blocks of columns (dicts of equal-length arrays, as yielded by
+:func:`ui_for_ov.batch.evaluate_blocks`) to a directory, so a sweep of any size is written with the memory
+of one block. Two formats:
+
+* ``"npy"`` (default, NumPy only): one ``.npy`` file per column and block, ``<column>/<block>.npy``.
+  Text columns (pod types, cities) are stored as uint32 codes, their labels in ``manifest.json``.
+* ``"arrow"``: a single Arrow IPC stream, ``results.arrow``, one record batch per block. Needs pyarrow.
+
+``manifest.json`` records the columns and the rows of every block, and is rewritten after each block so an
+interrupted sweep stays readable up to its last complete block. :func:`iter_blocks` and
+:func:`read_columns` read either format back; ``.npy`` blocks are memory-mapped.
+"""
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+
+FORMATS = ("npy", "arrow")
+MANIFEST = "manifest.json"
+ARROW_FILE = "results.arrow"
+VERSION = 1
+
+
+class ColumnWriter:
+    """Append column blocks to ``directory``.
+
+    Args:
+        directory: Output directory; created if needed. Must not already hold a result set.
+        format: One of :data:`FORMATS`.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, directory, format="npy"):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format '{format}', expected one of {FORMATS}")
+        self.directory = Path(directory)
+        self.format = format
+        self.rows = 0
+        self._columns = None  # name -> {"dtype", "labels" (text columns)}
+        self._label_codes = {}  # text column -> {label: code}
+        self._blocks = []
+        self._arrow_writer = None
+        self._arrow_sink = None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if (self.directory / MANIFEST).exists():
+            raise FileExistsError(f"{self.directory} already holds results")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, block):
+        """Append a block: dict of column name -> 1-D array, every column of the same length."""
+        lengths = {len(values) for values in block.values()}
+        if len(lengths) != 1:
+            raise ValueError("Columns of a block must have the same length")
+        if self._columns is None:
+            self._columns = {name: self._describe(np.asarray(values)) for name, values in block.items()}
+        elif list(block) != list(self._columns):
+            raise ValueError("Blocks must have the same columns in the same order")
+        if self.format == "npy":
+            self._write_npy(block)
+        else:
+            self._write_arrow(block)
+        self._blocks.append(lengths.pop())
+        self.rows += self._blocks[-1]
+        self._write_manifest()
+
+    def write_all(self, blocks):
+        """Append every block of an iterable; returns the total number of rows."""
+        for block in blocks:
+            self.write(block)
+        return self.rows
+
+    def close(self):
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+            self._arrow_sink.close()
+            self._arrow_writer = self._arrow_sink = None
+        self._write_manifest()
+
+    def _describe(self, values):
+        if values.dtype.kind in "OU":
+            return {"dtype": "text", "labels": []}
+        return {"dtype": values.dtype.str}
+
+    def _codes(self, name, values):
+        # Text column -> uint32 codes, growing the column's label list
+        labels = self._columns[name]["labels"]
+        code_of = self._label_codes.setdefault(name, {label: code for code, label in enumerate(labels)})
+        for label in dict.fromkeys(values.tolist()):
+            if label not in code_of:
+                code_of[label] = len(labels)
+                labels.append(label)
+        return np.fromiter(map(code_of.__getitem__, values.tolist()), dtype=np.uint32, count=len(values))
+
+    def _write_npy(self, block):
+        index = len(self._blocks)
+        for name, values in block.items():
+            values = np.asarray(values)
+            if self._columns[name]["dtype"] == "text":
+                values = self._codes(name, values)
+            column_dir = self.directory / name
+            column_dir.mkdir(exist_ok=True)
+            np.save(column_dir / f"{index:06d}.npy", np.ascontiguousarray(values, dtype=values.dtype))
+
+    def _write_arrow(self, block):
+        import pyarrow as pa
+
+        arrays = {}
+        for name, values in block.items():
+            values = np.asarray(values)
+            if values.dtype.kind in "OU":
+                arrays[name] = pa.array(values.tolist(), type=pa.string())
+            else:
+                arrays[name] = pa.array(values)
+        batch = pa.RecordBatch.from_pydict(arrays)
+        if self._arrow_writer is None:
+            self._arrow_sink = pa.OSFile(str(self.directory / ARROW_FILE), "wb")
+            self._arrow_writer = pa.ipc.new_stream(self._arrow_sink, batch.schema)
+        self._arrow_writer.write_batch(batch)
+
+    def _write_manifest(self):
+        manifest = {
+            "version": VERSION,
+            "format": self.format,
+            "columns": self._columns or {},
+            "blocks": self._blocks,
+            "rows": self.rows,
+        }
+        path = self.directory / MANIFEST
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(manifest), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+def write_blocks(blocks, directory, format="npy"):
+    """Write every block of an iterable to ``directory``; returns the number of rows."""
+    with ColumnWriter(directory, format) as writer:
+        return writer.write_all(blocks)
+
+
+def read_manifest(directory):
+    with open(Path(directory) / MANIFEST, encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != VERSION:
+        raise ValueError(f"Unsupported result set version {manifest.get('version')}")
+    return manifest
+
+
+def iter_blocks(directory, columns=None):
+    """Yield the stored blocks as dicts of arrays; ``columns`` selects a subset.
+
+    Text columns come back as object arrays of labels, numeric ``.npy`` columns as read-only memory maps.
+    """
+    directory = Path(directory)
+    manifest = read_manifest(directory)
+    names = list(columns if columns is not None else manifest["columns"])
+    if manifest["format"] == "arrow":
+        yield from _iter_arrow_blocks(directory, names, len(manifest["blocks"]))
+        return
+    labels = {
+        name: np.asarray(manifest["columns"][name]["labels"], dtype=object)
+        for name in names
+        if manifest["columns"][name]["dtype"] == "text"
+    }
+    for index in range(len(manifest["blocks"])):
+        block = {}
+        for name in names:
+            values = np.load(directory / name / f"{index:06d}.npy", mmap_mode="r")
+            block[name] = labels[name][values] if name in labels else values
+        yield block
+
+
+def _iter_arrow_blocks(directory, names, count):
+    import pyarrow as pa
+
+    with pa.memory_map(str(directory / ARROW_FILE), "r") as source:
+        # Stream format: batches written before an interruption stay readable
+        reader = pa.ipc.open_stream(source)
+        for _, batch in zip(range(count), reader):
+            block = {}
+            for name in names:
+                column = batch.column(batch.schema.get_field_index(name))
+                if pa.types.is_string(column.type):
+                    block[name] = np.asarray(column.to_pylist(), dtype=object)
+                else:
+                    block[name] = column.to_numpy(zero_copy_only=False)
+            yield block
+
+
+def read_columns(directory, columns=None):
+    """Read whole columns into memory: dict of column name -> concatenated array."""
+    blocks = list(iter_blocks(directory, columns))
+    if not blocks:
+        return {name: np.empty(0) for name in (columns or read_manifest(directory)["columns"])}
+    return {name: np.concatenate([block[name] for block in blocks]) for name in blocks[0]}
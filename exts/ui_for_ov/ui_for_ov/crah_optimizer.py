@@ -0,0 +1,197 @@
+"""CRAH model and count selection.
+
+:func:`ui_for_ov.engine.calculate_no_of_crahs` rounds a pod's air cooling capacity up to whole PW170 units.
+The optimizer here considers every CRAH of the equipment catalog (:func:`ui_for_ov.engine.equipment_catalog`)
+and every count up to ``max_count``, and picks per pod the configuration with the lowest objective that
+
+* carries the pod's air cooling capacity and required airflow (:func:`ui_for_ov.engine.calculate_airflow_rate_per_pod`)
+  with ``redundancy`` units out of service, no fan running above its rated airflow, and
+* does not slow the fans below ``min_speed`` of their rated airflow when all units share the airflow.
+
+All units of a pod run at the same part speed, so by the cubic fan affinity law ``n`` units of a model rated
+CFM1 / HP1 draw ``n * HP1 * (airflow / (n * CFM1)) ** 3`` (see :func:`fan_power`).
+
+Objectives:
+
+* ``"fan_power"``: lowest total fan power (kW). The airflow is constant, so this is also the lowest energy.
+* ``"cost"``: lowest total price, from a ``costs`` dict of model -> unit price, or the catalog prices.
+* ``"count"``: fewest CRAHs.
+
+Fan power falls with every unit added while price and count grow, so the best count of a model is an end of
+its feasible range: the most units for ``"fan_power"``, the fewest otherwise. Each model is scored for all pods
+at once from those two ends, a (models, pods) array, and ties go to the lower fan power (to the fewer units
+for ``"fan_power"``).
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import catalog, engine
+
+MAX_CRAHS_PER_POD = 32
+# Slowest fan speed, as a fraction of the rated airflow, a CRAH is run at
+MIN_FAN_SPEED = 0.3
+
+OBJECTIVES = ("fan_power", "cost", "count")
+
+CrahConfiguration = namedtuple("CrahConfiguration", ["model", "count", "redundancy", "speed", "fan_power", "objective"])
+
+
+def fan_power(required_airflow, count, rated_airflow, rated_power):
+    """Total fan power (kW) of ``count`` CRAHs sharing the required airflow (CFM), by the cubic affinity law."""
+    speed = np.asarray(required_airflow, dtype=np.float64) / (count * rated_airflow)
+    return count * rated_power * speed ** 3
+
+
+def optimize(
+    air_cooling_capacity,
+    required_airflow,
+    redundancy=0,
+    objective="fan_power",
+    costs=None,
+    models=None,
+    max_count=MAX_CRAHS_PER_POD,
+    min_speed=MIN_FAN_SPEED,
+    weights=None,
+    same_model=False,
+):
+    """Best CRAH configuration per pod.
+
+    Args:
+        air_cooling_capacity, required_airflow: Per pod arrays (kW, CFM).
+        redundancy: Spare CRAHs required on top of N.
+        objective: One of :data:`OBJECTIVES`.
+        costs: dict of model -> unit price for ``"cost"``; defaults to the catalog prices.
+        models: CRAH models to consider; defaults to every CRAH of the catalog with a rated airflow and power.
+        max_count: Most CRAHs per pod.
+        min_speed: Slowest fan speed as a fraction of the rated airflow; 0 for no limit.
+        weights: Per pod multiplicity (e.g. number of pods of that kind) used for hall totals.
+        same_model: Use one model for every pod, the one with the lowest weighted total.
+
+    Returns:
+        dict with per pod arrays ``model`` (object, None when infeasible), ``count``, ``redundancy``,
+        ``speed`` (fraction of the rated airflow), ``fan_power`` (kW) and ``objective`` (NaN when
+        infeasible), plus ``total``, the weighted sum of ``objective``, and
+        ``infeasible``, the weighted count of infeasible pods. ``total`` is inf when a pod with a nonzero weight
+        is infeasible, so a partly served hall never ranks as cheaper than a complete one.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}', expected one of {OBJECTIVES}")
+    capacity, airflow = np.broadcast_arrays(
+        np.atleast_1d(np.asarray(air_cooling_capacity, dtype=np.float64)),
+        np.atleast_1d(np.asarray(required_airflow, dtype=np.float64)),
+    )
+    weights = np.broadcast_to(np.asarray(1.0 if weights is None else weights, dtype=np.float64), capacity.shape)
+    units, unit_costs = _candidates(engine.equipment_catalog(), models, objective, costs)
+    if objective == "cost" and not units:
+        raise ValueError("The 'cost' objective needs unit costs per model")
+
+    result = {
+        "model": np.full(capacity.shape, None, dtype=object),
+        "count": np.zeros(capacity.shape, dtype=np.int64),
+        "redundancy": np.zeros(capacity.shape, dtype=np.int64),
+        "speed": np.full(capacity.shape, np.nan),
+        "fan_power": np.full(capacity.shape, np.nan),
+        "objective": np.full(capacity.shape, np.nan),
+    }
+    if not units:
+        return _add_total(result, weights)
+
+    # (models, 1) columns against (pods,) rows: every model scored for every pod at once
+    rated_capacity = np.array([unit.capacity for unit in units], dtype=np.float64)[:, None]
+    rated_airflow = np.array([unit.airflow for unit in units], dtype=np.float64)[:, None]
+    rated_power = np.array([unit.power for unit in units], dtype=np.float64)[:, None]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        needed = np.maximum(np.maximum(np.ceil(capacity / rated_capacity), np.ceil(airflow / rated_airflow)), 1)
+        fewest = needed + redundancy
+        most = np.full(fewest.shape, float(max_count))
+        if min_speed > 0:
+            most = np.minimum(most, np.floor(airflow / (min_speed * rated_airflow)))
+        feasible = fewest <= most  # False for NaN inputs
+
+        count = most if objective == "fan_power" else fewest
+        speed = airflow / (count * rated_airflow)
+        power = fan_power(airflow, count, rated_airflow, rated_power)
+        if objective == "fan_power":
+            value, tie = power, count
+        elif objective == "cost":
+            value, tie = count * np.array(unit_costs, dtype=np.float64)[:, None], power
+        else:
+            value, tie = count, power
+        value = np.where(feasible, value, np.inf)
+
+    pods = np.arange(capacity.size)
+    if same_model:
+        totals = np.sum(value * weights, axis=1)
+        if not np.isfinite(totals.min()):
+            return _add_total(result, weights)
+        choice = np.full(capacity.size, int(np.argmin(totals)))
+    else:
+        best = value.min(axis=0)
+        choice = np.argmin(np.where(value == best, tie, np.inf), axis=0)
+    found = np.isfinite(value[choice, pods])
+
+    names = np.array([unit.model for unit in units], dtype=object)
+    result["model"][found] = names[choice][found]
+    result["count"][found] = count[choice, pods][found]
+    result["redundancy"][found] = (count - needed)[choice, pods][found]
+    result["speed"][found] = speed[choice, pods][found]
+    result["fan_power"][found] = power[choice, pods][found]
+    result["objective"][found] = value[choice, pods][found]
+    return _add_total(result, weights)
+
+
+def optimize_pod(pod_type, air_supply_temp, **kwargs):
+    """Best :class:`CrahConfiguration` for one pod, or None. Keyword arguments as for :func:`optimize`."""
+    result = optimize(
+        engine.calculate_total_air_cooling_capacity(pod_type),
+        engine.calculate_airflow_rate_per_pod(pod_type, air_supply_temp),
+        **kwargs,
+    )
+    if result["model"][0] is None:
+        return None
+    return CrahConfiguration(
+        result["model"][0],
+        int(result["count"][0]),
+        int(result["redundancy"][0]),
+        float(result["speed"][0]),
+        float(result["fan_power"][0]),
+        float(result["objective"][0]),
+    )
+
+
+def optimize_hall(scenarios, **kwargs):
+    """Optimize the CRAHs of every pod of a hall.
+
+    Args:
+        scenarios: :class:`ui_for_ov.engine.Scenario` s; ``num_pods`` weighs each in the hall total.
+        kwargs: As for :func:`optimize`, e.g. ``same_model=True`` to standardize on one model.
+    """
+    scenarios = list(scenarios)
+    return optimize(
+        [engine.calculate_total_air_cooling_capacity(scenario.pod_type) for scenario in scenarios],
+        [engine.calculate_airflow_rate_per_pod(s.pod_type, s.air_supply_temp) for s in scenarios],
+        weights=[scenario.num_pods for scenario in scenarios],
+        **kwargs,
+    )
+
+
+def _candidates(equipment, models, objective, costs):
+    # CRAHs with the ratings the affinity law needs, and their unit costs for the "cost" objective
+    units = [equipment[model] for model in (models if models is not None else equipment.models(catalog.CRAH))]
+    units = [unit for unit in units if unit.capacity and unit.airflow and unit.power is not None]
+    if objective != "cost":
+        return units, None
+    prices = {unit.model: unit.price for unit in units if unit.price is not None}
+    prices.update(costs or {})
+    units = [unit for unit in units if unit.model in prices]
+    return units, [prices[unit.model] for unit in units]
+
+
+def _add_total(result, weights):
+    # Weighted total of the pods' objective; inf when a weighted pod has no feasible configuration
+    found = np.isfinite(result["objective"])
+    missing = ~found & (weights > 0)
+    result["infeasible"] = float(np.sum(weights[missing]))
+    result["total"] = np.inf if missing.any() else float(np.sum(result["objective"][found] * weights[found]))
+    return result
@@ -0,0 +1,159 @@
+"""Loaders for the data tables shipped in the extension's ``docs`` folder.
+
+Paths are resolved relative to the extension root so the same code works on any host. The readers
+only use the standard library, which keeps them usable from :mod:`ui_for_ov.engine` without pandas.
+
+The ``load_*`` functions go through :mod:`ui_for_ov.snapshot`: each CSV is parsed once into a binary
+snapshot under :data:`CACHE_DIR` and mapped from there on later loads.
+"""
+import csv
+import math
+import os
+from pathlib import Path
+
+from . import memo, snapshot
+from .catalog import EquipmentCatalog
+from .chillers import PERFORMANCE_FIELDS, ChillerTable
+from .climate import ClimateStore
+
+EXT_ROOT = Path(__file__).resolve().parent.parent
+DOCS_DIR = EXT_ROOT / "docs"
+CHILLERS_CSV = DOCS_DIR / "Chillers.csv"
+CLIMATE_CSV = DOCS_DIR / "TCO_new.csv"
+EQUIPMENT_CSV = DOCS_DIR / "Equipment.csv"
+
+# Where compiled snapshots of the CSVs are kept; override with UI_FOR_OV_CACHE_DIR
+CACHE_DIR = Path(os.environ.get("UI_FOR_OV_CACHE_DIR") or Path.home() / ".cache" / "ui_for_ov")
+
+# Chillers.csv header -> canonical field name
+CHILLER_COLUMNS = {
+    "Model": "model",
+    "TWOUT": "twout",
+    "TA ": "ta",
+    "Cooling Cpacity": "capacity",
+    "Power Input": "power_input",
+    "Fluid Flow rate  (l/s)": "flow",
+    "Fluid Pressure Drop (kPa)": "pressure_drop",
+    "Evaporator": "evaporator",
+}
+
+# TCO_new.csv columns, in file order
+CLIMATE_COLUMNS = ["region", "country", "state", "city", "dry_bulb", "wet_bulb", "dew_point", "humidity_ratio"]
+CLIMATE_NUMERIC_COLUMNS = ["dry_bulb", "wet_bulb", "dew_point", "humidity_ratio"]
+
+# Equipment.csv header -> canonical field name (see ui_for_ov.catalog.Equipment)
+EQUIPMENT_COLUMNS = {
+    "Kind": "kind",
+    "Vendor": "vendor",
+    "Model": "model",
+    "Net Total Capacity (kW)": "capacity",
+    "Inlet Water Temperature (°C)": "inlet_temp",
+    "Outlet Water Temperature (°C)": "outlet_temp",
+    "Primary Max Flow Rate (LPM)": "flow_rate",
+    "Air CFM": "airflow",
+    "Total Power (kW)": "power",
+    "Price ($)": "price",
+    "Pump Curve a": "pump_a",
+    "Pump Curve b": "pump_b",
+    "Pump Curve c": "pump_c",
+}
+EQUIPMENT_TEXT_COLUMNS = ("kind", "vendor", "model")
+
+
+def _to_float(value):
+    value = value.strip()
+    return float(value) if value else None
+
+
+def read_chillers(path=CHILLERS_CSV):
+    """Read Chillers.csv into a list of row dicts keyed by the canonical field names."""
+    rows = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for record in csv.DictReader(f):
+            row = {}
+            for column, field in CHILLER_COLUMNS.items():
+                value = record.get(column) or ""
+                row[field] = value.strip() if field == "model" else _to_float(value)
+            rows.append(row)
+    return rows
+
+
+def _chiller_columns(path):
+    rows = read_chillers(path)
+    numeric = {field: [row[field] for row in rows] for field in ("twout", "ta") + PERFORMANCE_FIELDS}
+    return numeric, {"model": [row["model"] for row in rows]}
+
+
+def load_chiller_table(path=CHILLERS_CSV, cache_dir=CACHE_DIR):
+    """Load Chillers.csv, through its snapshot, into an indexed :class:`ui_for_ov.chillers.ChillerTable`."""
+    table = snapshot.load(path, _chiller_columns, cache_dir)
+    memo.invalidate(memo.DATA)
+    return ChillerTable(
+        table.strings("model"),
+        *(table.numeric(field) for field in ("twout", "ta") + PERFORMANCE_FIELDS),
+    )
+
+
+def read_climate(path=CLIMATE_CSV):
+    """Read TCO_new.csv into a list of climate row dicts, in file order. Blank rows are skipped."""
+    rows = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # header
+        for record in reader:
+            row = dict(zip(CLIMATE_COLUMNS, (value.strip() for value in record)))
+            if not row.get("city"):
+                continue
+            for field in CLIMATE_NUMERIC_COLUMNS:
+                row[field] = _to_float(row.get(field, ""))
+            row["region"] = _to_float(row.get("region", ""))
+            row["state"] = row.get("state") or None
+            rows.append(row)
+    return rows
+
+
+def _climate_columns(path):
+    rows = read_climate(path)
+    numeric = {field: [row[field] for row in rows] for field in ["region"] + CLIMATE_NUMERIC_COLUMNS}
+    return numeric, {field: [row[field] for row in rows] for field in ("country", "state", "city")}
+
+
+def load_climate_store(path=CLIMATE_CSV, cache_dir=CACHE_DIR):
+    """Load TCO_new.csv, through its snapshot, into an indexed :class:`ui_for_ov.climate.ClimateStore`."""
+    store = ClimateStore.from_snapshot(snapshot.load(path, _climate_columns, cache_dir))
+    memo.invalidate(memo.DATA)
+    return store
+
+
+def read_equipment(path=EQUIPMENT_CSV):
+    """Read Equipment.csv into a list of row dicts keyed by the canonical field names. Rows without a model are
+    skipped."""
+    rows = []
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        for record in csv.DictReader(f):
+            row = {}
+            for column, field in EQUIPMENT_COLUMNS.items():
+                value = (record.get(column) or "").strip()
+                row[field] = (value or None) if field in EQUIPMENT_TEXT_COLUMNS else _to_float(value)
+            if row["model"]:
+                rows.append(row)
+    return rows
+
+
+def _equipment_columns(path):
+    rows = read_equipment(path)
+    numeric_fields = [field for field in EQUIPMENT_COLUMNS.values() if field not in EQUIPMENT_TEXT_COLUMNS]
+    numeric = {field: [row[field] for row in rows] for field in numeric_fields}
+    return numeric, {field: [row[field] for row in rows] for field in EQUIPMENT_TEXT_COLUMNS}
+
+
+def load_equipment_catalog(path=EQUIPMENT_CSV, cache_dir=CACHE_DIR):
+    """Load Equipment.csv, through its snapshot, into an indexed :class:`ui_for_ov.catalog.EquipmentCatalog`."""
+    table = snapshot.load(path, _equipment_columns, cache_dir)
+    columns = {field: table.strings(field) for field in EQUIPMENT_TEXT_COLUMNS}
+    for field in table.names:
+        if field not in columns:
+            columns[field] = [None if math.isnan(value) else value for value in table.numeric(field)]
+    catalog = EquipmentCatalog.from_rows([dict(zip(columns, values)) for values in zip(*columns.values())])
+    memo.invalidate(memo.DATA)
+    return catalog
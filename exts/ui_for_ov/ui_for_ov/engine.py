@@ -0,0 +1,506 @@
+"""Headless cooling-model engine.
+
+Every quantity shown in the Data Center Configuration window is computed here from plain
+Python values. Nothing in this module imports omni or pandas, so designs can be evaluated
+outside of Kit (scripts, batch jobs, tests) with the same formulas the panel uses.
+
+Functions of the discrete panel inputs are memoized (see :mod:`ui_for_ov.memo`); call
+``memo.invalidate("constants")`` after changing any of the constants below.
+
+CRAH and CDU figures come from the equipment catalog (:func:`equipment_catalog`), ``Equipment.csv`` unless
+replaced with :func:`use_equipment_catalog`.
+"""
+import math
+from collections import namedtuple
+
+from . import memo
+from .memo import CONSTANTS, DATA, memoize
+
+RPM1_PERCENT = 1  # Base RPM percentage for calculations
+
+WATER_RHO_CP = 4193
+
+# Quadratic System Curve coefficients based on pod type and CDUs
+QSC_COEFFICIENTS = {
+    "576 GPU DGX GB200 Super Pod": {
+        1: {"a": 0.00007100, "b": 0.02422900, "c": -0.39533800},
+        2: {"a": 0.0028300, "b": 0.04845800, "c": -0.39533800}
+    },
+    "1152 GPU DGX GB200 Super Pod": {
+        3: {"a": 0.00018600, "b": 0.04140900, "c": -0.55493400},
+        4: {"a": 0.00033000, "b": 0.05521200, "c": -0.55493400}
+    }
+}
+RPM1 = 1  # Pump speed as a fraction of the CDU's rated speed, at which it draws its catalog power
+
+PRIMARY_DELTA_TEMP = 10  # in °C
+MAX_SECONDARY_FLOW_RATE_CDU = 1200  # in LPM
+# Constant for Rho * C Secondary Flow in kJ/(C * m^3)
+RHO_C_SECONDARY_FLOW = 4120  # in kJ/(C * m^3)
+
+# Constants for fixed air flow rates (in CFM) for Management and Network racks
+AIR_FLOW_RATE_MANAGEMENT_RACK = 3900
+AIR_FLOW_RATE_NETWORK_RACK = 3900
+
+# GB200_NVL36 is taken as half an NVL72 rack (36 instead of 72 GPUs, same rack overheads per GPU)
+POWER_PER_RACK = {
+    "GB200_NVL72": 132,
+    "GB200_NVL36": 66,
+    "Management": 30,
+    "Networking": 30
+}
+
+# Air cooling capacity per rack in kW
+AIR_COOLING_CAPACITY_PER_RACK = {
+    "GB200_NVL72": 17.16,
+    "GB200_NVL36": 8.58,
+    "Management": 30,
+    "Networking": 30
+}
+
+# Racks with a fixed air flow (CFM); the air flow of the other racks follows their air cooling capacity
+FIXED_AIR_FLOW_RATE_PER_RACK = {
+    "Management": AIR_FLOW_RATE_MANAGEMENT_RACK,
+    "Networking": AIR_FLOW_RATE_NETWORK_RACK,
+}
+
+# Liquid flow rate correlations are fitted for GB200_NVL72; other racks scale by liquid cooling capacity
+REFERENCE_LIQUID_COOLED_RACK = "GB200_NVL72"
+
+# Rack configuration per pod type; add custom pods with define_pod
+POD_RACK_COUNTS = {
+    "288 GPU DGX GB200 Super Pod": {"GB200_NVL72": 4, "Management": 2, "Networking": 3},
+    "576 GPU DGX GB200 Super Pod": {"GB200_NVL72": 8, "Management": 4, "Networking": 6},
+    "1152 GPU DGX GB200 Super Pod": {"GB200_NVL72": 16, "Management": 8, "Networking": 12}
+}
+
+CDU_TYPES = ["Liquid to Liquid", "Liquid to Air"]
+
+# Chiller model used for the chilled water temperature rise lookup
+CHILLER_MODEL = "Vertiv 1MW"
+
+# Equipment catalog models the pods are sized with
+CRAH_MODEL = "PW170"
+CDU_MODEL = "XDU1350"
+
+_equipment_catalog = None
+
+
+def equipment_catalog():
+    """The :class:`ui_for_ov.catalog.EquipmentCatalog` of the sizing, loaded from Equipment.csv on first use."""
+    global _equipment_catalog
+    if _equipment_catalog is None:
+        from . import data
+
+        _equipment_catalog = data.load_equipment_catalog()
+    return _equipment_catalog
+
+
+def use_equipment_catalog(catalog):
+    """Size with the models of ``catalog`` (an :class:`ui_for_ov.catalog.EquipmentCatalog`) from now on."""
+    global _equipment_catalog
+    _equipment_catalog = catalog
+    memo.invalidate(DATA)
+
+
+class Scenario(namedtuple(
+    "Scenario",
+    "pod_type num_pods air_supply_temp tcs_liquid_temp fws_air_temp fws_liquid_temp cdu_type city",
+    defaults=("288 GPU DGX GB200 Super Pod", 1, 15, 17, 5, 5, "Liquid to Liquid", None),
+)):
+    """One design point, i.e. everything the panel's dropdowns and fields select.
+
+    A namedtuple rather than a dataclass keeps the engine's import cost down; scenarios are
+    immutable and hashable either way.
+    """
+
+    __slots__ = ()
+
+
+def define_pod(pod_type, rack_counts):
+    """Add (or redefine) a pod type as a mix of rack types, e.g. ``{"GB200_NVL36": 8, "Management": 2}``."""
+    unknown = set(rack_counts) - set(POWER_PER_RACK)
+    if unknown:
+        raise KeyError(f"Unknown rack types: {sorted(unknown)}")
+    POD_RACK_COUNTS[pod_type] = dict(rack_counts)
+    memo.invalidate(memo.CONSTANTS)
+
+
+@memoize()
+def calculate_liquid_cooling_capacity(rack_type):
+    # Calculate liquid cooling capacity as the difference between power per rack and air cooling per rack
+    return POWER_PER_RACK[rack_type] - AIR_COOLING_CAPACITY_PER_RACK[rack_type]
+
+
+@memoize()
+def calculate_total_air_cooling_capacity(pod_type):
+    rack_counts = POD_RACK_COUNTS.get(pod_type, {})
+    return sum(AIR_COOLING_CAPACITY_PER_RACK[rack] * count for rack, count in rack_counts.items())
+
+
+@memoize()
+def calculate_total_liquid_cooling_capacity(pod_type):
+    rack_counts = POD_RACK_COUNTS.get(pod_type, {})
+    return sum(calculate_liquid_cooling_capacity(rack) * count for rack, count in rack_counts.items())
+
+
+@memoize()
+def calculate_power_per_pod(pod_type):
+    rack_counts = POD_RACK_COUNTS.get(pod_type, {})
+    return sum(POWER_PER_RACK[rack] * count for rack, count in rack_counts.items())
+
+
+@memoize()
+def calculate_air_flow_rate_per_kw(air_supply_temp):
+    """Required air flow rate per kW (CFM).
+
+    CFM = 0.0054667 * (T^3) - 0.34 * (T^2) + 10.263333 * T - 13
+    """
+    return (
+        0.0054667 * (air_supply_temp ** 3) -
+        0.34 * (air_supply_temp ** 2) +
+        10.263333 * air_supply_temp -
+        13
+    )
+
+
+@memoize()
+def calculate_air_flow_rate_per_rack(air_supply_temp):
+    """Required air flow rate per GB200_NVL72 rack (CFM)."""
+    return calculate_air_flow_rate_per_kw(air_supply_temp) * AIR_COOLING_CAPACITY_PER_RACK["GB200_NVL72"]
+
+
+@memoize()
+def calculate_liquid_flow_rate_per_rack(tcs_liquid_temp):
+    """Required liquid flow rate per GB200_NVL72 rack (LPM) for a TCS liquid temperature."""
+    return (
+        -0.0007656 * (tcs_liquid_temp ** 4) +
+        0.11484 * (tcs_liquid_temp ** 3) -
+        6.18222 * (tcs_liquid_temp ** 2) +
+        145.2726 * tcs_liquid_temp -
+        1205.82
+    )
+
+
+def calculate_rack_air_flow_rate(rack_type, air_supply_temp):
+    """Air flow rate (CFM) of one rack: fixed for air cooled racks, per kW of air cooling otherwise."""
+    fixed_air_flow_rate = FIXED_AIR_FLOW_RATE_PER_RACK.get(rack_type)
+    if fixed_air_flow_rate is not None:
+        return fixed_air_flow_rate
+    return calculate_air_flow_rate_per_kw(air_supply_temp) * AIR_COOLING_CAPACITY_PER_RACK[rack_type]
+
+
+def calculate_liquid_rack_equivalents(rack_type):
+    """Liquid cooling load of a rack in units of the reference (GB200_NVL72) rack."""
+    return calculate_liquid_cooling_capacity(rack_type) / calculate_liquid_cooling_capacity(REFERENCE_LIQUID_COOLED_RACK)
+
+
+@memoize()
+def calculate_airflow_rate_per_pod(pod_type, air_supply_temp):
+    """Required airflow rate per pod (CFM), including the 5% margin."""
+    rack_counts = POD_RACK_COUNTS.get(pod_type, {})
+    required_airflow_rate_per_pod = sum(
+        calculate_rack_air_flow_rate(rack, air_supply_temp) * count for rack, count in rack_counts.items()
+    )
+    return required_airflow_rate_per_pod * 1.05
+
+
+@memoize()
+def calculate_liquid_flow_rate_per_pod(pod_type, tcs_liquid_temp):
+    """Required liquid flow rate per pod (LPM)."""
+    return calculate_liquid_flow_rate_per_rack(tcs_liquid_temp) * calculate_reference_racks(pod_type)
+
+
+@memoize()
+def calculate_reference_racks(pod_type):
+    """Liquid cooling load of a pod in reference (GB200_NVL72) racks; 0 for an unknown pod."""
+    rack_counts = POD_RACK_COUNTS.get(pod_type, {})
+    return sum(calculate_liquid_rack_equivalents(rack) * count for rack, count in rack_counts.items())
+
+
+def calculate_cdus(liquid_cooling_capacity, required_liquid_flow_rate_per_pod):
+    """Number of CDUs for a pod.
+
+    No. of CDUs = MAX(CEILING(liquid_cooling_capacity / XDU1350(nominal cooling capacity), 1),
+                      CEILING(required_liquid_flow_rate_per_pod / Max Secondary Flow Rate CDU, 1)) + 1
+    """
+    cdus_by_cooling_capacity = math.ceil(liquid_cooling_capacity / equipment_catalog()[CDU_MODEL].capacity)
+    cdus_by_flow_rate = math.ceil(required_liquid_flow_rate_per_pod / MAX_SECONDARY_FLOW_RATE_CDU)
+    return max(cdus_by_cooling_capacity, cdus_by_flow_rate) + 1
+
+
+def calculate_primary_flow_rate_per_cdu(q_per_cdu):
+    """Primary Flow Rate per CDU (LPM) = (Q/CDU / Primary Delta Temp) / 4170 * 60000"""
+    return ((q_per_cdu / PRIMARY_DELTA_TEMP) / 4170) * 60000
+
+
+def calculate_rack_power_liquid_cooled(tcs_liquid_temp):
+    """Rack Power _Liquid Cooled (kW) = (44025 / (56.6 - TCS_liquid))^(0.576)"""
+    return (44025 / (56.6 - tcs_liquid_temp)) ** 0.576
+
+
+def calculate_secondary_return_temp(rack_power_liquid_cooled, liquid_flow_rate_per_rack, tcs_liquid_temp):
+    """Secondary Return Temp (°C) LC = ((Rack Power (kW) / (Liquid flow rate per rack / 60000)) / Rho*C) + TCS_liquid"""
+    if liquid_flow_rate_per_rack == 0:
+        raise ValueError("Liquid flow rate per rack cannot be zero for this calculation.")
+    return (rack_power_liquid_cooled / (liquid_flow_rate_per_rack / 60000)) / RHO_C_SECONDARY_FLOW + tcs_liquid_temp
+
+
+def calculate_q_max_cdu(required_liquid_flow_rate, total_cdus, secondary_return_temp, primary_supply_temp, liquid_cooling_capacity):
+    """Q_max_CDU = Rho*C * MIN(Secondary, Primary Flow Rate per CDU) / 60000 * (Secondary Return - Primary Supply Temp)"""
+    secondary_flow_rate_per_cdu = required_liquid_flow_rate / total_cdus
+    primary_flow_rate_per_cdu = calculate_primary_flow_rate_per_cdu(liquid_cooling_capacity / total_cdus)
+    min_flow_rate = min(secondary_flow_rate_per_cdu, primary_flow_rate_per_cdu)
+    return (RHO_C_SECONDARY_FLOW * min_flow_rate / 60000) * (secondary_return_temp - primary_supply_temp)
+
+
+def calculate_air_temperature_rise_in_rack(air_cooling_capacity_per_pod, required_air_flow_rate_capacity_per_pod):
+    """Calculate the air temperature rise in rack."""
+    return air_cooling_capacity_per_pod / 1.08 / (required_air_flow_rate_capacity_per_pod * 0.00047194745)
+
+
+@memoize(tags=(CONSTANTS, DATA))
+def calculate_no_of_crahs(air_cooling_capacity_per_pod, model=CRAH_MODEL):
+    """Calculate number of CRAHs based on air cooling capacity of the CRAH model (PW170 by default)."""
+    return math.ceil(air_cooling_capacity_per_pod / equipment_catalog()[model].capacity)
+
+
+def calculate_q_per_crah(cdu_type, air_cooling_capacity_per_pod, total_power_per_pod, no_of_crahs):
+    """Calculate Q per CRAH based on CDU type."""
+    if cdu_type == "Liquid to Liquid":
+        return air_cooling_capacity_per_pod / no_of_crahs
+    elif cdu_type == "Liquid to Air":
+        return total_power_per_pod / no_of_crahs
+    return 0  # Default value if CDU type is unrecognized
+
+
+def calculate_q_ac_per_pod(cdu_type, air_cooling_capacity_per_pod, total_power_per_pod):
+    """Calculate Q AC per POD based on CDU type."""
+    if cdu_type == "Liquid to Liquid":
+        return air_cooling_capacity_per_pod
+    elif cdu_type == "Liquid to Air":
+        return total_power_per_pod
+    return 0  # Default value if CDU type is unrecognized
+
+
+def calculate_chilled_water_flow_rate_per_crah(q_per_crah, chilled_water_temperature_rise):
+    """Calculate the chilled water flow rate per CRAH (LPM)."""
+    return (q_per_crah / (chilled_water_temperature_rise * WATER_RHO_CP)) * 60000
+
+
+@memoize()
+def calculate_roots(a, b, c):
+    """Return the roots of a*x^2 + b*x + c, or (None, None) when there are no real roots.
+
+    The roots come in the order of (-b + sqrt(D)) / 2a, (-b - sqrt(D)) / 2a, but are computed without
+    the cancellation of that formula: the root where -b and the square root add is taken first, and
+    the other follows from Vieta's formula (product of roots = c / a).
+    """
+    if a == 0:
+        return (-c / b, -c / b) if b != 0 else (None, None)
+    discriminant = b ** 2 - 4 * a * c
+    if discriminant < 0:
+        return None, None
+    q = -0.5 * (b + math.copysign(math.sqrt(discriminant), b))
+    if q == 0:
+        return 0.0, 0.0
+    # q / a is the root where -b and sqrt(D) have the same sign, c / q the other one
+    return (c / q, q / a) if b >= 0 else (q / a, c / q)
+
+
+def calculate_dp(qsc_coefficients, flowrate):
+    """Calculate the differential pressure (dp) of a system curve at a flowrate."""
+    return qsc_coefficients["a"] * (flowrate ** 2) + qsc_coefficients["b"] * flowrate + qsc_coefficients["c"]
+
+
+@memoize()
+def calculate_system_curve(pod_type, total_cdus):
+    """Quadratic system curve ``{"a", "b", "c"}`` of a pod served by ``total_cdus`` CDUs, or None.
+
+    Fitted curves (QSC_COEFFICIENTS) are used as they are. Other CDU counts are scaled from the pod's
+    lowest fitted count n0 with k = n / n0: a * k^2, b * k, c, as the fitted 1152 GPU curves do.
+
+    A pod without fitted curves borrows them from the fitted pod nearest in liquid cooled (GB200_NVL72
+    equivalent) racks: the flow per CDU of n CDUs on r racks is that of n * r0 / r CDUs on the r0 racks of
+    the fitted pod, e.g. the 288 GPU pod on 1 CDU runs like the 576 GPU pod on 2. Pods without liquid
+    cooled racks have no secondary loop to derive a curve for and get None.
+    """
+    if total_cdus < 1:
+        return None
+    if pod_type in QSC_COEFFICIENTS:
+        return _scaled_system_curve(QSC_COEFFICIENTS[pod_type], total_cdus)
+    racks = calculate_reference_racks(pod_type)
+    if racks <= 0 or not QSC_COEFFICIENTS:
+        return None
+    reference_pod = min(QSC_COEFFICIENTS, key=lambda pod: abs(math.log(calculate_reference_racks(pod) / racks)))
+    return _scaled_system_curve(
+        QSC_COEFFICIENTS[reference_pod], total_cdus * calculate_reference_racks(reference_pod) / racks
+    )
+
+
+def _scaled_system_curve(fitted, total_cdus):
+    # The fitted curve of that CDU count, else the lowest fitted count's scaled to it
+    if total_cdus in fitted:
+        return fitted[total_cdus]
+    reference_cdus = min(fitted)
+    reference = fitted[reference_cdus]
+    k = total_cdus / reference_cdus
+    return {"a": reference["a"] * k ** 2, "b": reference["b"] * k, "c": reference["c"]}
+
+
+@memoize(tags=(CONSTANTS, DATA))
+def calculate_cdu_pump_power(pod_type, total_cdus, pod_flowrate_per_cdu):
+    """HP2 (kW) of one CDU pump at the pod's flow rate per CDU.
+
+    The operating point is the intersection of the XDU1350 PQ curve with the pod's quadratic system
+    curve; the pump, drawing its catalog power there, is then scaled to the required flow with the
+    affinity laws. Returns None when the pod has no system curve (see :func:`calculate_system_curve`),
+    the CDU no pump curve or power, or there is no operating point.
+    """
+    qsc_coefficients = calculate_system_curve(pod_type, total_cdus)
+    if qsc_coefficients is None:
+        return None
+
+    cdu = equipment_catalog()[CDU_MODEL]
+    if cdu.pump_curve is None or cdu.power is None:
+        return None
+    pump_curve = cdu.pump_curve
+    root1, root2 = calculate_roots(
+        pump_curve["a"] - qsc_coefficients["a"],
+        pump_curve["b"] - qsc_coefficients["b"],
+        pump_curve["c"] - qsc_coefficients["c"],
+    )
+    if root1 is None:
+        return None
+    flowrate1 = max(root1, root2)
+
+    dp1 = calculate_dp(qsc_coefficients, flowrate1)
+    dp2 = calculate_dp(qsc_coefficients, pod_flowrate_per_cdu)
+    if dp1 == 0 or dp2 / dp1 < 0:
+        return None
+    rpm2 = math.sqrt(dp2 / dp1) * (RPM1 ** 2)
+    return ((rpm2 / RPM1) ** 3) * cdu.power
+
+
+def calculate_crah_rpm_and_power(required_airflow_rate_capacity_per_pod, no_of_crahs, model=CRAH_MODEL):
+    """Return ``(CFM2, RPM2%, HP2 per CRAH)`` for the CRAH model (PW170 by default) via the fan affinity laws.
+
+    CFM1 and HP1_per_crah are the model's rated Air CFM and Total Power in the equipment catalog.
+
+    RPM2% = (CFM2 / CFM1) * RPM1%
+    HP2_per_crah = ((RPM2% / RPM1%) ^ 3) * HP1_per_crah
+    """
+    crah = equipment_catalog()[model]
+    cfm2 = required_airflow_rate_capacity_per_pod / no_of_crahs
+    rpm2_percent = (cfm2 / crah.airflow) * RPM1_PERCENT
+    hp2_per_crah = ((rpm2_percent / RPM1_PERCENT) ** 3) * crah.power
+    return cfm2, rpm2_percent, hp2_per_crah
+
+
+def calculate_liquid_cooling_options(fws_liquid_temp, dry_bulb, wet_bulb):
+    """Return the (option 1, option 2) heat rejection equipment for the liquid loop."""
+    option1 = "Dry Cooler" if fws_liquid_temp - 5 - dry_bulb >= 0 else "Chiller"
+    option2 = "Closed Loop Cooling Tower" if fws_liquid_temp - 3 - wet_bulb >= 0 else "Chiller"
+    return option1, option2
+
+
+@memoize(tags=(DATA,))
+def calculate_chilled_water_temperature_rise(chillers, fws_design_temperature_air, dry_bulb, model=CHILLER_MODEL):
+    """Evaporator temperature rise of the chiller model at (TWOUT, dry bulb), interpolated between rated points.
+
+    ``chillers`` is a :class:`ui_for_ov.chillers.ChillerTable`. Outside the rated range the edge values hold.
+    Returns None for an unknown model.
+    """
+    surface = chillers.surface(model)
+    return surface.evaporator_rise(fws_design_temperature_air, dry_bulb) if surface is not None else None
+
+
+def evaluate(scenario, chillers=None, climate=None):
+    """Evaluate every sizing quantity of a scenario in one call.
+
+    Args:
+        scenario: The :class:`Scenario` to evaluate.
+        chillers: :class:`ui_for_ov.chillers.ChillerTable` used for the chilled water temperature
+            rise. Site dependent results are None when omitted.
+        climate: :class:`ui_for_ov.climate.ClimateStore` the city is looked up in. Site dependent
+            results are None when omitted or when ``scenario.city`` is not in it.
+
+    Returns:
+        dict of result name to value, covering everything ``update_calculations`` and
+        ``update_flow_rates`` display.
+    """
+    pod_type = scenario.pod_type
+
+    power_per_pod = calculate_power_per_pod(pod_type)
+    air_cooling_capacity_per_pod = calculate_total_air_cooling_capacity(pod_type)
+    liquid_cooling_capacity_per_pod = calculate_total_liquid_cooling_capacity(pod_type)
+
+    # Liquid side (update_flow_rates)
+    required_liquid_flow_rate_per_pod = calculate_liquid_flow_rate_per_pod(pod_type, scenario.tcs_liquid_temp)
+    total_cdus = calculate_cdus(liquid_cooling_capacity_per_pod, required_liquid_flow_rate_per_pod)
+    secondary_flow_rate_per_cdu = required_liquid_flow_rate_per_pod / total_cdus
+    primary_flow_rate_per_cdu = calculate_primary_flow_rate_per_cdu(liquid_cooling_capacity_per_pod / total_cdus)
+    cdu_hp2 = calculate_cdu_pump_power(pod_type, total_cdus, secondary_flow_rate_per_cdu)
+
+    # Air side (update_calculations)
+    required_airflow_rate_per_pod = calculate_airflow_rate_per_pod(pod_type, scenario.air_supply_temp)
+    air_temperature_rise = calculate_air_temperature_rise_in_rack(
+        air_cooling_capacity_per_pod, required_airflow_rate_per_pod
+    )
+    no_of_crahs = calculate_no_of_crahs(air_cooling_capacity_per_pod)
+    q_per_crah = calculate_q_per_crah(scenario.cdu_type, air_cooling_capacity_per_pod, power_per_pod, no_of_crahs)
+    crah_cfm2, crah_rpm2_percent, crah_hp2 = calculate_crah_rpm_and_power(required_airflow_rate_per_pod, no_of_crahs)
+
+    # Site dependent results
+    site = climate.get(scenario.city) if climate is not None and scenario.city is not None else None
+    dry_bulb = wet_bulb = None
+    liquid_cooling_option1 = liquid_cooling_option2 = None
+    chilled_water_temperature_rise = None
+    if site is not None:
+        dry_bulb, wet_bulb = site.dry_bulb, site.wet_bulb
+        liquid_cooling_option1, liquid_cooling_option2 = calculate_liquid_cooling_options(
+            scenario.fws_liquid_temp, dry_bulb, wet_bulb
+        )
+        if chillers is not None:
+            chilled_water_temperature_rise = calculate_chilled_water_temperature_rise(
+                chillers, scenario.fws_air_temp, dry_bulb
+            )
+
+    chilled_water_flow_rate_per_crah = chilled_water_flow_rate_per_pod = None
+    if chilled_water_temperature_rise:
+        chilled_water_flow_rate_per_crah = calculate_chilled_water_flow_rate_per_crah(
+            q_per_crah, chilled_water_temperature_rise
+        )
+        chilled_water_flow_rate_per_pod = chilled_water_flow_rate_per_crah * no_of_crahs
+
+    return {
+        "power_per_pod": power_per_pod,
+        "total_power": power_per_pod * scenario.num_pods,
+        "air_cooling_capacity_per_pod": air_cooling_capacity_per_pod,
+        "liquid_cooling_capacity_per_pod": liquid_cooling_capacity_per_pod,
+        "required_airflow_rate_per_pod": required_airflow_rate_per_pod,
+        "required_liquid_flow_rate_per_pod": required_liquid_flow_rate_per_pod,
+        "total_cdus": total_cdus,
+        "secondary_flow_rate_per_cdu": secondary_flow_rate_per_cdu,
+        "primary_flow_rate_per_cdu": primary_flow_rate_per_cdu,
+        "primary_flow_rate_per_pod": primary_flow_rate_per_cdu * total_cdus,
+        "pod_flowrate_per_cdu": secondary_flow_rate_per_cdu,
+        "cdu_hp2": cdu_hp2,
+        "cdu_hp_per_pod": cdu_hp2 * total_cdus if cdu_hp2 is not None else None,
+        "air_temperature_rise": air_temperature_rise,
+        "air_return_temperature": scenario.air_supply_temp + air_temperature_rise,
+        "no_of_crahs": no_of_crahs,
+        "q_per_crah": q_per_crah,
+        "q_ac_per_pod": calculate_q_ac_per_pod(scenario.cdu_type, air_cooling_capacity_per_pod, power_per_pod),
+        "crah_cfm2": crah_cfm2,
+        "crah_rpm2_percent": crah_rpm2_percent,
+        "crah_hp1": equipment_catalog()[CRAH_MODEL].power,
+        "crah_hp2": crah_hp2,
+        "dry_bulb": dry_bulb,
+        "wet_bulb": wet_bulb,
+        "liquid_cooling_option1": liquid_cooling_option1,
+        "liquid_cooling_option2": liquid_cooling_option2,
+        "chilled_water_temperature_rise": chilled_water_temperature_rise,
+        "chilled_water_flow_rate_per_crah": chilled_water_flow_rate_per_crah,
+        "chilled_water_flow_rate_per_pod": chilled_water_flow_rate_per_pod,
+    }
@@ -0,0 +1,257 @@
+"""Reactive dependency graph for incremental recomputation of the sizing model.
+
+The model is a graph of named quantities: inputs (the panel's selections) and derived nodes computed from
+other nodes. Setting an input only marks its downstream nodes dirty; :meth:`Graph.recompute` then
+evaluates each dirty node at most once, in dependency order, and stops propagating past nodes whose
+value did not change. Only the dirty nodes are visited, ordered by their precomputed topological
+position, so the cost of a recompute follows what changed rather than the size of the graph.
+"""
+import time
+
+from . import engine
+
+
+class Graph:
+    """A directed acyclic graph of input and derived nodes.
+
+    Args:
+        profiler: Optional :class:`ui_for_ov.profiler.Profiler` that times every node evaluation while it
+            is enabled, under the name of the node's ``calculate_*`` function (or the node name).
+    """
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self._span_names = {}
+        self._functions = {}
+        self._dependencies = {}
+        self._dependents = {}
+        self._skip_none = {}
+        self._order = []
+        self._position = {}
+        # Input -> every node downstream of it, in dependency order; built on first use
+        self._downstream = {}
+        self._values = {}
+        self._dirty = set()
+        # The dirty nodes in dependency order while they all come from one input; None means sort them
+        self._schedule = None
+        self._computed = set()
+        self._changed_inputs = set()
+
+    def add_input(self, name, value=None):
+        """Add an input node with an initial value."""
+        self._add(name, None, ())
+        self._values[name] = value
+        self._changed_inputs.add(name)
+
+    def add_node(self, name, function, dependencies, skip_none=True):
+        """Add a derived node computed as ``function(*values of dependencies)``.
+
+        Dependencies must already exist, which keeps the graph acyclic and the insertion order
+        topological. With ``skip_none`` the node is None whenever one of its dependencies is, instead
+        of calling ``function``.
+        """
+        for dependency in dependencies:
+            if dependency not in self._functions:
+                raise KeyError(f"Unknown dependency '{dependency}' of node '{name}'")
+        self._add(name, function, tuple(dependencies))
+        function_name = getattr(function, "__name__", "")
+        self._span_names[name] = function_name if function_name.startswith("calculate_") else name
+        self._skip_none[name] = skip_none
+        self._values[name] = None
+        self._dirty.add(name)
+        self._schedule = None
+
+    def _add(self, name, function, dependencies):
+        if name in self._functions:
+            raise ValueError(f"Node '{name}' already exists")
+        self._functions[name] = function
+        self._dependencies[name] = dependencies
+        self._dependents[name] = []
+        for dependency in dependencies:
+            self._dependents[dependency].append(name)
+        # Insertion order is topological (dependencies must exist first)
+        self._position[name] = len(self._order)
+        self._order.append(name)
+        self._downstream.clear()
+
+    @property
+    def names(self):
+        """Node names in dependency order."""
+        return list(self._order)
+
+    def dependencies(self, name):
+        return self._dependencies[name]
+
+    def is_input(self, name):
+        return name in self._functions and self._functions[name] is None
+
+    def set(self, name, value):
+        """Set an input. Downstream nodes are only marked dirty if the value actually changed."""
+        if not self.is_input(name):
+            raise KeyError(f"'{name}' is not an input node")
+        if self._values[name] == value:
+            return
+        self._values[name] = value
+        self._changed_inputs.add(name)
+        downstream = self._downstream_of(name)
+        self._schedule = downstream if not self._dirty else None
+        self._dirty.update(downstream)
+
+    def _downstream_of(self, name):
+        if name not in self._downstream:
+            reached = set()
+            pending = list(self._dependents[name])
+            while pending:
+                node = pending.pop()
+                if node not in reached:
+                    reached.add(node)
+                    pending.extend(self._dependents[node])
+            self._downstream[name] = tuple(sorted(reached, key=self._position.__getitem__))
+        return self._downstream[name]
+
+    def update(self, **inputs):
+        """Set several inputs at once."""
+        for name, value in inputs.items():
+            self.set(name, value)
+
+    @property
+    def dirty(self):
+        return set(self._dirty)
+
+    def recompute(self):
+        """Evaluate dirty nodes once each, in dependency order.
+
+        Returns:
+            list of the names whose value changed, inputs included, in dependency order.
+        """
+        changed = set(self._changed_inputs)
+        profiler = self.profiler if self.profiler is not None and self.profiler.enabled else None
+        schedule = self._schedule
+        if schedule is None:
+            schedule = sorted(self._dirty, key=self._position.__getitem__)
+        node_values, computed = self._values, self._computed
+        for name in schedule:
+            dependencies = self._dependencies[name]
+            # Skip nodes whose upstream values all turned out unchanged in this pass
+            if name in computed and changed.isdisjoint(dependencies):
+                continue
+            values = [node_values[dependency] for dependency in dependencies]
+            start = time.perf_counter_ns() if profiler is not None else 0
+            if self._skip_none[name] and None in values:
+                value = None
+            else:
+                value = self._functions[name](*values)
+            node_changed = name not in computed or value != node_values[name]
+            if profiler is not None:
+                args = {"node": name, "changed": node_changed}
+                profiler.record(self._span_names[name], "calculate", start, time.perf_counter_ns() - start, args)
+            if node_changed:
+                node_values[name] = value
+                changed.add(name)
+            computed.add(name)
+        self._dirty.clear()
+        self._schedule = None
+        self._changed_inputs.clear()
+        return sorted(changed, key=self._position.__getitem__)
+
+    def get(self, name):
+        """Value of a node, recomputing dirty nodes first."""
+        if self._dirty:
+            self.recompute()
+        return self._values[name]
+
+    def values(self):
+        """Dict of every node value, recomputing dirty nodes first."""
+        if self._dirty:
+            self.recompute()
+        return dict(self._values)
+
+
+def _site_value(field):
+    return lambda site: getattr(site, field)
+
+
+def build_sizing_graph(chillers=None, climate=None, scenario=None, profiler=None):
+    """Build the sizing model of :func:`ui_for_ov.engine.evaluate` as a :class:`Graph`.
+
+    Inputs are the :class:`ui_for_ov.engine.Scenario` fields, initialized from ``scenario``; the derived
+    nodes carry the same names as the keys of the dict returned by ``evaluate``. ``profiler`` is passed to
+    the :class:`Graph`.
+    """
+    scenario = scenario or engine.Scenario()
+    graph = Graph(profiler)
+    for name, value in scenario._asdict().items():
+        graph.add_input(name, value)
+
+    node = graph.add_node
+    # Pod capacities
+    node("power_per_pod", engine.calculate_power_per_pod, ["pod_type"])
+    node("total_power", lambda power, pods: power * pods, ["power_per_pod", "num_pods"])
+    node("air_cooling_capacity_per_pod", engine.calculate_total_air_cooling_capacity, ["pod_type"])
+    node("liquid_cooling_capacity_per_pod", engine.calculate_total_liquid_cooling_capacity, ["pod_type"])
+
+    # Liquid side
+    node("required_liquid_flow_rate_per_pod", engine.calculate_liquid_flow_rate_per_pod, ["pod_type", "tcs_liquid_temp"])
+    node("total_cdus", engine.calculate_cdus, ["liquid_cooling_capacity_per_pod", "required_liquid_flow_rate_per_pod"])
+    node("secondary_flow_rate_per_cdu", lambda flow, cdus: flow / cdus, ["required_liquid_flow_rate_per_pod", "total_cdus"])
+    node(
+        "primary_flow_rate_per_cdu",
+        lambda capacity, cdus: engine.calculate_primary_flow_rate_per_cdu(capacity / cdus),
+        ["liquid_cooling_capacity_per_pod", "total_cdus"],
+    )
+    node("primary_flow_rate_per_pod", lambda flow, cdus: flow * cdus, ["primary_flow_rate_per_cdu", "total_cdus"])
+    node("pod_flowrate_per_cdu", lambda flow: flow, ["secondary_flow_rate_per_cdu"])
+    node("cdu_hp2", engine.calculate_cdu_pump_power, ["pod_type", "total_cdus", "pod_flowrate_per_cdu"])
+    node("cdu_hp_per_pod", lambda hp2, cdus: hp2 * cdus, ["cdu_hp2", "total_cdus"])
+
+    # Air side
+    node("required_airflow_rate_per_pod", engine.calculate_airflow_rate_per_pod, ["pod_type", "air_supply_temp"])
+    node(
+        "air_temperature_rise",
+        engine.calculate_air_temperature_rise_in_rack,
+        ["air_cooling_capacity_per_pod", "required_airflow_rate_per_pod"],
+    )
+    node("air_return_temperature", lambda supply, rise: supply + rise, ["air_supply_temp", "air_temperature_rise"])
+    node("no_of_crahs", engine.calculate_no_of_crahs, ["air_cooling_capacity_per_pod"])
+    node(
+        "q_per_crah",
+        engine.calculate_q_per_crah,
+        ["cdu_type", "air_cooling_capacity_per_pod", "power_per_pod", "no_of_crahs"],
+    )
+    node("q_ac_per_pod", engine.calculate_q_ac_per_pod, ["cdu_type", "air_cooling_capacity_per_pod", "power_per_pod"])
+    node("crah_power", engine.calculate_crah_rpm_and_power, ["required_airflow_rate_per_pod", "no_of_crahs"])
+    node("crah_cfm2", lambda power: power[0], ["crah_power"])
+    node("crah_rpm2_percent", lambda power: power[1], ["crah_power"])
+    node("crah_hp2", lambda power: power[2], ["crah_power"])
+    # Rated power of the CRAH model: no inputs, so it is evaluated once
+    node("crah_hp1", lambda: engine.equipment_catalog()[engine.CRAH_MODEL].power, [])
+
+    # Site dependent
+    node("site", lambda city: climate.get(city) if climate is not None else None, ["city"])
+    node("dry_bulb", _site_value("dry_bulb"), ["site"])
+    node("wet_bulb", _site_value("wet_bulb"), ["site"])
+    node(
+        "liquid_cooling_options",
+        engine.calculate_liquid_cooling_options,
+        ["fws_liquid_temp", "dry_bulb", "wet_bulb"],
+    )
+    node("liquid_cooling_option1", lambda options: options[0], ["liquid_cooling_options"])
+    node("liquid_cooling_option2", lambda options: options[1], ["liquid_cooling_options"])
+    node(
+        "chilled_water_temperature_rise",
+        lambda fws_air, dry_bulb: (
+            engine.calculate_chilled_water_temperature_rise(chillers, fws_air, dry_bulb) if chillers is not None else None
+        ),
+        ["fws_air_temp", "dry_bulb"],
+    )
+    node(
+        "chilled_water_flow_rate_per_crah",
+        lambda q, rise: engine.calculate_chilled_water_flow_rate_per_crah(q, rise) if rise else None,
+        ["q_per_crah", "chilled_water_temperature_rise"],
+    )
+    node(
+        "chilled_water_flow_rate_per_pod",
+        lambda flow, crahs: flow * crahs if flow is not None else None,
+        ["chilled_water_flow_rate_per_crah", "no_of_crahs"],
+    )
+    return graph
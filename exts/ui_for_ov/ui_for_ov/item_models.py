@@ -0,0 +1,77 @@
+"""ComboBox models whose items change in place.
+
+Rebuilding a ``ui.ComboBox`` to change its items clears its container, lays it out again and leaves the
+old widget's value-changed callbacks behind. A combo built on a :class:`ListItemModel` keeps its widget,
+its selection model and its callbacks for the whole session; :meth:`ListItemModel.set_items` relabels the
+existing items and only creates or drops items when the list length changes.
+"""
+import omni.ui as ui
+
+
+class ListItem(ui.AbstractItem):
+    """One text item of a :class:`ListItemModel`."""
+
+    def __init__(self, text):
+        super().__init__()
+        self.model = ui.SimpleStringModel(text)
+
+
+class ListItemModel(ui.AbstractItemModel):
+    """Item model of a ComboBox listing strings.
+
+    Args:
+        items: Item texts.
+        index: Initially selected item.
+
+    The selected index is ``get_item_value_model()``, a model that outlives every :meth:`set_items`, so
+    value-changed callbacks are registered on it once.
+    """
+
+    def __init__(self, items=(), index=0):
+        super().__init__()
+        self._texts = [str(text) for text in items]
+        self._items = [ListItem(text) for text in self._texts]
+        self._current_index = ui.SimpleIntModel(index)
+        self._current_index.add_value_changed_fn(lambda model: self._item_changed(None))
+
+    @property
+    def items(self):
+        """Texts of the items, in order. Do not modify; use :meth:`set_items`."""
+        return self._texts
+
+    @property
+    def current_index(self):
+        return self._current_index.as_int
+
+    @property
+    def current_text(self):
+        """Text of the selected item, or None if the selection is out of range."""
+        index = self.current_index
+        return self._texts[index] if 0 <= index < len(self._texts) else None
+
+    def set_items(self, items, index=0):
+        """Replace the item texts and select ``index``.
+
+        Existing items are relabelled rather than recreated. Selecting an index different from the current
+        one calls the selection's value-changed callbacks, after the new items are in place.
+        """
+        texts = [str(text) for text in items]
+        for item, text in zip(self._items, texts):
+            if item.model.as_string != text:
+                item.model.set_value(text)
+        if len(texts) > len(self._items):
+            self._items.extend(ListItem(text) for text in texts[len(self._items):])
+        else:
+            del self._items[len(texts):]
+        self._texts = texts
+        self._item_changed(None)
+        if index != self.current_index:
+            self._current_index.set_value(index)
+
+    def get_item_children(self, item=None):
+        return self._items if item is None else []
+
+    def get_item_value_model(self, item=None, column_id=0):
+        if item is None:
+            return self._current_index
+        return item.model
@@ -0,0 +1,59 @@
+"""Bounded memoization for the engine's pure functions.
+
+Most sizing functions take a handful of discrete inputs (a pod type, a temperature from a dropdown), so
+interactive use and sweeps keep asking for the same few dozen values. :func:`memoize` wraps a function in a
+bounded LRU cache (:func:`functools.lru_cache`) and registers it under one or more tags so that caches
+can be dropped when what they depend on changes::
+
+    memo.invalidate("constants")  # after editing engine constants such as POWER_PER_RACK
+    memo.invalidate("data")       # after (re)loading the chiller or climate tables
+    memo.invalidate()             # everything
+
+Arguments must be hashable.
+"""
+import functools
+
+CONSTANTS = "constants"
+DATA = "data"
+
+_caches = []
+
+
+def memoize(maxsize=256, tags=(CONSTANTS,)):
+    """Decorator caching up to ``maxsize`` results of a pure function, least recently used first out."""
+
+    def decorate(function):
+        cached = functools.lru_cache(maxsize=maxsize)(function)
+        cached.tags = frozenset(tags)
+        _caches.append(cached)
+        return cached
+
+    return decorate
+
+
+def invalidate(tag=None):
+    """Clear the caches registered with ``tag``, or all of them. Returns how many were cleared."""
+    cleared = 0
+    for cached in _caches:
+        if tag is None or tag in cached.tags:
+            cached.cache_clear()
+            cleared += 1
+    return cleared
+
+
+def cache_stats():
+    """Hit/miss counters of every registered cache.
+
+    Returns:
+        dict of ``module.function`` -> dict with ``hits``, ``misses``, ``size`` and ``maxsize``.
+    """
+    stats = {}
+    for cached in _caches:
+        info = cached.cache_info()
+        stats[f"{cached.__module__}.{cached.__qualname__}"] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize,
+        }
+    return stats
@@ -0,0 +1,178 @@
+"""Pod compositions as a sparse pods x rack-types matrix.
+
+A pod is a mix of rack types. :class:`PodMatrix` stores the rack counts of many pods in compressed sparse
+row form (row pointers, rack type columns, counts), so any per-rack quantity (power, air or liquid cooling
+capacity, air flow, ...) totals over every pod with a single sparse matrix-vector product instead of a dict
+walk per pod.
+"""
+import math
+from array import array
+
+from . import engine
+
+
+class PodMatrix:
+    """Rack counts of named pods over a fixed list of rack types.
+
+    Args:
+        rack_types: Column order. Defaults to every rack type known to the engine.
+    """
+
+    def __init__(self, rack_types=None):
+        self.rack_types = list(rack_types if rack_types is not None else engine.POWER_PER_RACK)
+        self._column_of = {rack_type: column for column, rack_type in enumerate(self.rack_types)}
+        self._names = []
+        self._row_of = {}
+        self._indptr = array("q", [0])
+        self._indices = array("q")
+        self._counts = array("d")
+        self._row_ids = None
+
+    @classmethod
+    def from_dict(cls, pods, rack_types=None):
+        """Build a matrix from ``{pod name: {rack type: count}}``, e.g. ``engine.POD_RACK_COUNTS``."""
+        matrix = cls(rack_types)
+        for name, rack_counts in pods.items():
+            matrix.add(name, rack_counts)
+        return matrix
+
+    def add(self, name, rack_counts):
+        """Append a pod; returns its row. Zero counts are not stored."""
+        if name in self._row_of:
+            raise ValueError(f"Pod '{name}' already exists")
+        entries = []
+        for rack_type, count in rack_counts.items():
+            if rack_type not in self._column_of:
+                raise KeyError(f"Unknown rack type '{rack_type}' in pod '{name}'")
+            if count:
+                entries.append((self._column_of[rack_type], count))
+        for column, count in sorted(entries):
+            self._indices.append(column)
+            self._counts.append(count)
+        self._indptr.append(len(self._indices))
+        self._row_of[name] = len(self._names)
+        self._names.append(name)
+        self._row_ids = None
+        return self._row_of[name]
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._row_of
+
+    @property
+    def names(self):
+        return list(self._names)
+
+    @property
+    def nnz(self):
+        """Number of stored (non-zero) rack counts."""
+        return len(self._indices)
+
+    def row_of(self, name):
+        """Row of a pod, or None."""
+        return self._row_of.get(name)
+
+    def rows_of(self, names):
+        """Row of each pod name as an int64 array, -1 for unknown pods."""
+        import numpy as np
+
+        names = list(names)
+        return np.fromiter((self._row_of.get(name, -1) for name in names), dtype=np.int64, count=len(names))
+
+    def rack_counts(self, name):
+        """``{rack type: count}`` of a pod."""
+        row = self._row_of[name]
+        start, end = self._indptr[row], self._indptr[row + 1]
+        return {self.rack_types[self._indices[i]]: self._counts[i] for i in range(start, end)}
+
+    def dense(self):
+        """Rack counts as a dense (pods x rack types) float64 array."""
+        import numpy as np
+
+        matrix = np.zeros((len(self), len(self.rack_types)))
+        matrix[self._row_index(), np.frombuffer(self._indices, dtype=np.int64)] = np.frombuffer(self._counts)
+        return matrix
+
+    def per_rack(self, values, default=0.0):
+        """Vector over :attr:`rack_types` from a ``{rack type: value}`` dict (``default`` where missing)."""
+        import numpy as np
+
+        return np.array([values.get(rack_type, default) for rack_type in self.rack_types], dtype=np.float64)
+
+    def totals(self, per_rack):
+        """Sparse matrix-vector product: the sum of ``per_rack`` over the racks of every pod.
+
+        Args:
+            per_rack: dict of rack type -> value, or a vector ordered like :attr:`rack_types`.
+
+        Returns:
+            float64 array with one total per pod, in row order.
+        """
+        import numpy as np
+
+        vector = self.per_rack(per_rack) if isinstance(per_rack, dict) else np.asarray(per_rack, dtype=np.float64)
+        counts = np.frombuffer(self._counts)
+        columns = np.frombuffer(self._indices, dtype=np.int64)
+        return np.bincount(self._row_index(), weights=counts * vector[columns], minlength=len(self))
+
+    def power(self):
+        """Power per pod (kW)."""
+        return self.totals(engine.POWER_PER_RACK)
+
+    def air_cooling_capacity(self):
+        """Air cooling capacity per pod (kW)."""
+        return self.totals(engine.AIR_COOLING_CAPACITY_PER_RACK)
+
+    def liquid_cooling_capacity(self):
+        """Liquid cooling capacity per pod (kW)."""
+        return self.totals({rack: engine.calculate_liquid_cooling_capacity(rack) for rack in self.rack_types})
+
+    def air_flow_coefficients(self):
+        """Return ``(cfm_per_kw_capacity, fixed_cfm)`` per pod.
+
+        The air flow of a pod at an air supply temperature T is
+        ``calculate_air_flow_rate_per_kw(T) * cfm_per_kw_capacity + fixed_cfm`` (before the 5% margin).
+        """
+        fixed = engine.FIXED_AIR_FLOW_RATE_PER_RACK
+        variable = {
+            rack: engine.AIR_COOLING_CAPACITY_PER_RACK.get(rack, 0.0) for rack in self.rack_types if rack not in fixed
+        }
+        return self.totals(variable), self.totals(fixed)
+
+    def liquid_rack_equivalents(self):
+        """Liquid cooling load per pod in reference (GB200_NVL72) racks."""
+        return self.totals({rack: engine.calculate_liquid_rack_equivalents(rack) for rack in self.rack_types})
+
+    def _row_index(self):
+        # Row id of every stored entry, i.e. the CSR row pointers expanded once
+        if self._row_ids is None:
+            import numpy as np
+
+            row_lengths = np.diff(np.frombuffer(self._indptr, dtype=np.int64))
+            self._row_ids = np.repeat(np.arange(len(self), dtype=np.int64), row_lengths)
+        return self._row_ids
+
+
+def default_pods():
+    """A :class:`PodMatrix` of the engine's pod types (``engine.POD_RACK_COUNTS``)."""
+    return PodMatrix.from_dict(engine.POD_RACK_COUNTS)
+
+
+def rack_variant(pod_type, rack_type):
+    """Name of ``pod_type`` built from ``rack_type`` racks instead of GB200_NVL72 ones.
+
+    The variant carries the same liquid cooling load, e.g. every NVL72 rack becomes two NVL36 racks. It is
+    defined in the engine (:func:`ui_for_ov.engine.define_pod`) on first use.
+    """
+    reference = engine.REFERENCE_LIQUID_COOLED_RACK
+    if rack_type == reference:
+        return pod_type
+    name = f"{pod_type} ({rack_type})"
+    if name not in engine.POD_RACK_COUNTS:
+        rack_counts = dict(engine.POD_RACK_COUNTS[pod_type])
+        reference_racks = rack_counts.pop(reference, 0)
+        racks = math.ceil(reference_racks / engine.calculate_liquid_rack_equivalents(rack_type))
+        engine.define_pod(name, {rack_type: racks, **rack_counts})
+    return name
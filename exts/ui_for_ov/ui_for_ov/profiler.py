@@ -0,0 +1,242 @@
+"""Lightweight instrumentation of the panel's update and calculate entry points.
+
+:data:`PROFILER` records a span for every instrumented call: the extension's event handlers and
+``update_*`` methods (:func:`profiled`) and every node of the sizing graph, i.e. each ``calculate_*`` call
+made by a recompute. Per name it keeps the call count, cumulative time and recent durations for p50/p99,
+and which UI event triggered the calls; the spans themselves go into a fixed-size ring buffer. Everything
+can be dumped as JSON or as a Chrome trace (``chrome://tracing`` / Perfetto).
+
+Recording is off unless enabled, from the panel's Profiler section or with ``UI_FOR_OV_PROFILE=1``; a
+disabled profiler costs one attribute check per call.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import Counter, deque, namedtuple
+
+Span = namedtuple("Span", ["name", "category", "start_ns", "duration_ns", "trigger", "thread", "args"])
+
+
+class _Stats:
+    __slots__ = ("count", "total_ns", "samples", "triggers", "unchanged")
+
+    def __init__(self, samples):
+        self.count = 0
+        self.total_ns = 0
+        self.samples = deque(maxlen=samples)
+        self.triggers = Counter()
+        self.unchanged = 0
+
+
+class Profiler:
+    """Call counts, latencies and triggers of instrumented calls.
+
+    Args:
+        capacity: Spans kept in the ring buffer.
+        samples: Recent durations kept per name for the percentiles.
+        enabled: Whether to record.
+    """
+
+    def __init__(self, capacity=4096, samples=1024, enabled=False):
+        self.enabled = enabled
+        self._samples = samples
+        self._spans = deque(maxlen=capacity)
+        self._stats = {}
+        self._triggers = []
+        self._origin_ns = time.perf_counter_ns()
+
+    @property
+    def capacity(self):
+        return self._spans.maxlen
+
+    @property
+    def current_trigger(self):
+        """The UI event the calls being recorded now belong to, or None."""
+        return self._triggers[-1] if self._triggers else None
+
+    def trigger(self, name):
+        """Context manager attributing the calls made inside it to the UI event ``name``."""
+        return _Trigger(self, name)
+
+    def record(self, name, category, start_ns, duration_ns, args=None):
+        """Add one span; ``args["changed"] is False`` counts it as a redundant (no-change) computation."""
+        trigger = self.current_trigger
+        self._spans.append(Span(name, category, start_ns, duration_ns, trigger, threading.get_ident(), args))
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = _Stats(self._samples)
+        stats.count += 1
+        stats.total_ns += duration_ns
+        stats.samples.append(duration_ns)
+        stats.triggers[trigger] += 1
+        if args is not None and args.get("changed") is False:
+            stats.unchanged += 1
+
+    def span(self, name, category="call", args=None):
+        """Context manager recording the time spent inside it (when enabled)."""
+        return _Span(self, name, category, args)
+
+    def wrap(self, function, name=None, category="call", trigger=False):
+        """Instrumented ``function``. With ``trigger`` its calls also become the trigger of nested calls."""
+        name = name or function.__name__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return function(*args, **kwargs)
+            if trigger:
+                self._triggers.append(name)
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.record(name, category, start, time.perf_counter_ns() - start)
+                if trigger:
+                    self._triggers.pop()
+
+        return wrapper
+
+    def reset(self):
+        self._spans.clear()
+        self._stats.clear()
+
+    def spans(self):
+        """Spans in the ring buffer, oldest first."""
+        return list(self._spans)
+
+    def stats(self):
+        """Per name statistics.
+
+        Returns:
+            dict of name -> dict with ``count``, ``total_ms``, ``mean_ms``, ``p50_ms``, ``p99_ms`` (over the
+            recent samples), ``unchanged`` (computations that produced the same value again) and
+            ``triggers`` (UI event -> calls).
+        """
+        stats = {}
+        for name, entry in self._stats.items():
+            samples = sorted(entry.samples)
+            stats[name] = {
+                "count": entry.count,
+                "total_ms": entry.total_ns / 1e6,
+                "mean_ms": entry.total_ns / entry.count / 1e6,
+                "p50_ms": _percentile(samples, 50) / 1e6,
+                "p99_ms": _percentile(samples, 99) / 1e6,
+                "unchanged": entry.unchanged,
+                "triggers": {str(trigger): count for trigger, count in entry.triggers.most_common()},
+            }
+        return stats
+
+    def summary(self, limit=15):
+        """Text table of the ``limit`` names with the most cumulative time."""
+        rows = sorted(self.stats().items(), key=lambda item: item[1]["total_ms"], reverse=True)[:limit]
+        lines = [f"{'name':<40}{'calls':>7}{'total ms':>10}{'p50 ms':>9}{'p99 ms':>9}{'same':>6}"]
+        for name, entry in rows:
+            lines.append(
+                f"{name[:39]:<40}{entry['count']:>7}{entry['total_ms']:>10.3f}{entry['p50_ms']:>9.4f}"
+                f"{entry['p99_ms']:>9.4f}{entry['unchanged']:>6}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "stats": self.stats(),
+            "spans": [
+                {
+                    "name": span.name,
+                    "category": span.category,
+                    "start_us": (span.start_ns - self._origin_ns) / 1e3,
+                    "duration_us": span.duration_ns / 1e3,
+                    "trigger": span.trigger,
+                    "args": span.args,
+                }
+                for span in self._spans
+            ],
+        }
+
+    def dump_json(self, path):
+        """Write :meth:`stats` and the ring buffer to ``path`` as JSON."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def chrome_trace(self):
+        """The ring buffer as a Chrome trace event dict (complete "X" events, microseconds)."""
+        pid = os.getpid()
+        events = []
+        for span in self._spans:
+            args = dict(span.args or {})
+            if span.trigger is not None:
+                args["trigger"] = span.trigger
+            events.append({
+                "name": span.name,
+                "cat": span.category,
+                "ph": "X",
+                "ts": (span.start_ns - self._origin_ns) / 1e3,
+                "dur": span.duration_ns / 1e3,
+                "pid": pid,
+                "tid": span.thread,
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_chrome_trace(self, path):
+        """Write the ring buffer to ``path`` in Chrome trace format."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+class _Trigger:
+    __slots__ = ("_profiler", "_name")
+
+    def __init__(self, profiler, name):
+        self._profiler = profiler
+        self._name = name
+
+    def __enter__(self):
+        self._profiler._triggers.append(self._name)
+
+    def __exit__(self, *exc_info):
+        self._profiler._triggers.pop()
+
+
+class _Span:
+    __slots__ = ("_profiler", "_name", "_category", "_start", "args")
+
+    def __init__(self, profiler, name, category, args):
+        self._profiler = profiler
+        self._name = name
+        self._category = category
+        self._start = None
+        self.args = args
+
+    def __enter__(self):
+        if self._profiler.enabled:
+            self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._start is not None:
+            self._profiler.record(
+                self._name, self._category, self._start, time.perf_counter_ns() - self._start, self.args
+            )
+
+
+def _percentile(samples, percent):
+    # Nearest rank on sorted samples
+    if not samples:
+        return 0
+    rank = max(1, -(-len(samples) * percent // 100))
+    return samples[int(rank) - 1]
+
+
+PROFILER = Profiler(enabled=os.environ.get("UI_FOR_OV_PROFILE", "") not in ("", "0"))
+
+
+def profiled(category="update", trigger=False):
+    """Decorator instrumenting a function with :data:`PROFILER`; see :meth:`Profiler.wrap`."""
+
+    def decorate(function):
+        return PROFILER.wrap(function, category=category, trigger=trigger)
+
+    return decorate
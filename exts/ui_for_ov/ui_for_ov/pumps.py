@@ -0,0 +1,120 @@
+"""Vectorized CDU pump operating points.
+
+A CDU pump (PQ curve and rated power of a catalog CDU, by default ``engine.CDU_MODEL``) runs where its
+curve meets the system curve of the pod it serves. The pump is then slowed down to the flow the pod needs,
+and the affinity laws give its speed and power. The functions here do that for arrays of (system curve,
+flow) pairs at once. System curves come from :func:`ui_for_ov.engine.calculate_system_curve`, so every CDU
+count of every pod with liquid cooled racks is covered, not only the fitted ones.
+"""
+import numpy as np
+
+from . import engine
+
+
+def quadratic_roots(a, b, c):
+    """Roots of a*x^2 + b*x + c for arrays of coefficients, without catastrophic cancellation.
+
+    Returns:
+        ``(larger, smaller)`` float arrays; NaN where there is no real root. Where ``a`` is 0 both are
+        the root of the linear equation.
+    """
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (a, b, c)))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sqrt_discriminant = np.sqrt(b ** 2 - 4 * a * c)  # NaN where negative
+        q = -0.5 * (b + np.copysign(sqrt_discriminant, b))
+        root1 = np.where(q == 0, 0.0, q / a)
+        root2 = np.where(q == 0, 0.0, c / q)
+        linear = a == 0
+        root1 = np.where(linear, -c / b, root1)
+        root2 = np.where(linear, -c / b, root2)
+    return np.fmax(root1, root2), np.fmin(root1, root2)
+
+
+def system_curves(pod_types, total_cdus, pod_codes=None):
+    """System curve coefficients for arrays of (pod type, CDU count).
+
+    Args:
+        pod_types: Pod type per point, or with ``pod_codes`` the labels those codes index into.
+        total_cdus: CDU count per point.
+        pod_codes: Optional integer codes into ``pod_types``, for callers that already encoded them.
+
+    Returns:
+        ``(a, b, c)`` float arrays; NaN where the pod has no system curve.
+    """
+    if pod_codes is None:
+        pod_types = np.asarray(pod_types, dtype=object)
+        flat = pod_types.ravel().tolist()
+        labels = list(dict.fromkeys(flat))
+        code_of = {label: code for code, label in enumerate(labels)}
+        pod_codes = np.fromiter(map(code_of.__getitem__, flat), dtype=np.int64, count=len(flat))
+        pod_codes = pod_codes.reshape(pod_types.shape)
+    else:
+        labels = list(pod_types)
+    pod_codes, total_cdus = np.broadcast_arrays(np.asarray(pod_codes, dtype=np.int64), np.asarray(total_cdus))
+    cdus = np.where(np.isfinite(total_cdus), total_cdus, 0).clip(0).astype(np.int64)
+
+    # Few distinct (pod, CDUs) pairs in practice: resolve each once, then gather
+    stride = int(cdus.max(initial=0)) + 1
+    keys, inverse = np.unique(pod_codes * stride + cdus, return_inverse=True)
+    table = np.full((len(keys), 3), np.nan)
+    for row, key in enumerate(keys.tolist()):
+        code, count = divmod(key, stride)
+        curve = engine.calculate_system_curve(labels[code], count)
+        if curve is not None:
+            table[row] = (curve["a"], curve["b"], curve["c"])
+    curves = table[inverse.reshape(pod_codes.shape)]
+    return curves[..., 0], curves[..., 1], curves[..., 2]
+
+
+def operating_point(a, b, c, cdu=None):
+    """Intersection of a CDU's pump curve with system curves ``a*q^2 + b*q + c``.
+
+    Args:
+        cdu: :class:`ui_for_ov.catalog.Equipment` entry with a pump curve; defaults to ``engine.CDU_MODEL``.
+
+    Returns:
+        ``(flow, dp)`` arrays at the operating point (the larger intersection); NaN where the curves do
+        not meet.
+    """
+    pump = (cdu or engine.equipment_catalog()[engine.CDU_MODEL]).pump_curve
+    flow, _ = quadratic_roots(pump["a"] - np.asarray(a), pump["b"] - np.asarray(b), pump["c"] - np.asarray(c))
+    return flow, _dp(a, b, c, flow)
+
+
+def solve(a, b, c, flow, cdu=None):
+    """Run a CDU's pumps on system curves ``(a, b, c)`` at the required flows per CDU.
+
+    At the operating point the pump runs at its rated speed (``engine.RPM1``) and draws the catalog power of
+    ``cdu`` (by default the ``engine.CDU_MODEL`` entry).
+
+    Returns:
+        dict of float arrays: ``flow1``/``dp1`` at the operating point, ``dp2`` at the required ``flow``,
+        ``rpm2`` and ``hp2`` from the affinity laws. NaN where the result is undefined (no curve, no
+        operating point, dp2 / dp1 < 0, or no rated power).
+    """
+    cdu = cdu or engine.equipment_catalog()[engine.CDU_MODEL]
+    rated_power = cdu.power if cdu.power is not None else np.nan
+    flow1, dp1 = operating_point(a, b, c, cdu)
+    dp2 = _dp(a, b, c, np.asarray(flow, dtype=np.float64))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rpm2 = np.sqrt(dp2 / dp1) * (engine.RPM1 ** 2)
+    rpm2 = np.where(dp1 == 0, np.nan, rpm2)
+    return {
+        "flow1": flow1,
+        "dp1": dp1,
+        "dp2": dp2,
+        "rpm2": rpm2,
+        "hp2": ((rpm2 / engine.RPM1) ** 3) * rated_power,
+    }
+
+
+def cdu_pump_power(pod_types, total_cdus, flow_per_cdu, pod_codes=None):
+    """Vectorized :func:`ui_for_ov.engine.calculate_cdu_pump_power`: HP2 per CDU, NaN where undefined.
+
+    ``pod_types`` and ``pod_codes`` are as in :func:`system_curves`.
+    """
+    return solve(*system_curves(pod_types, total_cdus, pod_codes), flow_per_cdu)["hp2"]
+
+
+def _dp(a, b, c, flow):
+    return np.asarray(a) * flow ** 2 + np.asarray(b) * flow + np.asarray(c)
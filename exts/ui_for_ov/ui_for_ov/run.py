@@ -0,0 +1,214 @@
+"""Command-line batch runner for scenario files, usable without Omniverse Kit.
+
+Usage (from ``exts/ui_for_ov``)::
+
+    python -m ui_for_ov.run scenarios.jsonl -o results.jsonl --workers 8 --chunk-size 2000
+
+Scenario records come from JSONL (one object per line) or CSV (a header row), chosen by the file suffix;
+``-`` reads JSONL from stdin. Keys are :class:`ui_for_ov.engine.Scenario` fields, missing ones take the
+Scenario defaults and other keys (e.g. an ``id``) are copied to the output. Records are read in chunks
+evaluated by :func:`ui_for_ov.batch.evaluate_batch` on a process pool; JSON lines are decoded and results
+encoded in the workers, so the main process only moves text. At most two chunks per worker are in flight
+and results are written as they complete, in input order, so memory stays bounded whatever the file size.
+A throughput summary goes to stderr at the end.
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import data, engine
+from .batch import evaluate_batch
+
+NUMERIC_FIELDS = ("num_pods", "air_supply_temp", "tcs_liquid_temp", "fws_air_temp", "fws_liquid_temp")
+
+# Tables of a worker process, set by _init_worker
+_tables = {}
+
+
+def read_records(path):
+    """Yield scenario records from a JSONL or CSV file, or JSONL from stdin for ``-``.
+
+    CSV rows are dicts; JSONL lines are yielded undecoded (see :func:`evaluate_records`).
+    """
+    if path == "-":
+        yield from (line for line in sys.stdin if line.strip())
+        return
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        if str(path).lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            yield from (line for line in f if line.strip())
+
+
+def _decode(record):
+    if not isinstance(record, str):
+        return record
+    try:
+        decoded = json.loads(record)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid scenario record {record.strip()[:80]!r}: {e}") from None
+    if not isinstance(decoded, dict):
+        raise ValueError(f"Invalid scenario record {record.strip()[:80]!r}: not a JSON object")
+    return decoded
+
+
+def to_scenario(record):
+    """Build a :class:`ui_for_ov.engine.Scenario` from a record; numbers may be given as strings.
+
+    Unknown pod types and CDU types, and unknown cities when the site tables are loaded, raise ValueError
+    rather than leaving the results undefined or silently sized for another option.
+    """
+    values = {}
+    for field in engine.Scenario._fields:
+        value = record.get(field)
+        if value is None or value == "":
+            continue
+        values[field] = float(value) if field in NUMERIC_FIELDS else value
+    if "num_pods" in values:
+        values["num_pods"] = int(values["num_pods"])
+    scenario = engine.Scenario(**values)
+    if scenario.pod_type not in engine.POD_RACK_COUNTS:
+        raise ValueError(f"Unknown pod type '{scenario.pod_type}'")
+    if scenario.cdu_type not in engine.CDU_TYPES:
+        raise ValueError(f"Unknown CDU type '{scenario.cdu_type}', expected one of {engine.CDU_TYPES}")
+    climate = _tables.get("climate")
+    if scenario.city is not None and climate is not None and scenario.city not in climate:
+        raise ValueError(f"Unknown city '{scenario.city}'")
+    return scenario
+
+
+def evaluate_records(records):
+    """Evaluate a chunk of records (dicts or JSON text); returns one output dict per record, input fields first."""
+    if not records:
+        return []
+    records = [_decode(record) for record in records]
+    # Scenario of columns: one tuple per field
+    columns = engine.Scenario(*zip(*(to_scenario(record) for record in records)))
+    results = evaluate_batch(
+        columns.air_supply_temp,
+        columns.tcs_liquid_temp,
+        np.asarray(columns.pod_type, dtype=object),
+        pod_counts=columns.num_pods,
+        cities=np.asarray(columns.city, dtype=object),
+        fws_air_temps=columns.fws_air_temp,
+        fws_liquid_temps=columns.fws_liquid_temp,
+        cdu_types=np.asarray(columns.cdu_type, dtype=object),
+        chillers=_tables.get("chillers"),
+        climate=_tables.get("climate"),
+    )
+    names = list(results)
+    rows = zip(*(_column_values(results[name]) for name in names))
+    return [dict(record, **dict(zip(names, row))) for record, row in zip(records, rows)]
+
+
+def _evaluate_chunk(records):
+    # Worker task: JSONL text of the outputs, cheap to send back
+    return "".join(json.dumps(output) + "\n" for output in evaluate_records(records)), len(records)
+
+
+def _column_values(column):
+    # Python values of an output column; NaN (undefined) is not valid JSON, so it becomes None
+    values = column.tolist()
+    if column.dtype.kind == "f":
+        missing = np.isnan(column)
+        if missing.any():
+            values = [None if flag else value for value, flag in zip(values, missing.tolist())]
+    return values
+
+
+def run(records, write, workers=None, chunk_size=1000, tables=None):
+    """Evaluate ``records`` in chunks and write their outputs as JSONL, in input order.
+
+    Args:
+        records: Iterable of scenario records, as yielded by :func:`read_records`.
+        write: Called with the JSONL text of each chunk's outputs.
+        workers: Worker processes; defaults to the CPU count. 0 or 1 evaluates in this process.
+        chunk_size: Records per task.
+        tables: ``(chillers_path, climate_path, cache_dir)``, or None to evaluate without site data.
+
+    Returns:
+        Number of records evaluated.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    records = iter(records)
+    chunks = iter(lambda: list(itertools.islice(records, chunk_size)), [])
+    count = 0
+    if workers <= 1:
+        _init_worker(tables)
+        for chunk in chunks:
+            text, evaluated = _evaluate_chunk(chunk)
+            write(text)
+            count += evaluated
+        return count
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(tables,)) as pool:
+        pending = deque()
+        for chunk in itertools.chain(chunks, [None]):
+            if chunk is not None:
+                pending.append(pool.submit(_evaluate_chunk, chunk))
+            # Bounded: drain the oldest chunk once enough are queued, and everything at the end
+            while pending and (chunk is None or len(pending) >= 2 * workers):
+                text, evaluated = pending.popleft().result()
+                write(text)
+                count += evaluated
+    return count
+
+
+def _init_worker(tables):
+    _tables.clear()
+    if tables is not None:
+        chillers_path, climate_path, cache_dir = tables
+        _tables["chillers"] = data.load_chiller_table(chillers_path, cache_dir)
+        _tables["climate"] = data.load_climate_store(climate_path, cache_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m ui_for_ov.run", description="Evaluate a file of sizing scenarios."
+    )
+    parser.add_argument("scenarios", help="JSONL or CSV scenario file, or - for JSONL on stdin")
+    parser.add_argument("-o", "--output", default="-", help="JSONL output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="scenarios per task (default: 1000)")
+    parser.add_argument("--chillers", default=str(data.CHILLERS_CSV), help="chiller table (Chillers.csv)")
+    parser.add_argument("--climate", default=str(data.CLIMATE_CSV), help="climate table (TCO_new.csv)")
+    parser.add_argument("--cache-dir", default=str(data.CACHE_DIR), help="snapshot cache directory")
+    parser.add_argument("--no-site", action="store_true", help="skip the site dependent (city) results")
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    tables = None if args.no_site else (args.chillers, args.climate, args.cache_dir)
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    start = time.perf_counter()
+    try:
+        count = run(
+            read_records(args.scenarios),
+            output.write,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            tables=tables,
+        )
+    except (OSError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"{count} scenarios in {elapsed:.2f} s ({rate:,.0f} scenarios/s)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+"""Frame-coalesced scheduling of UI recomputes.
+
+Value-changed events arrive once per keystroke or combo step. :class:`UpdateScheduler` collapses every
+request made within one Kit frame into a single call of its callback on the next app update, so a burst of
+input costs at most one model evaluation per frame.
+"""
+
+
+def next_update(function):
+    """Call ``function`` on the next Kit app update; returns a future that can be cancelled."""
+    import asyncio
+
+    import omni.kit.app
+
+    async def run():
+        await omni.kit.app.get_app().next_update_async()
+        function()
+
+    return asyncio.ensure_future(run())
+
+
+class UpdateScheduler:
+    """Run ``callback`` at most once per frame, however many times :meth:`request` is called.
+
+    Args:
+        callback: Called without arguments on the next update after a request.
+        defer: Schedules a function for the next frame and returns a handle with ``cancel()``.
+            Defaults to :func:`next_update`; tests pass their own.
+    """
+
+    def __init__(self, callback, defer=next_update):
+        self._callback = callback
+        self._defer = defer
+        self._handle = None
+        self._pending = False
+        self.requests = 0
+        self.runs = 0
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def request(self):
+        """Ask for a run on the next frame. Requests made before it happens are coalesced."""
+        self.requests += 1
+        self._pending = True
+        if self._handle is None:
+            self._handle = self._defer(self._on_update)
+
+    def flush(self):
+        """Run the pending update now instead of on the next frame, e.g. from tests."""
+        self._cancel()
+        self._run()
+
+    def shutdown(self):
+        """Drop any pending update; the callback is not called again until the next request."""
+        self._cancel()
+        self._pending = False
+
+    def _on_update(self):
+        self._handle = None
+        self._run()
+
+    def _run(self):
+        if not self._pending:
+            return
+        self._pending = False
+        self.runs += 1
+        self._callback()
+
+    def _cancel(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
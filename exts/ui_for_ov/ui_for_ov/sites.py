@@ -0,0 +1,116 @@
+"""Multi-site feasibility sweep: one design evaluated at every climate station.
+
+:func:`sweep_sites` reports, per station, the dry cooler and closed-loop tower decisions of the panel's
+liquid cooling options, the chiller evaporator rise and the resulting chilled water flows. Stations are cut
+into chunks that a process pool evaluates with :func:`ui_for_ov.batch.evaluate_batch`. Each worker loads the
+chiller and climate tables once, from their memory-mapped snapshots, so tasks only carry row ranges.
+"""
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from . import data, engine
+from .batch import evaluate_batch
+
+# Per station outputs, in report order
+SITE_FIELDS = (
+    "dry_bulb",
+    "wet_bulb",
+    "dry_cooler",
+    "cooling_tower",
+    "chilled_water_temperature_rise",
+    "chilled_water_flow_rate_per_crah",
+    "chilled_water_flow_rate_per_pod",
+)
+
+# Tables of a worker process, set by _init_worker
+_tables = {}
+
+
+def sweep_sites(
+    scenario=engine.Scenario(),
+    chillers_path=data.CHILLERS_CSV,
+    climate_path=data.CLIMATE_CSV,
+    cache_dir=data.CACHE_DIR,
+    workers=None,
+    chunk_size=None,
+):
+    """Evaluate ``scenario`` at every station of the climate table.
+
+    Args:
+        scenario: :class:`ui_for_ov.engine.Scenario`; its ``city`` is ignored.
+        chillers_path, climate_path, cache_dir: Tables to load, as for :mod:`ui_for_ov.data`.
+        workers: Worker processes; defaults to the CPU count. 0 or 1 evaluates in this process.
+        chunk_size: Stations per task; by default about four tasks per worker.
+
+    Returns:
+        dict with ``city``, ``country`` and ``state`` label lists and one array per :data:`SITE_FIELDS`
+        entry, in station (file) order.
+    """
+    tables = (str(chillers_path), str(climate_path), str(cache_dir))
+    climate = data.load_climate_store(climate_path, cache_dir)
+    stations = len(climate)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunks = station_chunks(stations, chunk_size or max(1, math.ceil(stations / (max(workers, 1) * 4))))
+
+    if workers <= 1 or len(chunks) <= 1:
+        _init_worker(*tables)
+        parts = [_evaluate_chunk(scenario, chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=tables) as pool:
+            # map keeps the chunk order
+            parts = list(pool.map(_evaluate_chunk, [scenario] * len(chunks), chunks))
+    return collect(climate, parts)
+
+
+def station_chunks(stations, chunk_size):
+    """``(start, stop)`` row ranges covering ``stations`` rows in chunks of ``chunk_size``."""
+    return [(start, min(start + chunk_size, stations)) for start in range(0, stations, chunk_size)]
+
+
+def evaluate_stations(scenario, chillers, climate, chunk):
+    """Evaluate ``scenario`` at the stations of one ``(start, stop)`` row range of ``climate``.
+
+    Returns:
+        dict of :data:`SITE_FIELDS` entry -> array over the range.
+    """
+    # Stations are passed by row, not by city name: several stations may share a name
+    results = evaluate_batch(
+        scenario.air_supply_temp,
+        scenario.tcs_liquid_temp,
+        scenario.pod_type,
+        pod_counts=scenario.num_pods or 1,
+        station_rows=np.arange(*chunk),
+        fws_air_temps=scenario.fws_air_temp,
+        fws_liquid_temps=scenario.fws_liquid_temp,
+        cdu_types=scenario.cdu_type,
+        chillers=chillers,
+        climate=climate,
+    )
+    return {name: results[name] for name in SITE_FIELDS}
+
+
+def collect(climate, parts):
+    """Join the :func:`evaluate_stations` results of consecutive chunks into the :func:`sweep_sites` result."""
+    results = {}
+    for name in ("city", "country", "state"):
+        labels, codes = climate.labels(name)
+        results[name] = [labels[code] for code in codes.tolist()]
+    for name in SITE_FIELDS:
+        results[name] = np.concatenate([part[name] for part in parts]) if parts else np.empty(0)
+    return results
+
+
+def _init_worker(chillers_path, climate_path, cache_dir):
+    key = (chillers_path, climate_path, cache_dir)
+    if _tables.get("key") != key:
+        _tables["chillers"] = data.load_chiller_table(chillers_path, cache_dir)
+        _tables["climate"] = data.load_climate_store(climate_path, cache_dir)
+        _tables["key"] = key
+
+
+def _evaluate_chunk(scenario, chunk):
+    return evaluate_stations(scenario, _tables["chillers"], _tables["climate"], chunk)
@@ -0,0 +1,228 @@
+"""Versioned, memory-mappable binary snapshots of the CSV data tables.
+
+Parsing the CSVs on every start is the bulk of the extension's load time. A snapshot stores a table as
+columns: numeric columns as raw float64 buffers and text columns as uint32 codes into a label list. It is
+compiled from the source file on first use and afterwards mapped read-only, with the columns exposed as
+zero-copy ``memoryview`` s of the mapping.
+
+A snapshot is only used while it matches its source: the source size and mtime are checked first, and
+when they differ the SHA-1 of the source decides. Anything else (missing, stale, another format version,
+corrupt) makes :func:`load` recompile it.
+
+File layout::
+
+    b"UIOVSNAP" | uint32 version | uint32 header length | JSON header | padding | column buffers
+
+Each buffer starts on an 8-byte boundary; its offset and length are recorded in the header.
+"""
+import json
+import mmap
+import os
+import struct
+from array import array
+from pathlib import Path
+
+MAGIC = b"UIOVSNAP"
+VERSION = 1
+_PREFIX = struct.Struct("<8sII")
+_ALIGNMENT = 8
+
+
+class Snapshot:
+    """Columns of one table, mapped from a snapshot file."""
+
+    def __init__(self, path, header, buffer):
+        self.path = Path(path) if path is not None else None
+        self.source = header["source"]
+        self._columns = header["columns"]
+        self._buffer = buffer
+        self._length = header["length"]
+
+    def __len__(self):
+        return self._length
+
+    @property
+    def names(self):
+        return list(self._columns)
+
+    def numeric(self, name):
+        """Zero-copy float64 view of a numeric column. Missing values are NaN."""
+        column = self._columns[name]
+        return self._view(column, "d")
+
+    def categorical(self, name):
+        """Return ``(labels, codes)`` of a text column; codes are a zero-copy uint32 view."""
+        column = self._columns[name]
+        return column["labels"], self._view(column, "I")
+
+    def strings(self, name):
+        """Decode a text column into a list of labels (None for missing values)."""
+        labels, codes = self.categorical(name)
+        return [labels[code] for code in codes]
+
+    def _view(self, column, typecode):
+        start = column["offset"]
+        return self._buffer[start:start + column["nbytes"]].cast(typecode)
+
+
+def snapshot_path(source, cache_dir):
+    """Snapshot file of ``source`` inside ``cache_dir``; the format version is part of the name."""
+    return Path(cache_dir) / f"{Path(source).stem}.v{VERSION}.snap"
+
+
+def source_signature(source, with_hash=True):
+    """Size, mtime and (optionally) SHA-1 of a source file."""
+    stat = os.stat(source)
+    signature = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    if with_hash:
+        signature["sha1"] = _sha1(source)
+    return signature
+
+
+def write(path, source, numeric=None, categorical=None):
+    """Write a snapshot of ``source`` to ``path``.
+
+    Args:
+        path: Snapshot file to write; it is replaced atomically.
+        source: Source file the columns were read from, recorded for validation.
+        numeric: dict of column name -> sequence of floats (None for missing).
+        categorical: dict of column name -> sequence of str labels (None for missing).
+    """
+    data = _serialize(source, numeric or {}, categorical or {})
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(data)
+    os.replace(temporary, path)
+
+
+def read(path, source=None):
+    """Map a snapshot file.
+
+    Args:
+        path: Snapshot file.
+        source: Source file to validate against. Without it the snapshot is trusted as is.
+
+    Returns:
+        a :class:`Snapshot`, or None when the file is missing, of another version, corrupt or stale.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    snapshot = _parse(memoryview(mapping), path)
+    if snapshot is None or (source is not None and not _matches(snapshot.source, source)):
+        return None
+    return snapshot
+
+
+def load(source, reader, cache_dir):
+    """Return the snapshot of ``source``, compiling it with ``reader`` when needed.
+
+    Args:
+        source: CSV (or any) file the table is read from.
+        reader: Called as ``reader(source)``; returns ``(numeric, categorical)`` column dicts as
+            accepted by :func:`write`.
+        cache_dir: Directory holding the snapshots. If it cannot be written, the snapshot is kept
+            in memory for this session only.
+    """
+    path = snapshot_path(source, cache_dir)
+    snapshot = read(path, source)
+    if snapshot is not None:
+        return snapshot
+
+    numeric, categorical = reader(source)
+    try:
+        write(path, source, numeric, categorical)
+    except OSError:
+        return _parse(memoryview(_serialize(source, numeric, categorical)), None)
+    return read(path, source)
+
+
+def _serialize(source, numeric, categorical):
+    buffers = []
+    columns = {}
+    lengths = set()
+    for name, values in numeric.items():
+        data = array("d", (float("nan") if value is None else value for value in values))
+        lengths.add(len(data))
+        columns[name] = {"kind": "numeric"}
+        buffers.append((name, data.tobytes()))
+    for name, values in categorical.items():
+        labels, codes = _encode(values)
+        lengths.add(len(codes))
+        columns[name] = {"kind": "categorical", "labels": labels}
+        buffers.append((name, codes.tobytes()))
+    if len(lengths) > 1:
+        raise ValueError(f"Columns of a snapshot must have equal lengths, got {sorted(lengths)}")
+    offset = 0
+    for name, data in buffers:
+        columns[name].update(offset=offset, nbytes=len(data))
+        offset += _padded(len(data))
+
+    header = json.dumps({
+        "version": VERSION,
+        "source": {"name": Path(source).name, **source_signature(source)},
+        "length": lengths.pop() if lengths else 0,
+        "columns": columns,
+    }).encode("utf-8")
+    parts = [_PREFIX.pack(MAGIC, VERSION, len(header)), header]
+    parts.append(b"\0" * (_padded(_PREFIX.size + len(header)) - _PREFIX.size - len(header)))
+    for _, data in buffers:
+        parts.append(data)
+        parts.append(b"\0" * (_padded(len(data)) - len(data)))
+    return b"".join(parts)
+
+
+def _parse(buffer, path):
+    try:
+        magic, version, header_length = _PREFIX.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            return None
+        header = json.loads(bytes(buffer[_PREFIX.size:_PREFIX.size + header_length]).decode("utf-8"))
+    except (struct.error, ValueError):
+        return None
+    data = buffer[_padded(_PREFIX.size + header_length):]
+    end = max((column["offset"] + column["nbytes"] for column in header["columns"].values()), default=0)
+    if len(data) < end:
+        return None
+    return Snapshot(path, header, data)
+
+
+def _matches(recorded, source):
+    try:
+        current = source_signature(source, with_hash=False)
+    except OSError:
+        return False
+    if current["size"] == recorded["size"] and current["mtime_ns"] == recorded["mtime_ns"]:
+        return True
+    # Touched (checkout, copy) but possibly unchanged: the content hash decides
+    return current["size"] == recorded["size"] and _sha1(source) == recorded["sha1"]
+
+
+def _sha1(path):
+    import hashlib
+
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _encode(values):
+    labels = []
+    code_of = {}
+    codes = array("I")
+    for value in values:
+        code = code_of.get(value)
+        if code is None:
+            code = code_of[value] = len(labels)
+            labels.append(value)
+        codes.append(code)
+    return labels, codes
+
+
+def _padded(size):
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
@@ -0,0 +1,126 @@
+"""Type-ahead search over the climate stations.
+
+:class:`StationIndex` answers the city picker's queries without scanning every station:
+
+* a sorted list of the words of every station's city, state and country, searched with :mod:`bisect`,
+  so a query word matches the words it is a prefix of ("dal lov" finds DALLAS LOVE FIELD);
+* a trigram index, so query words of three or more characters also match inside words ("hare" finds
+  CHICAGO O'HARE). Only the stations of the query word's rarest trigram are checked.
+
+Matches come back as climate store rows, stations whose city starts with the first query word first,
+then by city name. The indexes are built on first use, or ahead of time with :meth:`StationIndex.prepare`
+on a worker thread, so building them never delays opening the window.
+"""
+import bisect
+import re
+import threading
+
+import numpy as np
+
+_WORD = re.compile(r"[0-9A-Z]+")
+
+
+def tokens(text):
+    """Upper-case alphanumeric words of a query or a name."""
+    return _WORD.findall(str(text or "").upper())
+
+
+class StationIndex:
+    """Prefix and trigram index over the stations of a :class:`ui_for_ov.climate.ClimateStore`.
+
+    Construction only orders the stations by city (for the empty query); the word and trigram indexes
+    are built by :meth:`prepare`, which the first non-empty query calls if nobody did before.
+    """
+
+    def __init__(self, climate):
+        self._climate = climate
+        self._labels = {name: climate.labels(name) for name in ("city", "state", "country")}
+        city_labels, city_codes = self._labels["city"]
+        label_rank = np.empty(len(city_labels), dtype=np.int64)
+        label_rank[sorted(range(len(city_labels)), key=lambda code: city_labels[code] or "")] = np.arange(
+            len(city_labels)
+        )
+        self._order = np.argsort(label_rank[city_codes], kind="stable").tolist() if len(climate) else []
+        self._texts = None
+        self._cities = None
+        self._position = None
+        self._words = None
+        self._word_rows = None
+        self._trigrams = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._order)
+
+    @property
+    def ready(self):
+        return self._trigrams is not None
+
+    def prepare(self):
+        """Build the word and trigram indexes if not done yet; safe to call from a worker thread."""
+        with self._lock:
+            if self._trigrams is not None:
+                return self
+            # Normalized "CITY STATE COUNTRY" text of each row, city words first
+            texts = [" ".join(tokens(self.label(row))) for row in range(len(self._order))]
+            position = [0] * len(self._order)
+            for index, row in enumerate(self._order):
+                position[row] = index
+            pairs = sorted({(word, row) for row, text in enumerate(texts) for word in text.split()})
+            trigrams = {}
+            for row, text in enumerate(texts):
+                for trigram in {word[i:i + 3] for word in text.split() for i in range(len(word) - 2)}:
+                    trigrams.setdefault(trigram, []).append(row)
+            self._texts = texts
+            self._cities = [" ".join(tokens(self._labels["city"][0][code])) for code in self._labels["city"][1].tolist()]
+            self._position = position
+            self._words = [word for word, _ in pairs]
+            self._word_rows = [row for _, row in pairs]
+            # Published last: ready means every index is in place
+            self._trigrams = trigrams
+        return self
+
+    def search(self, query):
+        """Rows of the stations matching every word of ``query``; every station for an empty query.
+
+        Returns:
+            list of climate store rows, stations whose city starts with the first query word first, then
+            by city.
+        """
+        words = tokens(query)
+        if not words:
+            return list(self._order)
+        self.prepare()
+        rows = None
+        # Longest (most selective) words first; the candidate set only shrinks from there
+        for word in sorted(words, key=len, reverse=True):
+            matches = self._infix_rows(word) if len(word) >= 3 else self._prefix_rows(word)
+            rows = matches if rows is None else rows & matches
+            if not rows:
+                return []
+        rows = sorted(rows, key=self._position.__getitem__)
+        first, cities = words[0], self._cities
+        leading = [row for row in rows if cities[row].startswith(first)]
+        if not leading or len(leading) == len(rows):
+            return rows
+        return leading + [row for row in rows if not cities[row].startswith(first)]
+
+    def record(self, row):
+        """The :class:`ui_for_ov.climate.ClimateRecord` of a row."""
+        return self._climate.record(row)
+
+    def label(self, row):
+        """Display name of a row: "CITY, STATE, COUNTRY" without the blank parts."""
+        parts = (labels[codes[row]] for labels, codes in self._labels.values())
+        return ", ".join(part for part in parts if part)
+
+    def _prefix_rows(self, word):
+        start = bisect.bisect_left(self._words, word)
+        stop = bisect.bisect_left(self._words, word + "\uffff", start)
+        return set(self._word_rows[start:stop])
+
+    def _infix_rows(self, word):
+        postings = [self._trigrams.get(word[i:i + 3], ()) for i in range(len(word) - 2)]
+        rarest = min(postings, key=len)
+        texts = self._texts
+        return {row for row in rarest if word in texts[row]}
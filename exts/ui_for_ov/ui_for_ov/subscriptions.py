@@ -0,0 +1,38 @@
+"""Registry of the callbacks the window registers, so shutdown can remove them all.
+
+Value-changed callbacks keep the extension (and everything it references) alive for as long as the
+models they are registered on. :class:`Subscriptions` records each registration and any other teardown
+step, and :meth:`Subscriptions.clear` undoes them in reverse order.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Subscriptions:
+    """Callbacks registered on UI models, and other teardown steps, removed together by :meth:`clear`."""
+
+    def __init__(self):
+        self._teardown = []
+
+    def __len__(self):
+        return len(self._teardown)
+
+    def value_changed(self, model, fn):
+        """Call ``fn(model)`` whenever the value of ``model`` changes, until :meth:`clear`."""
+        subscription_id = model.add_value_changed_fn(fn)
+        self._teardown.append(lambda: model.remove_value_changed_fn(subscription_id))
+        return subscription_id
+
+    def add(self, teardown):
+        """Call ``teardown()`` on :meth:`clear`, e.g. a widget's ``destroy``."""
+        self._teardown.append(teardown)
+
+    def clear(self):
+        """Remove every callback and run every teardown step, the most recent first."""
+        teardown, self._teardown = self._teardown, []
+        for step in reversed(teardown):
+            try:
+                step()
+            except Exception as e:
+                logger.warning(f"Error during UI teardown: {e}")
@@ -0,0 +1,214 @@
+"""Background execution of heavy computations started from the window.
+
+Value-changed callbacks run on Kit's main thread, so a sweep or optimizer run inside one freezes the UI
+until it returns. :class:`TaskRunner` runs such work on an executor instead (a thread pool by default; a
+process pool for picklable functions) and follows it from a coroutine on the main thread's asyncio loop:
+
+* :meth:`TaskRunner.map` cuts a job into items (station chunks, grid blocks). Its progress is the share of
+  items done, at most two per worker are in flight, and cancelling stops it between items.
+* :meth:`TaskRunner.run` runs one function that receives its :class:`Task`. It reports progress with
+  :meth:`Task.report` and polls :attr:`Task.cancel_requested` to stop early.
+
+Progress and completion callbacks are always called on the main thread, so they may update widgets.
+"""
+import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+CANCELLED = "cancelled"
+FAILED = "failed"
+FINISHED_STATES = (DONE, CANCELLED, FAILED)
+
+
+class Task:
+    """A job of a :class:`TaskRunner`. Read it from the main thread; workers only call :meth:`report`."""
+
+    def __init__(self, name, total=0):
+        self.name = name
+        self.total = total
+        self.completed = 0
+        self.message = ""
+        self.state = PENDING
+        self.result = None
+        self.error = None
+        self._cancel_requested = threading.Event()
+        self._future = None
+        self._post = None
+
+    def __repr__(self):
+        return f"Task({self.name!r}, {self.state}, {self.completed}/{self.total})"
+
+    @property
+    def progress(self):
+        """Fraction done, 0 to 1."""
+        if self.state == DONE:
+            return 1.0
+        return min(self.completed / self.total, 1.0) if self.total else 0.0
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    @property
+    def cancel_requested(self):
+        """Whether :meth:`cancel` was called; long running functions should check it and return."""
+        return self._cancel_requested.is_set()
+
+    def cancel(self):
+        """Stop the job. Items not started are dropped; a running :meth:`TaskRunner.run` function stops
+        when it next checks :attr:`cancel_requested`, and its result is discarded."""
+        self._cancel_requested.set()
+        # A job that has not started yet sees the request when it does
+        if self.state == RUNNING and self._future is not None and not self._future.done():
+            self._future.cancel()
+
+    def report(self, completed, total=None, message=None):
+        """Report progress from any thread; the runner's ``on_change`` sees it on the main thread."""
+        self.completed = completed
+        if total is not None:
+            self.total = total
+        if message is not None:
+            self.message = message
+        if self._post is not None:
+            self._post()
+
+    async def wait(self):
+        """Wait until the job has finished; returns the task."""
+        if self._future is not None:
+            await asyncio.wait([self._future])
+        return self
+
+
+class TaskRunner:
+    """Run jobs on an executor without blocking the main thread.
+
+    Args:
+        executor: A ``concurrent.futures`` executor. By default the runner owns a thread pool of
+            ``workers`` threads and shuts it down in :meth:`shutdown`.
+        workers: Worker count of the default thread pool, and the in-flight limit of :meth:`map`.
+            Defaults to the CPU count.
+        on_change: Called with the :class:`Task` on the main thread whenever its state or progress changes.
+    """
+
+    def __init__(self, executor=None, workers=None, on_change=None):
+        self.workers = workers or getattr(executor, "_max_workers", None) or os.cpu_count() or 1
+        self._own_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="ui_for_ov")
+        self.on_change = on_change
+        self.tasks = []
+
+    @property
+    def busy(self):
+        return any(not task.finished for task in self.tasks)
+
+    def map(self, name, function, items, combine=list, on_done=None):
+        """Start a job calling ``function(item)`` for every item on the executor.
+
+        Args:
+            name: Shown with the job's progress.
+            function: Called once per item; must be picklable for a process pool.
+            items: Sequence of work items.
+            combine: Called on the main thread with the item results, in item order; its return value
+                becomes :attr:`Task.result`.
+            on_done: Called with the task on the main thread once it has finished, whatever its state.
+
+        Returns:
+            The started :class:`Task`.
+        """
+        items = list(items)
+        task = Task(name, len(items))
+        return self._start(task, functools.partial(self._map, task, function, items, combine), on_done)
+
+    def run(self, name, function, *args, on_done=None, **kwargs):
+        """Start a job calling ``function(task, *args, **kwargs)`` on the executor.
+
+        The function reports progress with ``task.report(...)`` and should return early once
+        ``task.cancel_requested`` is set. It receives the task itself, so it needs a thread pool.
+
+        Returns:
+            The started :class:`Task`; its result is the function's return value.
+        """
+        task = Task(name)
+        return self._start(task, functools.partial(self._call, task, function, args, kwargs), on_done)
+
+    def cancel_all(self):
+        for task in self.tasks:
+            task.cancel()
+
+    def shutdown(self):
+        """Cancel every job and release the default executor without waiting for running items."""
+        self.cancel_all()
+        if self._own_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _start(self, task, job, on_done):
+        loop = asyncio.get_event_loop()
+        task._post = lambda: loop.call_soon_threadsafe(self._notify, task)
+        task._future = asyncio.ensure_future(self._track(task, job, on_done))
+        self.tasks = [other for other in self.tasks if not other.finished] + [task]
+        return task
+
+    async def _track(self, task, job, on_done):
+        task.state = RUNNING
+        self._notify(task)
+        try:
+            if task.cancel_requested:
+                raise asyncio.CancelledError
+            task.result = await job()
+            task.state = CANCELLED if task.cancel_requested else DONE
+        except asyncio.CancelledError:
+            task.state = CANCELLED
+        except Exception as e:
+            task.state = FAILED
+            task.error = e
+            logger.warning(f"Task '{task.name}' failed: {e}")
+        if task.state != DONE:
+            task.result = None
+        self._notify(task)
+        if on_done is not None:
+            on_done(task)
+
+    async def _map(self, task, function, items, combine):
+        results = [None] * len(items)
+        pending = {}
+        queue = iter(enumerate(items))
+        try:
+            while True:
+                # Bounded: a cancelled job leaves at most one round of items to drop
+                while len(pending) < 2 * self.workers and not task.cancel_requested:
+                    index, item = next(queue, (None, None))
+                    if index is None:
+                        break
+                    pending[asyncio.wrap_future(self._executor.submit(function, item))] = index
+                if not pending:
+                    break
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    results[pending.pop(future)] = future.result()
+                    task.completed += 1
+                self._notify(task)
+        finally:
+            for future in pending:
+                future.cancel()
+        if task.cancel_requested:
+            return None
+        return combine(results)
+
+    async def _call(self, task, function, args, kwargs):
+        return await asyncio.wrap_future(self._executor.submit(function, task, *args, **kwargs))
+
+    def _notify(self, task):
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(task)
+        except Exception as e:
+            logger.warning(f"Error in task progress callback: {e}")
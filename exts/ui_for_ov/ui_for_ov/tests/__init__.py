@@ -1 +1,26 @@
-from .test_hello_world import *
\ No newline at end of file
+from .test_hello_world import *
+from .test_engine import *
+from .test_batch import *
+from .test_chillers import *
+from .test_climate import *
+from .test_graph import *
+from .test_scheduler import *
+from .test_snapshot import *
+from .test_memo import *
+from .test_pods import *
+from .test_pumps import *
+from .test_cdu_optimizer import *
+from .test_sites import *
+from .test_run import *
+from .test_columnar import *
+from .test_benchmarks import *
+from .test_profiler import *
+from .test_annual import *
+from .test_weather import *
+from .test_tasks import *
+from .test_stations import *
+from .test_item_models import *
+from .test_subscriptions import *
+from .test_catalog import *
+from .test_crah_optimizer import *
+from .test_campus import *
@@ -0,0 +1,73 @@
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import annual, data, engine
+
+
+class TestAnnual(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.chillers = data.load_chiller_table()
+        self.scenario = engine.Scenario(
+            pod_type="576 GPU DGX GB200 Super Pod", num_pods=4, fws_air_temp=12, fws_liquid_temp=30
+        )
+        hours = np.arange(annual.HOURS_PER_YEAR)
+        self.dry_bulb = 12 + 10 * np.sin(2 * np.pi * hours / 8760) + 5 * np.sin(2 * np.pi * hours / 24)
+        self.wet_bulb = self.dry_bulb - 4
+
+    async def test_matches_hour_by_hour(self):
+        results = annual.simulate(self.scenario, self.dry_bulb, self.wet_bulb, self.chillers, hourly=True)
+        design = engine.evaluate(self.scenario)
+        surface = self.chillers.surface(engine.CHILLER_MODEL)
+        for hour in (0, 2000, 4380, 6000):
+            dry_bulb = self.dry_bulb[hour]
+            air = surface.performance(12, dry_bulb)
+            expected = design["q_ac_per_pod"] * 4 / air.capacity * air.power_input
+            if 30 - 5 - dry_bulb < 0:
+                liquid = surface.performance(30, dry_bulb)
+                expected += design["liquid_cooling_capacity_per_pod"] * 4 / liquid.capacity * liquid.power_input
+            self.assertAlmostEqual(results["chiller_kw"][hour], expected)
+
+        self.assertEqual(results["it_kwh"], design["total_power"] * 8760)
+        self.assertAlmostEqual(results["crah_kwh"], design["crah_hp2"] * design["no_of_crahs"] * 4 * 8760)
+        self.assertAlmostEqual(results["cdu_pump_kwh"], design["cdu_hp_per_pod"] * 4 * 8760)
+        self.assertAlmostEqual(
+            results["cooling_kwh"], results["chiller_kwh"] + results["crah_kwh"] + results["cdu_pump_kwh"]
+        )
+        self.assertAlmostEqual(results["pue"], results["total_kwh"] / results["it_kwh"])
+        self.assertEqual(results["economizer_hours"], (self.dry_bulb <= 25).sum())
+
+    async def test_economizers(self):
+        dry = annual.simulate(self.scenario, self.dry_bulb, self.wet_bulb, self.chillers)
+        tower = annual.simulate(self.scenario, self.dry_bulb, self.wet_bulb, self.chillers, economizer="cooling_tower")
+        # Wet bulb runs below dry bulb, so the cooling tower is available more often
+        self.assertGreater(tower["economizer_hours"], dry["economizer_hours"])
+        self.assertLess(tower["chiller_kwh"], dry["chiller_kwh"])
+        with self.assertRaises(ValueError):
+            annual.simulate(self.scenario, self.dry_bulb, self.wet_bulb, self.chillers, economizer="lake")
+
+    async def test_rank_sites(self):
+        offsets = np.array([8.0, 0.0, 4.0])[:, np.newaxis]
+        results = annual.simulate(self.scenario, self.dry_bulb + offsets, self.wet_bulb + offsets, self.chillers)
+        self.assertEqual(results["pue"].shape, (3,))
+        ranking = annual.rank_sites(
+            self.scenario, ["hot", "cold", "mild"], self.dry_bulb + offsets, self.wet_bulb + offsets, self.chillers
+        )
+        self.assertEqual([name for name, _, _ in ranking], ["cold", "mild", "hot"])
+        self.assertAlmostEqual(ranking[0][1], results["total_kwh"][1])
+        self.assertGreater(ranking[0][2], 1)
+
+    async def test_pod_with_derived_pump_curve(self):
+        scenario = self.scenario._replace(pod_type="288 GPU DGX GB200 Super Pod", tcs_liquid_temp=30)
+        results = annual.simulate(scenario, self.dry_bulb, self.wet_bulb, self.chillers)
+        self.assertGreater(results["cdu_pump_kwh"], 0)
+        self.assertEqual(results["pods_without_pump_power"], 0)
+        self.assertFalse(np.isnan(results["pue"]))
+
+    async def test_pods_without_pump_power(self):
+        # No operating point for the 1152 GPU pod's CDU pumps at a TCS temperature of 17 °C
+        scenario = self.scenario._replace(pod_type="1152 GPU DGX GB200 Super Pod", tcs_liquid_temp=17)
+        self.assertIsNone(engine.evaluate(scenario)["cdu_hp_per_pod"])
+        results = annual.simulate(scenario, self.dry_bulb, self.wet_bulb, self.chillers)
+        self.assertEqual(results["pods_without_pump_power"], 4)
+        self.assertEqual(results["cdu_pump_kwh"], 0)
+        self.assertAlmostEqual(results["cooling_kwh"], results["chiller_kwh"] + results["crah_kwh"])
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import batch, data, engine
+
+
+class TestBatch(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.chillers = data.load_chiller_table()
+        self.climate = data.load_climate_store()
+
+    async def test_matches_scalar_engine(self):
+        grid = batch.design_grid(range(15, 33, 4), range(17, 46, 7), engine.POD_RACK_COUNTS, ["TOKYO", "DUBLIN AP"])
+        grid["fws_air_temps"] = 15
+        results = batch.evaluate_batch(**grid, chillers=self.chillers, climate=self.climate)
+
+        for i in range(len(grid["pod_types"])):
+            scenario = engine.Scenario(
+                pod_type=grid["pod_types"][i],
+                air_supply_temp=grid["air_supply_temps"][i],
+                tcs_liquid_temp=grid["tcs_liquid_temps"][i],
+                fws_air_temp=15,
+                city=grid["cities"][i],
+            )
+            expected = engine.evaluate(scenario, self.chillers, self.climate)
+            for name, value in expected.items():
+                if name not in results or isinstance(value, str):
+                    continue
+                if value is None:
+                    self.assertTrue(np.isnan(results[name][i]), name)
+                else:
+                    self.assertTrue(math.isclose(results[name][i], value, rel_tol=1e-9), name)
+
+    async def test_unknown_city_is_nan(self):
+        results = batch.evaluate_batch(
+            [20, 25], [30, 30], "576 GPU DGX GB200 Super Pod", cities=["TOKYO", "ATLANTIS"],
+            fws_air_temps=15, chillers=self.chillers, climate=self.climate,
+        )
+        self.assertFalse(np.isnan(results["chilled_water_flow_rate_per_pod"][0]))
+        self.assertTrue(np.isnan(results["chilled_water_flow_rate_per_pod"][1]))
+        self.assertEqual(results["total_cdus"].tolist(), [2, 2])
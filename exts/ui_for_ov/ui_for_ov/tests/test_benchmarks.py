@@ -0,0 +1,44 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+
+import omni.kit.test
+
+from ui_for_ov import benchmarks, engine
+
+
+class TestBenchmarks(omni.kit.test.AsyncTestCase):
+    async def test_every_calculate_function_is_covered(self):
+        names = {name for name in dir(engine) if name.startswith("calculate_")}
+        self.assertEqual(names - set(benchmarks.calculate_arguments(None)), set())
+
+    async def test_run_and_compare(self):
+        results = benchmarks.run(sizes=(1000,), pattern="calculate_cdu")
+        names = [record["name"] for record in results["results"]]
+        self.assertEqual(names, ["calculate_cdu_pump_power", "calculate_cdu_pump_power[memo hit]", "calculate_cdus"])
+        for record in results["results"]:
+            self.assertGreater(record["best_s"], 0)
+            self.assertLessEqual(record["best_s"], record["median_s"])
+            self.assertGreaterEqual(record["peak_bytes"], 0)
+        self.assertIn("numpy", results["meta"])
+
+        slower = json.loads(json.dumps(results))
+        for record in slower["results"]:
+            record["best_s"] *= 2
+        rows = benchmarks.compare(results, slower)
+        self.assertEqual(len(rows), 3)
+        self.assertTrue(all(regressed for *_, regressed in rows))
+        self.assertFalse(any(regressed for *_, regressed in benchmarks.compare(slower, results)))
+
+    async def test_main_writes_json(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = os.path.join(tmp, "results.json")
+            with contextlib.redirect_stdout(io.StringIO()) as stdout:
+                self.assertEqual(benchmarks.main(["-o", output, "-k", "sweep", "--sizes", "1e3"]), 0)
+            with open(output) as f:
+                results = json.load(f)
+        sweeps = {record["name"] for record in results["results"]}
+        self.assertEqual(sweeps, {"evaluate_batch 1e3", "evaluate_blocks 1e3"})
+        self.assertIn("evaluate_batch 1e3", stdout.getvalue())
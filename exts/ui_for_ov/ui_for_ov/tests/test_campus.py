@@ -0,0 +1,112 @@
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import campus, data, engine
+
+POD = "576 GPU DGX GB200 Super Pod"
+PODS = ("288 GPU DGX GB200 Super Pod", "576 GPU DGX GB200 Super Pod", "1152 GPU DGX GB200 Super Pod")
+
+
+class TestCampus(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.chillers = data.load_chiller_table()
+        self.climate = data.load_climate_store()
+        self.design = engine.Scenario(city=self.climate.cities[0], fws_air_temp=10, fws_liquid_temp=35)
+
+    async def test_matches_scalar_engine(self):
+        site = campus.Campus(self.chillers, self.climate)
+        site.set_hall("Hall A", self.design, [{POD: 3}, [POD]])
+        expected = engine.evaluate(self.design._replace(pod_type=POD, num_pods=4), self.chillers, self.climate)
+        hall = site.hall("Hall A")
+        self.assertEqual(hall["pods"], 4)
+        self.assertEqual(hall["it_power"], expected["total_power"])
+        self.assertEqual(hall["cdus"], 4 * expected["total_cdus"])
+        self.assertEqual(hall["crahs"], 4 * expected["no_of_crahs"])
+        self.assertTrue(math.isclose(hall["chilled_water_flow"], 4 * expected["chilled_water_flow_rate_per_pod"]))
+        self.assertTrue(math.isclose(hall["fan_power"], 4 * expected["crah_hp2"] * expected["no_of_crahs"]))
+        self.assertTrue(math.isclose(hall["pump_power"], 4 * expected["cdu_hp_per_pod"]))
+        self.assertEqual(site.rows("Hall A")["row"], ["Row 1", "Row 2"])
+        np.testing.assert_allclose(site.rows("Hall A")["it_power"], np.array([3, 1]) * expected["power_per_pod"])
+
+        # The chiller plant covers the air load, plus the liquid load when the dry cooler cannot take it
+        capacity = self.chillers.surface(engine.CHILLER_MODEL).evaluate
+        dry_bulb = self.climate.take("dry_bulb", self.climate.rows_of([self.design.city]))[0]
+        chillers = math.ceil(hall["air_chiller_load"] / float(capacity(10, dry_bulb)["capacity"]))
+        if expected["liquid_cooling_option1"] != "Dry Cooler":
+            self.assertGreater(hall["liquid_chiller_load"], 0)
+            chillers += math.ceil(hall["liquid_chiller_load"] / float(capacity(35, dry_bulb)["capacity"]))
+        else:
+            self.assertEqual(hall["liquid_chiller_load"], 0)
+        self.assertEqual(hall["chillers"], chillers)
+
+    async def test_rollups_sum_rows_and_halls(self):
+        rng = np.random.default_rng(3)
+        site = campus.Campus(self.chillers, self.climate)
+        for h in range(4):
+            rows = {f"R{r}": [PODS[i] for i in rng.integers(0, len(PODS), 20)] for r in range(5)}
+            site.set_hall(f"Hall {h}", self.design._replace(air_supply_temp=15 + h), rows)
+        totals = site.totals()
+        self.assertEqual(totals["pods"], 400)
+        for field in campus.PLANT_FIELDS:
+            self.assertTrue(math.isclose(totals[field], sum(site.hall(name)[field] for name in site.halls)), field)
+        for field in campus.ROLLUP_FIELDS:
+            rows = site.rows("Hall 2")
+            self.assertTrue(math.isclose(rows[field].sum(), site.hall("Hall 2")[field], abs_tol=1e-9), field)
+        results = site.pod_results("Hall 2")
+        self.assertEqual(len(results["row"]), 100)
+        np.testing.assert_array_equal(results["air_return_temperature"] - results["air_temperature_rise"], 17)
+
+    async def test_changing_a_hall_only_recomputes_it(self):
+        site = campus.Campus(self.chillers, self.climate)
+        for name in ("Hall A", "Hall B", "Hall C"):
+            site.set_hall(name, self.design, [{POD: 10}, {PODS[2]: 5}])
+        self.assertEqual(site.evaluate(), ["Hall A", "Hall B", "Hall C"])
+        before = site.totals()
+        hall_a = site.hall("Hall A")
+
+        site.set_design("Hall B", cdu_type="Liquid to Air")
+        self.assertEqual(site.stale, ["Hall B"])
+        self.assertEqual(site.evaluate(), ["Hall B"])
+        self.assertEqual(site.evaluate(), [])
+        self.assertEqual(site.hall("Hall A"), hall_a)
+        self.assertEqual(site.hall("Hall B")["liquid_chiller_load"], 0)
+        self.assertEqual(site.hall("Hall B")["air_chiller_load"], hall_a["it_power"])
+        self.assertEqual(site.totals()["it_power"], before["it_power"])
+
+        site.remove_hall("Hall C")
+        self.assertEqual(site.halls, ["Hall A", "Hall B"])
+        self.assertEqual(site.totals()["pods"], 30)
+        with self.assertRaises(KeyError):
+            site.hall("Hall C")
+
+    async def test_pods_without_pump_power(self):
+        # At a TCS temperature of 17 °C only the 576 GPU pod's CDU pumps have an operating point
+        site = campus.Campus(self.chillers, self.climate)
+        site.set_hall("Hall A", self.design._replace(tcs_liquid_temp=17), {"R1": {POD: 2, PODS[2]: 3}, "R2": [PODS[2]]})
+        expected = engine.evaluate(self.design._replace(pod_type=POD, num_pods=2, tcs_liquid_temp=17))
+        hall = site.hall("Hall A")
+        self.assertEqual(hall["pods_without_pump_power"], 4)
+        self.assertTrue(math.isclose(hall["pump_power"], 2 * expected["cdu_hp_per_pod"]))
+        np.testing.assert_array_equal(site.rows("Hall A")["pods_without_pump_power"], [3, 1])
+        self.assertEqual(site.totals()["pods_without_pump_power"], 4)
+
+    async def test_without_a_site(self):
+        site = campus.Campus()
+        site.set_hall("Hall A", self.design._replace(city=None), [[POD, POD]])
+        hall = site.hall("Hall A")
+        self.assertEqual(hall["it_power"], 2 * engine.calculate_power_per_pod(POD))
+        self.assertTrue(math.isnan(hall["chilled_water_flow"]))
+        self.assertTrue(math.isnan(hall["chillers"]))
+        self.assertEqual(hall["liquid_chiller_load"], 2 * engine.calculate_total_liquid_cooling_capacity(POD))
+
+    async def test_invalid_halls(self):
+        site = campus.Campus()
+        with self.assertRaises(KeyError):
+            site.set_hall("Hall A", self.design, [["Unknown Pod"]])
+        with self.assertRaises(ValueError):
+            site.set_hall("Hall A", self.design._replace(fws_air_temp=None), [[POD]])
+        self.assertEqual(site.halls, [])
+        site.set_hall("Empty", self.design, [])
+        self.assertEqual(site.totals()["pods"], 0)
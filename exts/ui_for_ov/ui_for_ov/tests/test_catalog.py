@@ -0,0 +1,85 @@
+import random
+import tempfile
+
+import omni.kit.test
+
+from ui_for_ov import data, engine
+from ui_for_ov.catalog import CDU, CRAH, Equipment, EquipmentCatalog
+
+
+def _crah(model, capacity, price=None, airflow=None):
+    return Equipment(CRAH, "Vendor", model, capacity, 18, 25, None, airflow, None, price, None)
+
+
+def _models(items):
+    return [item.model for item in items]
+
+
+class TestEquipmentCatalog(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.catalog = data.load_equipment_catalog(cache_dir=self._directory.name)
+
+    async def tearDown(self):
+        self._directory.cleanup()
+
+    async def test_shipped_models(self):
+        pw170 = self.catalog["PW170"]
+        self.assertEqual((pw170.kind, pw170.capacity, pw170.airflow, pw170.price), (CRAH, 233, 29081, 74000))
+        self.assertEqual(self.catalog["XDU1350"].pump_curve, {"a": -0.000234, "b": 0.092063, "c": 476.45677})
+        self.assertIsNone(self.catalog["XDU600"].pump_curve)
+        self.assertEqual(self.catalog.models(CRAH), ["AHU FA069HC", "AHU FA096HC", "PW170"])
+        self.assertEqual(len(self.catalog.models(CDU)), 7)
+        self.assertNotIn("PW999", self.catalog)
+        with self.assertRaises(KeyError):
+            self.catalog["PW999"]
+
+    async def test_range_queries(self):
+        self.assertEqual(_models(self.catalog.query(CRAH, capacity=(240, None))), ["AHU FA069HC", "AHU FA096HC"])
+        # Models without a price never match a price range
+        self.assertEqual(_models(self.catalog.query(CRAH, capacity=(200, None), price=(None, 80000))), ["PW170"])
+        self.assertEqual(_models(self.catalog.query(CDU, capacity=(1200, 1367))), ["XDU1350", "MCDU60", "MHDU5910"])
+        self.assertEqual(self.catalog.query(CDU, airflow=(0, None)), [])
+        self.assertEqual(self.catalog.query("Chiller"), [])
+        self.assertEqual(len(self.catalog.query()), len(self.catalog))
+        self.assertEqual(self.catalog.cheapest(CRAH).model, "PW170")
+        with self.assertRaises(ValueError):
+            self.catalog.query(CRAH, vendor=("A", "B"))
+
+    async def test_queries_match_a_scan(self):
+        rng = random.Random(7)
+        items = [
+            _crah(f"CRAH{i}", rng.randint(50, 500), rng.choice([None, rng.randint(20, 120) * 1000]),
+                  rng.randint(10, 60) * 1000)
+            for i in range(500)
+        ]
+        catalog = EquipmentCatalog(items)
+        for _ in range(50):
+            low = rng.randint(50, 500)
+            price = rng.choice([None, rng.randint(20, 120) * 1000])
+            airflow = (rng.randint(10, 30) * 1000, rng.randint(30, 60) * 1000)
+            expected = [
+                item for item in items
+                if item.capacity >= low and item.airflow >= airflow[0] and item.airflow <= airflow[1]
+                and (price is None or (item.price is not None and item.price <= price))
+            ]
+            ranges = {"capacity": (low, None), "airflow": airflow}
+            if price is not None:
+                ranges["price"] = (None, price)
+            self.assertEqual(catalog.query(CRAH, **ranges), expected)
+
+    async def test_duplicate_models_rejected(self):
+        with self.assertRaises(ValueError):
+            EquipmentCatalog([_crah("A", 100), _crah("A", 200)])
+
+    async def test_engine_sizes_with_the_catalog(self):
+        self.assertEqual(engine.calculate_no_of_crahs(466), 2)
+        smaller_crah = EquipmentCatalog(
+            item._replace(capacity=100) if item.model == engine.CRAH_MODEL else item for item in self.catalog
+        )
+        try:
+            engine.use_equipment_catalog(smaller_crah)
+            self.assertEqual(engine.calculate_no_of_crahs(466), 5)
+        finally:
+            engine.use_equipment_catalog(self.catalog)
+        self.assertEqual(engine.calculate_no_of_crahs(466), 2)
@@ -0,0 +1,121 @@
+import itertools
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import cdu_optimizer, engine
+from ui_for_ov.catalog import EquipmentCatalog
+
+POD = "1152 GPU DGX GB200 Super Pod"
+
+
+class TestCduOptimizer(omni.kit.test.AsyncTestCase):
+    async def test_matches_exhaustive_search(self):
+        capacities = [300.0, 918.72, 1837.44, 4000.0]
+        flows = [100.0, 459.36, 2500.0, 900.0]
+        costs = {"XDU1350": 100.0, "MCDU50": 130.0, "XDU600": 55.0, "XDU070": 9.0}
+        result = cdu_optimizer.optimize(capacities, flows, redundancy=1, objective="cost", costs=costs)
+        nominal = {model: engine.equipment_catalog()[model].capacity for model in costs}
+        for pod, (capacity, flow) in enumerate(zip(capacities, flows)):
+            candidates = [
+                (count * costs[model], count * nominal[model], model, count)
+                for model, count in itertools.product(costs, range(1, cdu_optimizer.MAX_CDUS_PER_POD + 1))
+                if (count - 1) * nominal[model] >= capacity
+                and (count - 1) * engine.MAX_SECONDARY_FLOW_RATE_CDU >= flow
+            ]
+            cost, _, model, count = min(candidates)
+            self.assertEqual(result["model"][pod], model)
+            self.assertEqual(result["count"][pod], count)
+            self.assertAlmostEqual(result["objective"][pod], cost)
+
+    async def test_capacity_and_flow_constraints(self):
+        # Flow, not capacity, sets N here: 2500 LPM needs 3 CDUs whatever their capacity
+        config = cdu_optimizer.optimize_pod(POD, 25, redundancy=0)
+        capacity = engine.calculate_total_liquid_cooling_capacity(POD)
+        flow = engine.calculate_liquid_flow_rate_per_pod(POD, 25)
+        self.assertGreaterEqual(config.count * engine.equipment_catalog()[config.model].capacity, capacity)
+        self.assertGreaterEqual(config.count * engine.MAX_SECONDARY_FLOW_RATE_CDU, flow)
+        result = cdu_optimizer.optimize([100.0], [2500.0], redundancy=0)
+        self.assertEqual(result["count"][0], math.ceil(2500 / engine.MAX_SECONDARY_FLOW_RATE_CDU))
+        # Ties on the count go to the least installed capacity
+        self.assertEqual(result["model"][0], "XDU070")
+
+    async def test_infeasible_is_pruned(self):
+        result = cdu_optimizer.optimize([1e6], [10.0], max_count=4)
+        self.assertIsNone(result["model"][0])
+        self.assertTrue(np.isnan(result["objective"][0]))
+        self.assertIsNone(cdu_optimizer.optimize_pod(POD, 25, models=["XDU070"], max_count=8))
+
+    async def test_pump_power(self):
+        config = cdu_optimizer.optimize_pod(POD, 25, objective="pump_power")
+        self.assertEqual(config.model, "XDU1350")
+        flow = engine.calculate_liquid_flow_rate_per_pod(POD, 25)
+        minimum = engine.calculate_cdus(engine.calculate_total_liquid_cooling_capacity(POD), flow)
+        self.assertGreaterEqual(config.count, minimum)
+        for count in range(minimum, cdu_optimizer.MAX_CDUS_PER_POD + 1):
+            power = engine.calculate_cdu_pump_power(POD, count, flow / count)
+            if power is not None:
+                self.assertLessEqual(config.objective, power * count + 1e-9)
+        # The 288 GPU pod's system curve is derived from the 576 GPU pod's
+        self.assertIsNotNone(cdu_optimizer.optimize_pod("288 GPU DGX GB200 Super Pod", 25, objective="pump_power"))
+
+    async def test_hall(self):
+        scenarios = [
+            engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", num_pods=4, tcs_liquid_temp=25),
+            engine.Scenario(pod_type=POD, num_pods=2, tcs_liquid_temp=30),
+        ]
+        mixed = cdu_optimizer.optimize_hall(scenarios)
+        single = cdu_optimizer.optimize_hall(scenarios, same_model=True)
+        self.assertEqual(len(set(single["model"])), 1)
+        self.assertLessEqual(mixed["total"], single["total"])
+        self.assertAlmostEqual(mixed["total"], float(np.dot(mixed["objective"], [4, 2])))
+        with self.assertRaises(ValueError):
+            cdu_optimizer.optimize_hall(scenarios, objective="cost")
+
+    async def test_hall_with_infeasible_pods(self):
+        # No CDU count of a model with a pump curve serves this pod on pump power
+        scenarios = [
+            engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", num_pods=4, tcs_liquid_temp=25),
+            engine.Scenario(pod_type="1152 GPU DGX GB200 Super Pod", num_pods=1, tcs_liquid_temp=17),
+        ]
+        result = cdu_optimizer.optimize_hall(scenarios, objective="pump_power")
+        self.assertIsNone(result["model"][1])
+        self.assertEqual(result["infeasible"], 1)
+        self.assertEqual(result["total"], math.inf)
+        # An infeasible pod that is not in the hall does not count
+        result = cdu_optimizer.optimize_hall([scenarios[0], scenarios[1]._replace(num_pods=0)], objective="pump_power")
+        self.assertEqual(result["infeasible"], 0)
+        self.assertAlmostEqual(result["total"], 4 * result["objective"][0])
+
+    async def test_cost_defaults_to_catalog_prices(self):
+        equipment = engine.equipment_catalog()
+        prices = {"XDU1350": 40000.0, "XDU600": 15000.0}
+        priced = EquipmentCatalog(
+            item._replace(price=prices[item.model]) if item.model in prices else item for item in equipment
+        )
+        try:
+            engine.use_equipment_catalog(priced)
+            by_catalog = cdu_optimizer.optimize_pod(POD, 30, objective="cost")
+            self.assertIn(by_catalog.model, prices)
+            self.assertEqual(by_catalog.objective, by_catalog.count * prices[by_catalog.model])
+            # Given costs override the catalog prices and add unpriced models
+            overridden = cdu_optimizer.optimize_pod(POD, 30, objective="cost", costs={"XDU1350": 1.0, "XDU070": 0.5})
+            self.assertEqual(overridden.model, "XDU1350")
+            self.assertEqual(overridden.objective, overridden.count)
+        finally:
+            engine.use_equipment_catalog(equipment)
+
+    async def test_pump_power_uses_the_models_rating(self):
+        equipment = engine.equipment_catalog()
+        baseline = cdu_optimizer.optimize_pod(POD, 30, objective="pump_power")
+        doubled = EquipmentCatalog(
+            item._replace(power=item.power * 2) if item.model == baseline.model else item for item in equipment
+        )
+        try:
+            engine.use_equipment_catalog(doubled)
+            config = cdu_optimizer.optimize_pod(POD, 30, objective="pump_power")
+            self.assertEqual(config.count, baseline.count)
+            self.assertAlmostEqual(config.objective, 2 * baseline.objective)
+        finally:
+            engine.use_equipment_catalog(equipment)
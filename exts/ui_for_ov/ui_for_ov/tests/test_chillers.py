@@ -0,0 +1,84 @@
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import data
+
+
+class TestChillerTable(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.table = data.load_chiller_table()
+
+    async def test_scalar_lookup(self):
+        performance = self.table.lookup("Vertiv 1MW", 10, 53)
+        self.assertEqual(performance.capacity, 1015)
+        self.assertEqual(performance.power_input, 549.95)
+        self.assertIsNone(performance.pressure_drop)
+        self.assertEqual(self.table.evaporator_rise("Vertiv 1MW", 10, 53), 9.11)
+        self.assertIsNone(self.table.lookup("Vertiv 1MW", 11, 53))
+        self.assertIsNone(self.table.lookup("Unknown", 10, 53))
+
+    async def test_lookup_many_matches_scalar(self):
+        twout = np.array([10, 15, 11, 35, 20])
+        ta = np.array([53, -40, 30, 54, 30.5])
+        results = self.table.lookup_many("Vertiv 1MW", twout, ta)
+        for i in range(len(twout)):
+            performance = self.table.lookup("Vertiv 1MW", float(twout[i]), float(ta[i]))
+            if performance is None:
+                self.assertTrue(np.isnan(results["evaporator"][i]))
+            else:
+                self.assertEqual(results["evaporator"][i], performance.evaporator)
+                self.assertEqual(results["capacity"][i], performance.capacity)
+
+    async def test_lookup_many_unknown_model(self):
+        results = self.table.lookup_many("Unknown", [10, 15], 30)
+        self.assertTrue(np.isnan(results["capacity"]).all())
+
+
+class TestChillerSurface(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.table = data.load_chiller_table()
+
+    async def test_exact_at_rated_points(self):
+        for model in self.table.models:
+            surface = self.table.surface(model)
+            twout, ta = np.meshgrid(surface.twout_values, surface.ta_values, indexing="ij")
+            results = surface.evaluate(twout, ta)
+            expected = self.table.lookup_many(model, twout, ta)
+            for field, values in expected.items():
+                np.testing.assert_array_equal(results[field], values)
+
+    async def test_bilinear_between_points(self):
+        surface = self.table.surface("Schneider XRAC4812")
+        corners = [
+            self.table.lookup("Schneider XRAC4812", twout, ta).capacity for twout in (5.0, 7.0) for ta in (25.0, 27.0)
+        ]
+        self.assertAlmostEqual(surface.performance(6, 26).capacity, sum(corners) / 4)
+        # Along an axis only the two neighbours count
+        low = self.table.lookup("Schneider XRAC4812", 5.0, 25.0).capacity
+        high = self.table.lookup("Schneider XRAC4812", 5.0, 27.0).capacity
+        self.assertAlmostEqual(surface.performance(5, 25.5).capacity, 0.75 * low + 0.25 * high)
+
+    async def test_continuous_inputs_and_bounds(self):
+        # TWOUT 12 has no rated row; the surface still answers
+        self.assertIsNone(self.table.evaporator_rise("Vertiv 1MW", 12, 30))
+        surface = self.table.surface("Vertiv 1MW")
+        rise = surface.evaporator_rise(12, 29.4)
+        self.assertIsNotNone(rise)
+        self.assertEqual(surface.bounds, ((10, 35), (-40, 53)))
+        self.assertEqual(surface.evaporator_rise(10, 60), surface.evaporator_rise(10, 53))
+        outside = surface.evaluate([12, 12, np.nan], [29.4, 60, 30], clip=False)["evaporator"]
+        self.assertAlmostEqual(outside[0], rise)
+        self.assertTrue(np.isnan(outside[1:]).all())
+        # Vertiv has no pressure drop figures
+        self.assertIsNone(surface.performance(12, 29.4).pressure_drop)
+
+    async def test_interpolate_arrays(self):
+        twout = np.linspace(10, 35, 7)[:, np.newaxis]
+        ta = np.linspace(-10, 45, 5)
+        results = self.table.interpolate("DAIKIN AIR COOLED  SCREW C20", twout, ta)
+        self.assertEqual(results["capacity"].shape, (7, 5))
+        self.assertFalse(np.isnan(results["capacity"]).any())
+        surface = self.table.surface("DAIKIN AIR COOLED  SCREW C20")
+        self.assertAlmostEqual(results["flow"][3, 2], surface.performance(twout[3, 0], ta[2]).flow)
+        self.assertTrue(np.isnan(self.table.interpolate("Unknown", twout, ta)["capacity"]).all())
+        self.assertIsNone(self.table.surface("Unknown"))
@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import data
+from ui_for_ov.climate import ClimateStore
+
+
+class TestClimateStore(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.store = data.load_climate_store()
+
+    async def test_lookup(self):
+        record = self.store.get("DUBLIN AP")
+        self.assertEqual(record.country, "IRL")
+        self.assertIsNone(record.state)
+        self.assertEqual(record.dry_bulb, 28.2)
+        self.assertEqual(self.store.get("DALLAS LOVE FIELD").state, "TX")
+        self.assertIsNone(self.store.get("ATLANTIS"))
+
+    async def test_cities_sorted_without_blank_rows(self):
+        self.assertEqual(self.store.cities, sorted(self.store.cities))
+        self.assertEqual(len(self.store.cities), len(self.store))
+        self.assertNotIn("nan", self.store.cities)
+
+    async def test_vector_reads(self):
+        rows = self.store.rows_of(["TOKYO", "ATLANTIS", "DUBLIN AP"])
+        self.assertEqual(rows[1], -1)
+        dry_bulb = self.store.take("dry_bulb", rows)
+        self.assertEqual(dry_bulb[0], 39.8)
+        self.assertTrue(np.isnan(dry_bulb[1]))
+        labels, codes = self.store.labels("country")
+        self.assertEqual(labels[codes[rows[2]]], "IRL")
+
+    async def test_categorical_labels_are_shared(self):
+        store = ClimateStore(
+            [1, 1, 1], ["USA", "USA", "CAN"], ["TX", None, "ON"], ["A", "B", " "], [1, 2, 3], [1, None, 3], [0, 0, 0],
+            [0, 0, 0],
+        )
+        self.assertEqual(len(store), 2)
+        self.assertEqual(store.labels("country")[0], ["USA"])
+        self.assertTrue(math.isnan(store.get("B").wet_bulb))
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import batch, columnar, data, engine
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    pyarrow = None
+
+
+class TestColumnar(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.chillers = data.load_chiller_table()
+        self.climate = data.load_climate_store()
+        self.axes = (range(15, 33, 3), range(17, 46, 4), engine.POD_RACK_COUNTS, ["TOKYO", None, "DUBLIN AP"], (1, 4))
+
+    async def tearDown(self):
+        self.tmp.cleanup()
+
+    def _blocks(self, block_size):
+        blocks = batch.design_grid_blocks(*self.axes, block_size=block_size)
+        return batch.evaluate_blocks(blocks, fws_air_temps=15, chillers=self.chillers, climate=self.climate)
+
+    async def test_blocks_match_full_grid(self):
+        grid = batch.design_grid(*self.axes)
+        full = batch.evaluate_batch(**grid, fws_air_temps=15, chillers=self.chillers, climate=self.climate)
+        blocks = list(self._blocks(block_size=100))
+        self.assertTrue(all(len(block["total_cdus"]) <= 100 for block in blocks))
+        for name in batch.PANEL_FIELDS:
+            np.testing.assert_array_equal(np.concatenate([block[name] for block in blocks]), full[name])
+        np.testing.assert_array_equal(np.concatenate([block["cities"] for block in blocks]), grid["cities"])
+
+    def _round_trip(self, format):
+        directory = os.path.join(self.tmp.name, format)
+        rows = columnar.write_blocks(self._blocks(block_size=128), directory, format=format)
+        expected = {name: np.concatenate([block[name] for block in self._blocks(block_size=1000)])
+                    for name in ("pod_types", "cities", "pod_counts", "total_cdus", "dry_cooler", "cdu_hp2")}
+        self.assertEqual(rows, len(expected["total_cdus"]))
+        self.assertEqual(columnar.read_manifest(directory)["rows"], rows)
+        columns = columnar.read_columns(directory, list(expected))
+        for name, values in expected.items():
+            self.assertEqual(columns[name].dtype.kind, values.dtype.kind, name)
+            np.testing.assert_array_equal(columns[name], values)
+
+    async def test_npy_round_trip(self):
+        self._round_trip("npy")
+        # Existing result sets are not overwritten
+        with self.assertRaises(FileExistsError):
+            columnar.ColumnWriter(os.path.join(self.tmp.name, "npy"))
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    async def test_arrow_round_trip(self):
+        self._round_trip("arrow")
+
+    async def test_interrupted_sweep_is_readable(self):
+        directory = os.path.join(self.tmp.name, "partial")
+        writer = columnar.ColumnWriter(directory)
+        blocks = self._blocks(block_size=50)
+        writer.write(next(blocks))
+        writer.write(next(blocks))
+        # Not closed: the manifest already covers the complete blocks
+        self.assertEqual(len(columnar.read_columns(directory)["total_cdus"]), 100)
+        with self.assertRaises(ValueError):
+            writer.write({"total_cdus": np.zeros(3)})
@@ -0,0 +1,79 @@
+import itertools
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import crah_optimizer, engine
+
+POD = "1152 GPU DGX GB200 Super Pod"
+CRAHS = ("AHU FA069HC", "AHU FA096HC", "PW170")
+
+
+class TestCrahOptimizer(omni.kit.test.AsyncTestCase):
+    async def test_matches_exhaustive_search(self):
+        capacities = [218.64, 874.56, 1500.0, 40.0]
+        airflows = [28871.4, 115485.7, 260000.0, 9000.0]
+        equipment = engine.equipment_catalog()
+        for objective, redundancy in itertools.product(crah_optimizer.OBJECTIVES, (0, 1)):
+            costs = {"AHU FA069HC": 80000.0, "AHU FA096HC": 95000.0, "PW170": 74000.0}
+            result = crah_optimizer.optimize(capacities, airflows, redundancy, objective, costs)
+            for pod, (capacity, airflow) in enumerate(zip(capacities, airflows)):
+                candidates = []
+                for model, count in itertools.product(CRAHS, range(1, crah_optimizer.MAX_CRAHS_PER_POD + 1)):
+                    crah = equipment[model]
+                    running = count - redundancy
+                    speed = airflow / (count * crah.airflow)
+                    if running * crah.capacity < capacity or running * crah.airflow < airflow:
+                        continue
+                    if speed < crah_optimizer.MIN_FAN_SPEED:
+                        continue
+                    power = count * crah.power * speed ** 3
+                    value = {"fan_power": power, "cost": count * costs[model], "count": count}[objective]
+                    candidates.append((value, power if objective != "fan_power" else count, model, count))
+                if not candidates:
+                    self.assertIsNone(result["model"][pod])
+                    continue
+                value, _, model, count = min(candidates)
+                self.assertEqual((result["model"][pod], result["count"][pod]), (model, count), (objective, pod))
+                self.assertAlmostEqual(result["objective"][pod], value)
+
+    async def test_matches_engine_for_the_pw170(self):
+        capacity = engine.calculate_total_air_cooling_capacity(POD)
+        airflow = engine.calculate_airflow_rate_per_pod(POD, 25)
+        config = crah_optimizer.optimize_pod(POD, 25, objective="count", models=["PW170"], min_speed=0)
+        self.assertEqual(config.count, engine.calculate_no_of_crahs(capacity))
+        cfm2, rpm2_percent, hp2 = engine.calculate_crah_rpm_and_power(airflow, config.count)
+        self.assertAlmostEqual(config.speed, rpm2_percent)
+        self.assertAlmostEqual(config.fan_power, hp2 * config.count)
+
+    async def test_fan_power_prefers_more_units(self):
+        fewest = crah_optimizer.optimize_pod(POD, 25, objective="count", redundancy=1)
+        lowest = crah_optimizer.optimize_pod(POD, 25, objective="fan_power", redundancy=1)
+        self.assertGreaterEqual(lowest.count, fewest.count)
+        self.assertLess(lowest.fan_power, fewest.fan_power)
+        self.assertGreaterEqual(lowest.speed, crah_optimizer.MIN_FAN_SPEED)
+        # Only the PW170 has a catalog price
+        self.assertEqual(crah_optimizer.optimize_pod(POD, 25, objective="cost").model, "PW170")
+
+    async def test_infeasible(self):
+        result = crah_optimizer.optimize([1e5, np.nan], [1e7, 1000.0], max_count=8)
+        self.assertIsNone(result["model"][0])
+        self.assertIsNone(result["model"][1])
+        self.assertTrue(np.isnan(result["objective"]).all())
+        self.assertEqual(result["total"], math.inf)
+        self.assertEqual(result["infeasible"], 2)
+        with self.assertRaises(ValueError):
+            crah_optimizer.optimize([100.0], [10000.0], objective="noise")
+
+    async def test_hall(self):
+        scenarios = [
+            engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", num_pods=4, air_supply_temp=25),
+            engine.Scenario(pod_type=POD, num_pods=2, air_supply_temp=30),
+        ]
+        mixed = crah_optimizer.optimize_hall(scenarios, redundancy=1)
+        single = crah_optimizer.optimize_hall(scenarios, redundancy=1, same_model=True)
+        self.assertEqual(len(set(single["model"])), 1)
+        self.assertLessEqual(mixed["total"], single["total"])
+        self.assertAlmostEqual(mixed["total"], float(np.dot(mixed["objective"], [4, 2])))
+        self.assertTrue(math.isfinite(single["total"]))
@@ -0,0 +1,34 @@
+import omni.kit.test
+
+from ui_for_ov import data, engine
+
+
+class TestEngine(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.chillers = data.load_chiller_table()
+        self.climate = data.load_climate_store()
+
+    async def test_pod_capacities(self):
+        pod = "576 GPU DGX GB200 Super Pod"
+        self.assertEqual(engine.calculate_power_per_pod(pod), 8 * 132 + 4 * 30 + 6 * 30)
+        self.assertAlmostEqual(engine.calculate_total_air_cooling_capacity(pod), 8 * 17.16 + 4 * 30 + 6 * 30)
+        self.assertAlmostEqual(engine.calculate_total_liquid_cooling_capacity(pod), 8 * (132 - 17.16))
+
+    async def test_evaluate_without_site(self):
+        result = engine.evaluate(engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", num_pods=3))
+        self.assertEqual(result["total_power"], 3 * result["power_per_pod"])
+        self.assertEqual(result["total_cdus"], 2)
+        self.assertIsNotNone(result["cdu_hp2"])
+        self.assertIsNone(result["chilled_water_flow_rate_per_pod"])
+
+    async def test_evaluate_with_site(self):
+        scenario = engine.Scenario(city="DUBLIN AP", fws_air_temp=10, fws_liquid_temp=35)
+        result = engine.evaluate(scenario, self.chillers, self.climate)
+        self.assertEqual(result["dry_bulb"], 28.2)
+        self.assertEqual(result["liquid_cooling_option1"], "Dry Cooler")
+        self.assertEqual(result["liquid_cooling_option2"], "Closed Loop Cooling Tower")
+        self.assertIsNotNone(result["chilled_water_temperature_rise"])
+        self.assertAlmostEqual(
+            result["chilled_water_flow_rate_per_pod"],
+            result["chilled_water_flow_rate_per_crah"] * result["no_of_crahs"],
+        )
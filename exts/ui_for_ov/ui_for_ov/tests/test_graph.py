@@ -0,0 +1,80 @@
+import omni.kit.test
+
+from ui_for_ov import data, engine
+from ui_for_ov.graph import Graph, build_sizing_graph
+
+
+class TestGraph(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.chillers = data.load_chiller_table()
+        self.climate = data.load_climate_store()
+
+    async def test_recompute_only_dirty_nodes(self):
+        calls = []
+        graph = Graph()
+        graph.add_input("a", 1)
+        graph.add_input("b", 2)
+        graph.add_node("double_a", lambda a: calls.append("double_a") or 2 * a, ["a"])
+        graph.add_node("sum", lambda x, b: calls.append("sum") or x + b, ["double_a", "b"])
+        self.assertEqual(graph.get("sum"), 4)
+
+        calls.clear()
+        graph.set("b", 5)
+        self.assertEqual(graph.recompute(), ["b", "sum"])
+        self.assertEqual(calls, ["sum"])
+
+        # Setting an equal value is a no-op
+        graph.set("b", 5)
+        self.assertEqual(graph.recompute(), [])
+
+    async def test_unchanged_values_stop_propagation(self):
+        calls = []
+        graph = Graph()
+        graph.add_input("x", 3)
+        graph.add_node("sign", lambda x: x > 0, ["x"])
+        graph.add_node("label", lambda positive: calls.append(positive) or str(positive), ["sign"])
+        graph.recompute()
+
+        calls.clear()
+        graph.set("x", 7)
+        self.assertEqual(graph.recompute(), ["x"])
+        self.assertEqual(calls, [])
+
+    async def test_unknown_dependency(self):
+        graph = Graph()
+        with self.assertRaises(KeyError):
+            graph.add_node("y", lambda x: x, ["x"])
+
+    async def test_sizing_graph_matches_evaluate(self):
+        scenario = engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", num_pods=2, city="DUBLIN AP", fws_air_temp=10)
+        graph = build_sizing_graph(self.chillers, self.climate, scenario)
+        values = graph.values()
+        for key, value in engine.evaluate(scenario, self.chillers, self.climate).items():
+            self.assertEqual(values[key], value, key)
+
+        graph.set("fws_air_temp", 12)
+        changed = graph.recompute()
+        self.assertIn("chilled_water_temperature_rise", changed)
+        self.assertNotIn("total_cdus", changed)
+        self.assertEqual(
+            graph.get("chilled_water_flow_rate_per_pod"),
+            engine.evaluate(scenario._replace(fws_air_temp=12), self.chillers, self.climate)["chilled_water_flow_rate_per_pod"],
+        )
+
+    async def test_airflow_changes_skip_the_rated_crah_power(self):
+        graph = build_sizing_graph(self.chillers, self.climate)
+        graph.recompute()
+        graph.set("air_supply_temp", 20)
+        self.assertIn("crah_hp2", graph.dirty)
+        self.assertNotIn("crah_hp1", graph.dirty)
+
+    async def test_several_inputs_recompute_in_dependency_order(self):
+        scenario = engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", city="DUBLIN AP", fws_air_temp=10)
+        graph = build_sizing_graph(self.chillers, self.climate, scenario)
+        graph.recompute()
+        changes = {"city": "TOKYO", "tcs_liquid_temp": 30, "air_supply_temp": 20}
+        graph.update(**changes)
+        changed = graph.recompute()
+        self.assertEqual(changed, [name for name in graph.names if name in changed])
+        for key, value in engine.evaluate(scenario._replace(**changes), self.chillers, self.climate).items():
+            self.assertEqual(graph.get(key), value, key)
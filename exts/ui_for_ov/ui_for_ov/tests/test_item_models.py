@@ -0,0 +1,37 @@
+import omni.kit.test
+
+from ui_for_ov.item_models import ListItemModel
+
+
+class TestListItemModel(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.model = ListItemModel(["Select", "15°C", "16°C"])
+        self.selected = []
+        self.model.get_item_value_model().add_value_changed_fn(lambda model: self.selected.append(model.as_int))
+
+    def _texts(self):
+        return [self.model.get_item_value_model(item).as_string for item in self.model.get_item_children()]
+
+    async def test_items(self):
+        self.assertEqual(self._texts(), ["Select", "15°C", "16°C"])
+        self.assertEqual(self.model.current_text, "Select")
+        self.assertEqual(self.model.get_item_children(self.model.get_item_children()[0]), [])
+
+    async def test_set_items_relabels_in_place(self):
+        first = self.model.get_item_children()[0]
+        self.model.set_items(["5", "6", "7", "8"])
+        self.assertIs(self.model.get_item_children()[0], first)
+        self.assertEqual(self._texts(), ["5", "6", "7", "8"])
+        self.model.set_items(["5"])
+        self.assertEqual(self._texts(), ["5"])
+        self.assertEqual(self.model.items, ["5"])
+        self.assertEqual(self.selected, [])
+
+    async def test_selection_survives_item_changes(self):
+        value_model = self.model.get_item_value_model()
+        value_model.set_value(2)
+        self.assertEqual(self.model.current_text, "16°C")
+        self.model.set_items(["Select", "20°C"])
+        self.assertIs(self.model.get_item_value_model(), value_model)
+        self.assertEqual(self.selected, [2, 0])
+        self.assertEqual(self.model.current_text, "Select")
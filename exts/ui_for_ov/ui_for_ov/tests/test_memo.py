@@ -0,0 +1,47 @@
+import omni.kit.test
+
+from ui_for_ov import engine, memo
+
+
+class TestMemo(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        memo.invalidate()
+
+    async def test_hits_and_misses(self):
+        name = "ui_for_ov.engine.calculate_air_flow_rate_per_kw"
+        for temperature in (20, 25, 20, 20):
+            engine.calculate_air_flow_rate_per_kw(temperature)
+        stats = memo.cache_stats()[name]
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (2, 2, 2))
+
+    async def test_bounded(self):
+        calls = []
+
+        @memo.memoize(maxsize=2, tags=("test",))
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        for x in (1, 2, 3, 1):
+            square(x)
+        # 1 was evicted by 3, so it is computed again
+        self.assertEqual(calls, [1, 2, 3, 1])
+        self.assertEqual(square.cache_info().currsize, 2)
+
+    async def test_invalidate_after_constant_change(self):
+        pod = "288 GPU DGX GB200 Super Pod"
+        power = engine.calculate_power_per_pod(pod)
+        original = engine.POWER_PER_RACK["Management"]
+        engine.POWER_PER_RACK["Management"] = original + 10
+        try:
+            self.assertEqual(engine.calculate_power_per_pod(pod), power)
+            self.assertGreater(memo.invalidate(memo.CONSTANTS), 0)
+            self.assertEqual(engine.calculate_power_per_pod(pod), power + 20)
+        finally:
+            engine.POWER_PER_RACK["Management"] = original
+            memo.invalidate(memo.CONSTANTS)
+
+    async def test_invalidate_by_tag(self):
+        engine.calculate_power_per_pod("288 GPU DGX GB200 Super Pod")
+        memo.invalidate(memo.DATA)
+        self.assertEqual(memo.cache_stats()["ui_for_ov.engine.calculate_power_per_pod"]["size"], 1)
@@ -0,0 +1,64 @@
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import batch, engine, memo
+from ui_for_ov.pods import PodMatrix, default_pods, rack_variant
+
+
+class TestPods(omni.kit.test.AsyncTestCase):
+    async def test_default_pods_match_engine(self):
+        pods = default_pods()
+        for row, name in enumerate(pods.names):
+            self.assertAlmostEqual(pods.power()[row], engine.calculate_power_per_pod(name))
+            self.assertAlmostEqual(pods.air_cooling_capacity()[row], engine.calculate_total_air_cooling_capacity(name))
+            self.assertAlmostEqual(pods.liquid_cooling_capacity()[row], engine.calculate_total_liquid_cooling_capacity(name))
+
+    async def test_mixed_racks(self):
+        pods = PodMatrix()
+        pods.add("NVL36 pod", {"GB200_NVL36": 8, "Management": 2, "Networking": 0})
+        pods.add("Mixed pod", {"GB200_NVL72": 2, "GB200_NVL36": 4})
+        self.assertEqual(pods.nnz, 4)
+        self.assertEqual(pods.rack_counts("NVL36 pod"), {"GB200_NVL36": 8, "Management": 2})
+        np.testing.assert_allclose(pods.power(), [8 * 66 + 2 * 30, 2 * 132 + 4 * 66])
+        np.testing.assert_allclose(pods.liquid_rack_equivalents(), [4, 4])
+        with self.assertRaises(KeyError):
+            pods.add("Bad pod", {"GB300": 1})
+
+    async def test_totals_are_matrix_vector_products(self):
+        rng = np.random.default_rng(3)
+        counts = rng.integers(0, 5, size=(2000, 4)) * (rng.random((2000, 4)) < 0.5)
+        pods = PodMatrix()
+        for i, row in enumerate(counts):
+            pods.add(f"pod {i}", dict(zip(pods.rack_types, row.tolist())))
+        np.testing.assert_array_equal(pods.dense(), counts)
+        per_rack = pods.per_rack(engine.POWER_PER_RACK)
+        np.testing.assert_allclose(pods.totals(per_rack), counts @ per_rack)
+
+    async def test_custom_pod_in_engine_and_batch(self):
+        name = "Test NVL36 Pod"
+        engine.define_pod(name, {"GB200_NVL36": 8, "Management": 4, "Networking": 6})
+        try:
+            result = engine.evaluate(engine.Scenario(pod_type=name, air_supply_temp=25, tcs_liquid_temp=30))
+            pods = default_pods()
+            batch_result = batch.evaluate_batch(25, 30, name, pods=pods)
+            for key in ("power_per_pod", "required_airflow_rate_per_pod", "required_liquid_flow_rate_per_pod", "total_cdus"):
+                self.assertAlmostEqual(float(batch_result[key]), result[key], places=6, msg=key)
+            # Half-size racks: same liquid flow as a pod with half as many NVL72 racks
+            self.assertAlmostEqual(
+                result["required_liquid_flow_rate_per_pod"],
+                engine.calculate_liquid_flow_rate_per_pod("288 GPU DGX GB200 Super Pod", 30),
+            )
+        finally:
+            del engine.POD_RACK_COUNTS[name]
+            memo.invalidate(memo.CONSTANTS)
+
+    async def test_rack_variant(self):
+        pod = "576 GPU DGX GB200 Super Pod"
+        self.assertEqual(rack_variant(pod, "GB200_NVL72"), pod)
+        name = rack_variant(pod, "GB200_NVL36")
+        try:
+            self.assertEqual(engine.POD_RACK_COUNTS[name], {"GB200_NVL36": 16, "Management": 4, "Networking": 6})
+            self.assertEqual(engine.calculate_power_per_pod(name), engine.calculate_power_per_pod(pod))
+        finally:
+            del engine.POD_RACK_COUNTS[name]
+            memo.invalidate(memo.CONSTANTS)
@@ -0,0 +1,84 @@
+import json
+import os
+import tempfile
+
+import omni.kit.test
+
+from ui_for_ov.graph import Graph
+from ui_for_ov.profiler import Profiler
+
+
+class TestProfiler(omni.kit.test.AsyncTestCase):
+    async def test_disabled_records_nothing(self):
+        profiler = Profiler()
+        wrapped = profiler.wrap(lambda x: x + 1, name="increment")
+        self.assertEqual(wrapped(1), 2)
+        with profiler.span("block"):
+            pass
+        self.assertEqual(profiler.spans(), [])
+        self.assertEqual(profiler.stats(), {})
+
+    async def test_counts_and_percentiles(self):
+        profiler = Profiler(enabled=True)
+        for duration in range(1, 101):
+            profiler.record("work", "call", 0, duration * 1000)
+        stats = profiler.stats()["work"]
+        self.assertEqual(stats["count"], 100)
+        self.assertAlmostEqual(stats["total_ms"], 5.05)
+        self.assertAlmostEqual(stats["p50_ms"], 0.05)
+        self.assertAlmostEqual(stats["p99_ms"], 0.099)
+        self.assertIn("work", profiler.summary())
+
+    async def test_triggers_attributed_to_nested_calls(self):
+        profiler = Profiler(enabled=True)
+        inner = profiler.wrap(lambda: None, name="update_labels")
+        outer = profiler.wrap(lambda: inner(), name="on_city_selected", trigger=True)
+        outer()
+        inner()
+        with profiler.trigger("on_pod_selected"):
+            inner()
+        triggers = profiler.stats()["update_labels"]["triggers"]
+        self.assertEqual(triggers, {"on_city_selected": 1, "None": 1, "on_pod_selected": 1})
+        self.assertIsNone(profiler.current_trigger)
+
+    async def test_ring_buffer_capacity(self):
+        profiler = Profiler(capacity=8, enabled=True)
+        for index in range(20):
+            profiler.record(f"call{index % 2}", "call", index, 1)
+        spans = profiler.spans()
+        self.assertEqual(len(spans), 8)
+        self.assertEqual(spans[0].start_ns, 12)
+        # Statistics cover every call, not only the buffered ones
+        self.assertEqual(profiler.stats()["call0"]["count"], 10)
+
+    async def test_dumps(self):
+        profiler = Profiler(enabled=True)
+        with profiler.trigger("on_air_supply_selected"), profiler.span("update_calculations", "update"):
+            profiler.record("calculate_q_ac_per_pod", "calculate", 0, 500, {"changed": True})
+        with tempfile.TemporaryDirectory() as directory:
+            trace_path = os.path.join(directory, "profile.trace.json")
+            profiler.dump_chrome_trace(trace_path)
+            with open(trace_path, encoding="utf-8") as f:
+                events = json.load(f)["traceEvents"]
+            self.assertEqual([event["ph"] for event in events], ["X", "X"])
+            self.assertEqual(events[0]["args"]["trigger"], "on_air_supply_selected")
+
+            json_path = os.path.join(directory, "profile.json")
+            profiler.dump_json(json_path)
+            with open(json_path, encoding="utf-8") as f:
+                dump = json.load(f)
+            self.assertEqual(set(dump["stats"]), {"update_calculations", "calculate_q_ac_per_pod"})
+            self.assertEqual(len(dump["spans"]), 2)
+
+    async def test_graph_node_spans(self):
+        profiler = Profiler(enabled=True)
+        graph = Graph(profiler=profiler)
+        graph.add_input("x", 3)
+        graph.add_node("sign", lambda x: x > 0, ["x"])
+        graph.recompute()
+        graph.set("x", 7)
+        graph.recompute()
+        stats = profiler.stats()["sign"]
+        self.assertEqual(stats["count"], 2)
+        # The second computation produced the same value again
+        self.assertEqual(stats["unchanged"], 1)
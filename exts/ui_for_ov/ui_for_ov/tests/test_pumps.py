@@ -0,0 +1,56 @@
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import engine, pumps
+
+
+class TestPumps(omni.kit.test.AsyncTestCase):
+    async def test_stable_roots(self):
+        # Naive (-b + sqrt(b^2 - 4ac)) / 2a loses every digit of the small root here
+        larger, smaller = pumps.quadratic_roots(1e-10, 1.0, 1e-10)
+        self.assertAlmostEqual(float(larger) / -1e-10, 1.0, places=9)
+        self.assertAlmostEqual(float(smaller) * 1e-10, -1.0, places=9)
+        self.assertAlmostEqual(engine.calculate_roots(1e-10, 1.0, 1e-10)[0] / -1e-10, 1.0, places=9)
+        self.assertTrue(np.isnan(pumps.quadratic_roots(1.0, 0.0, 1.0)[0]))
+        np.testing.assert_allclose(pumps.quadratic_roots([0.0, 1.0], [2.0, -3.0], [-4.0, 2.0]), [[2.0, 2.0], [2.0, 1.0]])
+
+    async def test_scaled_system_curves(self):
+        pod = "1152 GPU DGX GB200 Super Pod"
+        fitted = engine.QSC_COEFFICIENTS[pod]
+        self.assertIs(engine.calculate_system_curve(pod, 3), fitted[3])
+        # The fitted 4-CDU curve follows the scaling rule from the 3-CDU one
+        k = 4 / 3
+        self.assertAlmostEqual(fitted[3]["a"] * k ** 2 / fitted[4]["a"], 1.0, places=2)
+        self.assertAlmostEqual(fitted[3]["b"] * k / fitted[4]["b"], 1.0, places=3)
+        six = engine.calculate_system_curve(pod, 6)
+        self.assertAlmostEqual(six["a"], fitted[3]["a"] * 4)
+        self.assertAlmostEqual(six["b"], fitted[3]["b"] * 2)
+
+    async def test_derived_system_curve(self):
+        # The 288 GPU pod has half the racks of the fitted 576 GPU pod: n CDUs on it run like 2n on the 576
+        small, fitted = "288 GPU DGX GB200 Super Pod", engine.QSC_COEFFICIENTS["576 GPU DGX GB200 Super Pod"]
+        self.assertEqual(engine.calculate_system_curve(small, 1), fitted[2])
+        three = engine.calculate_system_curve(small, 3)
+        self.assertAlmostEqual(three["a"], fitted[1]["a"] * 36)
+        self.assertAlmostEqual(three["b"], fitted[1]["b"] * 6)
+        self.assertIsNone(engine.calculate_system_curve("Unknown Pod", 2))
+        self.assertIsNone(engine.calculate_system_curve(small, 0))
+
+    async def test_vectorized_matches_scalar(self):
+        pods = np.array(list(engine.POD_RACK_COUNTS) * 4, dtype=object)
+        cdus = np.repeat([1, 2, 5, 8], 3)
+        flows = np.linspace(100, 900, len(pods))
+        hp2 = pumps.cdu_pump_power(pods, cdus, flows)
+        for pod, count, flow, value in zip(pods, cdus, flows, hp2):
+            expected = engine.calculate_cdu_pump_power(pod, int(count), float(flow))
+            if expected is None:
+                self.assertTrue(np.isnan(value))
+            else:
+                self.assertAlmostEqual(value, expected)
+
+    async def test_affinity_laws_at_operating_point(self):
+        a, b, c = pumps.system_curves(["1152 GPU DGX GB200 Super Pod"], [3])
+        flow1, dp1 = pumps.operating_point(a, b, c)
+        result = pumps.solve(a, b, c, flow1)
+        np.testing.assert_allclose(result["rpm2"], engine.RPM1)
+        np.testing.assert_allclose(result["hp2"], engine.equipment_catalog()[engine.CDU_MODEL].power)
@@ -0,0 +1,94 @@
+import contextlib
+import io
+import json
+import math
+import os
+import tempfile
+
+import omni.kit.test
+
+from ui_for_ov import data, engine, run
+
+SCENARIOS = [
+    {"id": 1, "pod_type": "576 GPU DGX GB200 Super Pod", "air_supply_temp": 20, "tcs_liquid_temp": 30},
+    {"id": 2, "pod_type": "1152 GPU DGX GB200 Super Pod", "fws_air_temp": 15, "city": "TOKYO"},
+    {"id": 3, "num_pods": 4},
+]
+
+
+class TestRun(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.jsonl = os.path.join(self.tmp.name, "scenarios.jsonl")
+        with open(self.jsonl, "w") as f:
+            for _ in range(7):
+                f.writelines(json.dumps(record) + "\n" for record in SCENARIOS)
+        self.tables = (str(data.CHILLERS_CSV), str(data.CLIMATE_CSV), str(data.CACHE_DIR))
+
+    async def tearDown(self):
+        self.tmp.cleanup()
+
+    def _run(self, path, **kwargs):
+        chunks = []
+        count = run.run(run.read_records(path), chunks.append, tables=self.tables, **kwargs)
+        outputs = [json.loads(line) for line in "".join(chunks).splitlines()]
+        self.assertEqual(count, len(outputs))
+        return outputs
+
+    async def test_matches_scalar_engine(self):
+        outputs = self._run(self.jsonl, workers=1, chunk_size=4)
+        self.assertEqual([output["id"] for output in outputs], [record["id"] for record in SCENARIOS] * 7)
+        chillers = data.load_chiller_table()
+        climate = data.load_climate_store()
+        for output in outputs[: len(SCENARIOS)]:
+            expected = engine.evaluate(run.to_scenario(output), chillers, climate)
+            for name in ("total_power", "total_cdus", "cdu_hp2", "chilled_water_flow_rate_per_pod"):
+                if expected[name] is None:
+                    self.assertIsNone(output[name], name)
+                else:
+                    self.assertTrue(math.isclose(output[name], expected[name], rel_tol=1e-9), name)
+
+    async def test_process_pool_keeps_input_order(self):
+        self.assertEqual(self._run(self.jsonl, workers=2, chunk_size=3), self._run(self.jsonl, workers=1))
+
+    async def test_csv_input(self):
+        path = os.path.join(self.tmp.name, "scenarios.csv")
+        with open(path, "w") as f:
+            f.write("pod_type,num_pods,tcs_liquid_temp,city\n576 GPU DGX GB200 Super Pod,2,25,\n")
+        (output,) = self._run(path, workers=1)
+        self.assertEqual(output["total_power"], 2 * engine.calculate_power_per_pod("576 GPU DGX GB200 Super Pod"))
+
+    async def test_main(self):
+        output = os.path.join(self.tmp.name, "results.jsonl")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(run.main([self.jsonl, "-o", output, "--workers", "1", "--no-site"]), 0)
+        with open(output) as f:
+            self.assertEqual(len(f.readlines()), 7 * len(SCENARIOS))
+        self.assertIn("scenarios/s", stderr.getvalue())
+
+        with open(self.jsonl, "a") as f:
+            f.write('{"pod_type": "4096 GPU Pod"}\n')
+        with contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(run.main([self.jsonl, "-o", output, "--workers", "1"]), 1)
+
+        with open(self.jsonl, "w") as f:
+            f.write("[1, 2]\n")
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            self.assertEqual(run.main([self.jsonl, "-o", output, "--workers", "1", "--no-site"]), 1)
+        self.assertIn("not a JSON object", stderr.getvalue())
+
+    async def test_unknown_city(self):
+        path = os.path.join(self.tmp.name, "cities.jsonl")
+        with open(path, "w") as f:
+            f.write('{"city": "TOKYO"}\n{"city": "Tokyo"}\n')
+        with self.assertRaisesRegex(ValueError, "Unknown city 'Tokyo'"):
+            self._run(path, workers=1)
+        # Without the site tables cities are not looked up
+        self.assertEqual(run.run(run.read_records(path), lambda text: None, workers=1), 2)
+
+    async def test_unknown_cdu_type(self):
+        self.assertEqual(run.to_scenario({"cdu_type": "Liquid to Air"}).cdu_type, "Liquid to Air")
+        with self.assertRaisesRegex(ValueError, "Unknown CDU type 'Liquid to Lqiuid'"):
+            run.to_scenario({"pod_type": "576 GPU DGX GB200 Super Pod", "cdu_type": "Liquid to Lqiuid"})
@@ -0,0 +1,67 @@
+import omni.kit.test
+
+from ui_for_ov.scheduler import UpdateScheduler
+
+
+class _Frames:
+    """Collects the functions scheduled for the next frame."""
+
+    def __init__(self):
+        self.scheduled = []
+
+    def defer(self, function):
+        handle = _Handle(function)
+        self.scheduled.append(handle)
+        return handle
+
+    def tick(self):
+        scheduled, self.scheduled = self.scheduled, []
+        for handle in scheduled:
+            if not handle.cancelled:
+                handle.function()
+
+
+class _Handle:
+    def __init__(self, function):
+        self.function = function
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TestScheduler(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.frames = _Frames()
+        self.calls = []
+        self.scheduler = UpdateScheduler(lambda: self.calls.append(1), defer=self.frames.defer)
+
+    async def test_requests_coalesce_per_frame(self):
+        for _ in range(5):
+            self.scheduler.request()
+        self.assertEqual(self.calls, [])
+        self.assertEqual(len(self.frames.scheduled), 1)
+        self.frames.tick()
+        self.assertEqual(len(self.calls), 1)
+
+        self.frames.tick()
+        self.assertEqual(len(self.calls), 1)
+        self.scheduler.request()
+        self.frames.tick()
+        self.assertEqual(len(self.calls), 2)
+
+    async def test_flush(self):
+        self.scheduler.request()
+        self.scheduler.flush()
+        self.assertEqual(len(self.calls), 1)
+        self.assertFalse(self.scheduler.pending)
+        # The deferred run was cancelled, and flushing with nothing pending does nothing
+        self.frames.tick()
+        self.scheduler.flush()
+        self.assertEqual(len(self.calls), 1)
+
+    async def test_shutdown_drops_pending_update(self):
+        self.scheduler.request()
+        self.scheduler.shutdown()
+        self.frames.tick()
+        self.assertEqual(self.calls, [])
@@ -0,0 +1,42 @@
+import math
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import data, engine, sites
+from ui_for_ov.climate import ClimateStore
+
+
+class TestSites(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.scenario = engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", fws_air_temp=15, fws_liquid_temp=35)
+
+    async def test_matches_scalar_engine(self):
+        results = sites.sweep_sites(self.scenario, workers=1, chunk_size=7)
+        chillers = data.load_chiller_table()
+        climate = data.load_climate_store()
+        self.assertEqual(len(results["city"]), len(climate))
+        for i, city in enumerate(results["city"]):
+            expected = engine.evaluate(self.scenario._replace(city=city), chillers, climate)
+            self.assertEqual(results["dry_cooler"][i], expected["liquid_cooling_option1"] == "Dry Cooler", city)
+            self.assertEqual(results["cooling_tower"][i], expected["liquid_cooling_option2"] == "Closed Loop Cooling Tower", city)
+            for name in ("chilled_water_temperature_rise", "chilled_water_flow_rate_per_pod"):
+                if expected[name] is None:
+                    self.assertTrue(np.isnan(results[name][i]), name)
+                else:
+                    self.assertTrue(math.isclose(results[name][i], expected[name], rel_tol=1e-9), name)
+
+    async def test_process_pool_keeps_station_order(self):
+        serial = sites.sweep_sites(self.scenario, workers=1)
+        pooled = sites.sweep_sites(self.scenario, workers=2, chunk_size=5)
+        self.assertEqual(pooled["city"], serial["city"])
+        for name in sites.SITE_FIELDS:
+            np.testing.assert_array_equal(pooled[name], serial[name])
+
+    async def test_stations_sharing_a_name(self):
+        climate = ClimateStore(
+            [1, 1], ["USA", "USA"], ["IL", "MO"], ["SPRINGFIELD", "SPRINGFIELD"], [20, 49], [15, 30], [10, 25], [5, 20]
+        )
+        results = sites.evaluate_stations(self.scenario, data.load_chiller_table(), climate, (0, 2))
+        np.testing.assert_array_equal(results["dry_bulb"], [20, 49])
+        np.testing.assert_array_equal(results["dry_cooler"], [True, False])
@@ -0,0 +1,69 @@
+import os
+import tempfile
+from pathlib import Path
+
+import omni.kit.test
+
+from ui_for_ov import data, snapshot
+
+
+class TestSnapshot(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = Path(self._directory.name)
+        self.source = self.directory / "table.csv"
+        self.source.write_text("a,b\n1,x\n,y\n3,x\n")
+        self.reads = 0
+
+    async def tearDown(self):
+        self._directory.cleanup()
+
+    def _reader(self, source):
+        self.reads += 1
+        return {"a": [1.0, None, 3.0]}, {"b": ["x", "y", "x"]}
+
+    async def test_round_trip(self):
+        table = snapshot.load(self.source, self._reader, self.directory)
+        self.assertEqual(len(table), 3)
+        values = table.numeric("a")
+        self.assertTrue(values.readonly)
+        self.assertEqual((values[0], values[2]), (1.0, 3.0))
+        self.assertNotEqual(values[1], values[1])  # NaN
+        labels, codes = table.categorical("b")
+        self.assertEqual(labels, ["x", "y"])
+        self.assertEqual(list(codes), [0, 1, 0])
+        self.assertEqual(table.strings("b"), ["x", "y", "x"])
+
+    async def test_compiled_once_and_revalidated(self):
+        snapshot.load(self.source, self._reader, self.directory)
+        snapshot.load(self.source, self._reader, self.directory)
+        self.assertEqual(self.reads, 1)
+
+        # Same content with a new mtime is still valid; new content is recompiled
+        os.utime(self.source, ns=(0, 0))
+        snapshot.load(self.source, self._reader, self.directory)
+        self.assertEqual(self.reads, 1)
+        self.source.write_text("a,b\n2,x\n,y\n3,x\n")
+        snapshot.load(self.source, self._reader, self.directory)
+        self.assertEqual(self.reads, 2)
+
+    async def test_rejects_other_versions_and_corrupt_files(self):
+        path = snapshot.snapshot_path(self.source, self.directory)
+        snapshot.load(self.source, self._reader, self.directory)
+        blob = path.read_bytes()
+        path.write_bytes(blob[:8] + (snapshot.VERSION + 1).to_bytes(4, "little") + blob[12:])
+        self.assertIsNone(snapshot.read(path, self.source))
+        path.write_bytes(blob[:40])
+        self.assertIsNone(snapshot.read(path, self.source))
+
+    async def test_loaders_match_csv(self):
+        chillers = data.load_chiller_table(cache_dir=self.directory)
+        from_csv = data.ChillerTable.from_rows(data.read_chillers())
+        self.assertEqual(len(chillers), len(from_csv))
+        self.assertEqual(chillers.lookup("Vertiv 1MW", 10.0, 30.0), from_csv.lookup("Vertiv 1MW", 10.0, 30.0))
+
+        climate = data.load_climate_store(cache_dir=self.directory)
+        from_csv = data.ClimateStore.from_rows(data.read_climate())
+        self.assertEqual(climate.cities, from_csv.cities)
+        for city in climate.cities:
+            self.assertEqual(climate.get(city), from_csv.get(city))
@@ -0,0 +1,52 @@
+import omni.kit.test
+
+from ui_for_ov import data
+from ui_for_ov.climate import ClimateStore
+from ui_for_ov.stations import StationIndex, tokens
+
+
+class TestStationIndex(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.store = data.load_climate_store()
+        self.index = StationIndex(self.store)
+
+    def _cities(self, query):
+        return [self.store.record(row).city for row in self.index.search(query)]
+
+    async def test_tokens(self):
+        self.assertEqual(tokens(" Chicago o'Hare, IL "), ["CHICAGO", "O", "HARE", "IL"])
+        self.assertEqual(tokens(None), [])
+
+    async def test_empty_query_lists_every_station_by_city(self):
+        self.assertEqual(self._cities(""), self.store.cities)
+        self.assertEqual(self._cities("  ,"), self.store.cities)
+        self.assertFalse(self.index.ready)
+
+    async def test_word_prefixes_and_infixes(self):
+        self.assertEqual(self._cities("dal lov"), ["DALLAS LOVE FIELD"])
+        self.assertEqual(self._cities("hare"), ["CHICAGO O'HARE"])
+        self.assertEqual(self._cities("o hare"), ["CHICAGO O'HARE"])
+        self.assertTrue(self.index.ready)
+        self.assertEqual(self._cities("atlantis"), [])
+
+    async def test_state_and_country(self):
+        texas = self._cities("tx")
+        self.assertIn("DALLAS LOVE FIELD", texas)
+        self.assertTrue(all(self.store.get(city).state == "TX" for city in texas))
+        self.assertEqual(self._cities("irl"), ["DUBLIN AP"])
+
+    async def test_city_matches_rank_first(self):
+        store = ClimateStore(
+            [1, 1, 1, 1], ["USA", "USA", "USA", "USA"], ["NY", "CA", "CA", "WY"],
+            ["ALBANY", "SAN JOSE", "BAKERSFIELD", "CASPER"], [1, 2, 3, 4], [1, 2, 3, 4], [0, 0, 0, 0], [0, 0, 0, 0],
+        )
+        index = StationIndex(store)
+        self.assertEqual([store.record(row).city for row in index.search("ca")], ["CASPER", "BAKERSFIELD", "SAN JOSE"])
+        self.assertEqual(len(index.search("usa")), 4)
+        self.assertEqual([store.record(row).city for row in index.search("san")], ["SAN JOSE"])
+        self.assertEqual(index.label(store.row_of("ALBANY")), "ALBANY, NY, USA")
+
+    async def test_selection_resolves_to_climate_record(self):
+        row = self.index.search("dublin")[0]
+        self.assertEqual(self.index.record(row), self.store.get("DUBLIN AP"))
+        self.assertEqual(self.index.label(row), "DUBLIN AP, IRL")
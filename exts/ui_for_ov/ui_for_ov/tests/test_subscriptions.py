@@ -0,0 +1,40 @@
+import omni.kit.test
+
+from ui_for_ov.subscriptions import Subscriptions
+
+
+class _Model:
+    def __init__(self):
+        self.callbacks = {}
+
+    def add_value_changed_fn(self, fn):
+        self.callbacks[len(self.callbacks)] = fn
+        return len(self.callbacks) - 1
+
+    def remove_value_changed_fn(self, subscription_id):
+        del self.callbacks[subscription_id]
+
+
+class TestSubscriptions(omni.kit.test.AsyncTestCase):
+    async def test_clear_removes_callbacks_in_reverse_order(self):
+        subscriptions = Subscriptions()
+        model = _Model()
+        steps = []
+        subscriptions.value_changed(model, print)
+        subscriptions.add(lambda: steps.append("first"))
+        subscriptions.add(lambda: steps.append("second"))
+        self.assertEqual(len(subscriptions), 3)
+        self.assertEqual(len(model.callbacks), 1)
+        subscriptions.clear()
+        self.assertEqual(model.callbacks, {})
+        self.assertEqual(steps, ["second", "first"])
+        self.assertEqual(len(subscriptions), 0)
+
+    async def test_failing_teardown_does_not_stop_clear(self):
+        subscriptions = Subscriptions()
+        steps = []
+        subscriptions.add(lambda: steps.append("done"))
+        subscriptions.add(lambda: 1 / 0)
+        with self.assertLogs("ui_for_ov.subscriptions", "WARNING"):
+            subscriptions.clear()
+        self.assertEqual(steps, ["done"])
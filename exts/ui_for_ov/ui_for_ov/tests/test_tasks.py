@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+import omni.kit.test
+
+from ui_for_ov import data, engine, sites
+from ui_for_ov.tasks import CANCELLED, DONE, FAILED, TaskRunner
+
+
+class TestTaskRunner(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self.changes = []
+        self.runner = TaskRunner(workers=2, on_change=lambda task: self.changes.append((task.state, task.completed)))
+
+    async def tearDown(self):
+        self.runner.shutdown()
+
+    async def test_map_keeps_item_order(self):
+        done = []
+        main_thread = threading.get_ident()
+        task = self.runner.map(
+            "squares", lambda x: x * x, range(10), combine=sum,
+            on_done=lambda task: done.append(threading.get_ident()),
+        )
+        await task.wait()
+        self.assertEqual(task.state, DONE)
+        self.assertEqual(task.result, sum(x * x for x in range(10)))
+        self.assertEqual(task.progress, 1.0)
+        # Progress and completion are reported on the loop's thread
+        self.assertEqual(done, [main_thread])
+        self.assertEqual(self.changes[0], ("running", 0))
+        self.assertEqual(self.changes[-1], (DONE, 10))
+        self.assertFalse(self.runner.busy)
+
+    async def test_cancel_stops_between_items(self):
+        release = threading.Event()
+        started = []
+
+        def work(item):
+            started.append(item)
+            release.wait(5)
+            return item
+
+        task = self.runner.map("slow", work, range(100))
+        while len(started) < 2:
+            await asyncio.sleep(0.001)
+        task.cancel()
+        release.set()
+        await task.wait()
+        self.assertEqual(task.state, CANCELLED)
+        self.assertIsNone(task.result)
+        # Only the items in flight when it was cancelled had started
+        self.assertLessEqual(len(started), 4)
+
+    async def test_cancel_before_start(self):
+        done = []
+        task = self.runner.map("never", lambda x: x, range(3), on_done=done.append)
+        task.cancel()
+        await task.wait()
+        self.assertEqual(task.state, CANCELLED)
+        self.assertEqual(done, [task])
+
+    async def test_run_reports_progress(self):
+        def work(task, count):
+            for index in range(count):
+                if task.cancel_requested:
+                    return None
+                task.report(index + 1, count, f"step {index + 1}")
+            return "finished"
+
+        task = self.runner.run("steps", work, 5)
+        await task.wait()
+        # Let the reports posted from the worker thread arrive
+        await asyncio.sleep(0.01)
+        self.assertEqual(task.result, "finished")
+        self.assertEqual(task.message, "step 5")
+        self.assertIn((DONE, 5), self.changes)
+
+    async def test_failure(self):
+        task = self.runner.map("broken", lambda x: 1 / x, [1, 0, 2])
+        await task.wait()
+        self.assertEqual(task.state, FAILED)
+        self.assertIsInstance(task.error, ZeroDivisionError)
+
+    async def test_site_sweep_in_background(self):
+        chillers = data.load_chiller_table()
+        climate = data.load_climate_store()
+        scenario = engine.Scenario(pod_type="576 GPU DGX GB200 Super Pod", fws_air_temp=15, fws_liquid_temp=35)
+        task = self.runner.map(
+            "Site Sweep",
+            lambda chunk: sites.evaluate_stations(scenario, chillers, climate, chunk),
+            sites.station_chunks(len(climate), 10),
+            combine=lambda parts: sites.collect(climate, parts),
+        )
+        await task.wait()
+        expected = sites.sweep_sites(scenario, workers=1)
+        self.assertEqual(task.result["city"], expected["city"])
+        self.assertEqual(task.result["dry_cooler"].tolist(), expected["dry_cooler"].tolist())
@@ -0,0 +1,100 @@
+import os
+import tempfile
+
+import numpy as np
+import omni.kit.test
+
+from ui_for_ov import annual, data, engine, weather
+
+
+def _year(offset):
+    hours = np.arange(weather.HOURS_PER_YEAR)
+    return (12 + offset + 10 * np.sin(2 * np.pi * hours / 8760) + 5 * np.sin(2 * np.pi * hours / 24)).astype(np.float32)
+
+
+class TestWeatherStore(omni.kit.test.AsyncTestCase):
+    async def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self.directory = self._directory.name
+        self.path = os.path.join(self.directory, "weather.wthr")
+        self.stations = ["TOKYO", "DUBLIN AP", "DALLAS LOVE FIELD", "NOWHERE"]
+        with weather.WeatherWriter(self.path, self.stations) as writer:
+            for index, station in enumerate(self.stations[:3]):
+                writer.write(station, dry_bulb=_year(index), wet_bulb=_year(index) - 4)
+
+    async def tearDown(self):
+        self._directory.cleanup()
+
+    async def test_station_is_zero_copy_view(self):
+        store = weather.WeatherStore(self.path)
+        self.assertEqual(len(store), 4)
+        series = store.station("DUBLIN AP")
+        np.testing.assert_array_equal(series["dry_bulb"], _year(1))
+        np.testing.assert_array_equal(store.series("DALLAS LOVE FIELD", "wet_bulb"), _year(2) - 4)
+        self.assertFalse(series["dry_bulb"].flags.owndata)
+        self.assertFalse(series["dry_bulb"].flags.writeable)
+        self.assertTrue(series["dry_bulb"].flags.c_contiguous)
+        # Never written: NaN
+        self.assertTrue(np.isnan(store.series("NOWHERE", "dry_bulb")).all())
+        with self.assertRaises(KeyError):
+            store.station("ATLANTIS")
+
+    async def test_iter_chunks_covers_store_in_order(self):
+        store = weather.WeatherStore(self.path)
+        names = []
+        for stations, series in store.iter_chunks(stations_per_chunk=3, variables=["dry_bulb"]):
+            self.assertEqual(list(series), ["dry_bulb"])
+            self.assertEqual(series["dry_bulb"].shape, (len(stations), weather.HOURS_PER_YEAR))
+            names.extend(stations)
+        self.assertEqual(names, self.stations)
+
+    async def test_climate_rows(self):
+        store = weather.WeatherStore(self.path)
+        climate = data.load_climate_store()
+        rows = store.climate_rows(climate)
+        self.assertEqual(rows[-1], -1)
+        self.assertEqual(climate.record(rows[0]).city, "TOKYO")
+
+    async def test_compile_csv_files(self):
+        paths = []
+        for index, station in enumerate(["TOKYO", "DUBLIN AP"]):
+            path = os.path.join(self.directory, f"{index}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("Hour,Dry Bulb Temperature,Wet Bulb Temperature\n")
+                for hour, (dry_bulb, wet_bulb) in enumerate(zip(range(24), range(24))):
+                    f.write(f"{hour},{dry_bulb + index},{'' if hour == 5 else wet_bulb}\n")
+            paths.append(path)
+        names = {path: station for path, station in zip(paths, ["TOKYO", "DUBLIN AP"])}
+        output = os.path.join(self.directory, "compiled.wthr")
+        self.assertEqual(weather.compile_csv_files(paths, output, station_of=lambda p: names[str(p)], hours=24), 2)
+        store = weather.WeatherStore(output)
+        self.assertEqual(store.stations, ["TOKYO", "DUBLIN AP"])
+        self.assertEqual(store.series("DUBLIN AP", "dry_bulb")[3], 4)
+        self.assertTrue(np.isnan(store.series("TOKYO", "wet_bulb")[5]))
+
+    async def test_invalid_writes_and_files(self):
+        with self.assertRaises(ValueError):
+            weather.WeatherWriter(os.path.join(self.directory, "dup.wthr"), ["A", "A"])
+        path = os.path.join(self.directory, "bad.wthr")
+        with self.assertRaises(ValueError):
+            with weather.WeatherWriter(path, ["A"]) as writer:
+                writer.write("A", dry_bulb=np.zeros(10))
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(self.directory), ["weather.wthr"])
+        with open(path, "wb") as f:
+            f.write(b"not a weather store")
+        with self.assertRaises(ValueError):
+            weather.WeatherStore(path)
+
+    async def test_simulate_store(self):
+        store = weather.WeatherStore(self.path)
+        chillers = data.load_chiller_table()
+        scenario = engine.Scenario(
+            pod_type="576 GPU DGX GB200 Super Pod", num_pods=2, fws_air_temp=12, fws_liquid_temp=30
+        )
+        stations, results = annual.simulate_store(scenario, store, chillers, stations_per_chunk=2)
+        self.assertEqual(stations, self.stations)
+        expected = annual.simulate(scenario, _year(1), _year(1) - 4, chillers)
+        self.assertAlmostEqual(results["total_kwh"][1], float(expected["total_kwh"]), places=3)
+        ranking = annual.rank_store(scenario, store, chillers)
+        self.assertEqual([name for name, _, _ in ranking][:3], ["TOKYO", "DUBLIN AP", "DALLAS LOVE FIELD"])
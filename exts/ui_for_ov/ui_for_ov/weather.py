@@ -0,0 +1,269 @@
+"""Memory-mapped store of hourly weather series for many stations.
+
+Annual simulations (:mod:`ui_for_ov.annual`) need a year of hourly data per station; parsing one CSV per
+station on every run does not scale to thousands of stations. A weather store holds every station's
+series in one fixed-width binary file, compiled once (:class:`WeatherWriter`, :func:`compile_csv_files`)
+and then mapped read-only by :class:`WeatherStore`:
+
+* each variable is one contiguous float32 ``(stations, hours)`` array, so one station's year is a
+  zero-copy row slice and a scan over all stations reads the file front to back;
+* the header lists the station names, which use the Station Name of ``TCO_new.csv``, so stations
+  can be matched with :class:`ui_for_ov.climate.ClimateStore` rows (:meth:`WeatherStore.climate_rows`).
+
+File layout::
+
+    b"UIOVWTHR" | uint32 version | uint32 header length | JSON header | padding | variable arrays
+
+Each array starts on a 64-byte boundary; its offset is recorded in the header. Missing hours are NaN.
+"""
+import csv
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"UIOVWTHR"
+VERSION = 1
+HOURS_PER_YEAR = 8760
+VARIABLES = ("dry_bulb", "wet_bulb")
+DTYPE = np.dtype("<f4")
+_PREFIX = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+# Hourly CSV header -> variable; canonical names are accepted as they are
+CSV_COLUMNS = {
+    "Dry Bulb Temperature": "dry_bulb",
+    "Wet Bulb Temperature": "wet_bulb",
+    "Dew point": "dew_point",
+}
+
+
+class WeatherWriter:
+    """Write a weather store of known stations, one station at a time.
+
+    The file is allocated at its full size up front, every hour NaN, and filled in place, so compiling
+    thousands of stations never holds more than one station's series in memory.
+
+    Args:
+        path: Store file; written to a temporary file and moved into place on :meth:`close`.
+        stations: Station names, in store order. Must be unique.
+        variables: Variables stored per station.
+        hours: Hours per series.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, path, stations, variables=VARIABLES, hours=HOURS_PER_YEAR):
+        self.path = Path(path)
+        self.stations = list(stations)
+        self.variables = tuple(variables)
+        self.hours = hours
+        self._row_of_station = {station: row for row, station in enumerate(self.stations)}
+        if len(self._row_of_station) != len(self.stations):
+            raise ValueError("Station names of a weather store must be unique")
+
+        header, data_offset, offsets = _layout(self.stations, self.variables, hours)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(self._temporary, "wb") as f:
+            f.write(header)
+            f.truncate(data_offset + offsets[-1])
+        self._arrays = {}
+        for variable, offset in zip(self.variables, offsets):
+            if not self.stations:
+                # Nothing to map in an empty store
+                self._arrays[variable] = np.empty((0, hours), DTYPE)
+                continue
+            array = np.memmap(
+                self._temporary, dtype=DTYPE, mode="r+", offset=data_offset + offset,
+                shape=(len(self.stations), hours),
+            )
+            array[:] = np.nan
+            self._arrays[variable] = array
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc_info):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, station, **series):
+        """Store the series of one station, given as ``variable=values`` (``hours`` values each)."""
+        row = self._row_of_station.get(station)
+        if row is None:
+            raise KeyError(f"Unknown station '{station}'")
+        for variable, values in series.items():
+            if variable not in self._arrays:
+                raise KeyError(f"Unknown variable '{variable}', expected one of {self.variables}")
+            values = np.asarray(values, dtype=DTYPE)
+            if values.shape != (self.hours,):
+                raise ValueError(f"Expected {self.hours} hourly values for {station} {variable}, got {values.shape}")
+            self._arrays[variable][row] = values
+
+    def close(self):
+        if self._arrays is None:
+            return
+        for array in self._arrays.values():
+            array.flush()
+        self._arrays = None
+        os.replace(self._temporary, self.path)
+
+    def abort(self):
+        """Discard the partially written store."""
+        self._arrays = None
+        try:
+            os.remove(self._temporary)
+        except OSError:
+            pass
+
+
+class WeatherStore:
+    """Hourly weather series of many stations, mapped read-only from a store file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, header_length = _PREFIX.unpack_from(self._mapping)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path} is not a version {VERSION} weather store")
+            header = json.loads(bytes(self._mapping[_PREFIX.size:_PREFIX.size + header_length]).decode("utf-8"))
+        except (struct.error, UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise ValueError(f"{self.path} is not a weather store: {e}") from None
+        if header.get("dtype") != DTYPE.str:
+            raise ValueError(f"{self.path} stores {header.get('dtype')}, expected {DTYPE.str}")
+        self.stations = header["stations"]
+        self.hours = header["hours"]
+        self._row_of_station = {station: row for row, station in enumerate(self.stations)}
+        data_offset = _padded(_PREFIX.size + header_length)
+        shape = (len(self.stations), self.hours)
+        self._arrays = {}
+        for variable, offset in header["variables"].items():
+            end = data_offset + offset + DTYPE.itemsize * shape[0] * shape[1]
+            if end > len(self._mapping):
+                raise ValueError(f"{self.path} is truncated")
+            self._arrays[variable] = np.ndarray(shape, DTYPE, self._mapping, data_offset + offset)
+
+    def __len__(self):
+        return len(self.stations)
+
+    def __contains__(self, station):
+        return station in self._row_of_station
+
+    @property
+    def variables(self):
+        return tuple(self._arrays)
+
+    def row_of(self, station):
+        """Row of a station, or None."""
+        return self._row_of_station.get(station)
+
+    def array(self, variable):
+        """The whole ``(stations, hours)`` array of a variable, a read-only view of the mapping."""
+        return self._arrays[variable]
+
+    def station(self, station):
+        """One station's series: dict of variable -> zero-copy ``(hours,)`` view. KeyError if unknown."""
+        row = self._row_of_station[station]
+        return {variable: array[row] for variable, array in self._arrays.items()}
+
+    def series(self, station, variable):
+        """One station's series of one variable, a zero-copy view."""
+        return self._arrays[variable][self._row_of_station[station]]
+
+    def iter_chunks(self, stations_per_chunk=256, variables=None):
+        """Scan all stations in store order.
+
+        Yields:
+            ``(stations, {variable: (stations in chunk, hours) view})``. Each chunk is a contiguous
+            slice of the mapping, so the scan streams through the file; only the pages touched are
+            read, and the OS can drop them again once the chunk is done with.
+        """
+        variables = tuple(variables or self._arrays)
+        if hasattr(self._mapping, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mapping.madvise(mmap.MADV_SEQUENTIAL)
+        for start in range(0, len(self.stations), stations_per_chunk):
+            stop = start + stations_per_chunk
+            yield self.stations[start:stop], {variable: self._arrays[variable][start:stop] for variable in variables}
+
+    def climate_rows(self, climate):
+        """Row in a :class:`ui_for_ov.climate.ClimateStore` of every station, -1 for stations it lacks."""
+        return climate.rows_of(self.stations)
+
+    def close(self):
+        # Views still referencing the mapping keep it open until they are released
+        self._arrays = {}
+        try:
+            self._mapping.close()
+        except BufferError:
+            pass
+
+
+def read_hourly_csv(path):
+    """Read one station's hourly CSV: dict of variable -> float array, one value per data row.
+
+    Columns are matched by the ``TCO_new.csv`` style headers of :data:`CSV_COLUMNS` or by variable
+    name; other columns are ignored and blank cells are NaN.
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        header = [CSV_COLUMNS.get(name.strip(), name.strip()) for name in next(reader, [])]
+        rows = [record for record in reader if any(value.strip() for value in record)]
+    series = {}
+    for index, name in enumerate(header):
+        if name in CSV_COLUMNS.values() or name in VARIABLES:
+            series[name] = np.array(
+                [float(record[index]) if index < len(record) and record[index].strip() else np.nan for record in rows]
+            )
+    return series
+
+
+def compile_csv_files(paths, output, station_of=None, variables=VARIABLES, hours=HOURS_PER_YEAR):
+    """Compile one hourly CSV per station into a weather store.
+
+    Args:
+        paths: Hourly CSV files, see :func:`read_hourly_csv`.
+        output: Store file to write.
+        station_of: Called with a CSV path to get its station name (the ``TCO_new.csv`` Station Name);
+            defaults to the file stem.
+        variables: Variables to store; a CSV without one of them leaves it NaN.
+        hours: Hours per series; every CSV must have this many rows.
+
+    Returns:
+        Number of stations written.
+    """
+    paths = [Path(path) for path in paths]
+    station_of = station_of or (lambda path: path.stem)
+    stations = [station_of(path) for path in paths]
+    with WeatherWriter(output, stations, variables, hours) as writer:
+        for station, path in zip(stations, paths):
+            series = read_hourly_csv(path)
+            writer.write(station, **{variable: series[variable] for variable in variables if variable in series})
+    return len(stations)
+
+
+def _layout(stations, variables, hours):
+    # Header bytes, offset of the data section, and the offset of every variable array plus the end
+    nbytes = _padded(DTYPE.itemsize * len(stations) * hours)
+    offsets = [index * nbytes for index in range(len(variables) + 1)]
+    header = json.dumps({
+        "version": VERSION,
+        "dtype": DTYPE.str,
+        "hours": hours,
+        "stations": stations,
+        "variables": dict(zip(variables, offsets)),
+    }).encode("utf-8")
+    prefix = _PREFIX.pack(MAGIC, VERSION, len(header)) + header
+    data_offset = _padded(len(prefix))
+    return prefix + b"\0" * (data_offset - len(prefix)), data_offset, offsets
+
+
+def _padded(size):
+    return (size + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT